@@ -0,0 +1,66 @@
+import argparse
+import time
+import pandas as pd
+from ..kalshi.models import Candlestick
+from ..utils import pydantic_model_to_dataframe, unwrap_candlesticks, to_ta_data, unwrap_candlesticks_frame, to_ta_frame
+from .payloads import make_candlesticks
+
+'''
+Per-bar vs batch candlestick conversion.
+
+    python -m src.benchmarks.candlestick --sizes 10000 100000 1000000
+
+Both paths start from already-validated Candlestick models (what MarketCandlestickResponse holds),
+and every run asserts the batch output equals the per-bar output before timing is reported.
+'''
+
+PERIOD_INTERVAL = 1
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def per_bar(candles: list[Candlestick]) -> pd.DataFrame:
+    unwrapped = unwrap_candlesticks(candles)
+    return pydantic_model_to_dataframe(to_ta_data(unwrapped, PERIOD_INTERVAL))
+
+
+def batch(candles: list[Candlestick]) -> pd.DataFrame:
+    return to_ta_frame(candles, PERIOD_INTERVAL)
+
+
+def run(sizes: list[int], skip_per_bar_above: int) -> list[dict]:
+
+    rows = []
+
+    for n in sizes:
+        candles = [Candlestick(**c) for c in make_candlesticks(n)]
+
+        fast, fast_s = _timed(batch, candles)
+        unwrapped, unwrap_s = _timed(unwrap_candlesticks_frame, candles)
+
+        row = {"bars": n, "batch_s": fast_s, "unwrap_frame_s": unwrap_s, "per_bar_s": None, "speedup": None}
+
+        if n <= skip_per_bar_above:
+            slow, slow_s = _timed(per_bar, candles)
+            pd.testing.assert_frame_equal(slow, fast, check_exact=True)
+            pd.testing.assert_frame_equal(pydantic_model_to_dataframe(unwrap_candlesticks(candles)), unwrapped, check_exact=True)
+            row.update(per_bar_s=slow_s, speedup=slow_s / fast_s)
+
+        rows.append(row)
+        print(row)
+
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Per-bar vs batch candlestick conversion")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--skip-per-bar-above", type=int, default=1_000_000,
+                        help="Only time (and verify against) the per-bar path up to this many bars")
+    args = parser.parse_args()
+
+    run(args.sizes, args.skip_per_bar_above)
@@ -0,0 +1,135 @@
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+from ..kalshi import KalshiClient, HttpTransport
+from ..polymarket import PolymarketClient
+from ..venues import VenueTable, match_markets
+from .mock_server import MockKalshiServer
+from .mock_polymarket import MockPolymarketServer
+from .fixtures import RecordingTransport, FixtureServer, load_fixtures
+
+'''
+Cross-venue pipeline against local servers: pull both venues, normalize, match, price the gaps.
+
+    python -m src.benchmarks.cross_venue --series 40 --latency 0.01
+
+    pull        KalshiClient.get_market_table + PolymarketClient.get_market_table over HTTP
+    normalize   VenueTable.from_kalshi (the Polymarket side is built while pulling)
+    match       match_markets: inverted index + close-time filter + Jaccard, one-to-one
+    gaps        MarketMatches.gaps on the matched snapshots (what a live loop re-runs on every refresh)
+    histories   Yes-token price histories of the matched Polymarket markets as Data-shaped frames
+
+The first pass runs against MockKalshiServer / MockPolymarketServer through RecordingTransports; the second
+replays the recordings from two FixtureServers and must produce exactly the same pairs and gaps, with no
+request missing from the recording. Match recall / precision are measured against the twins the mock universe planted.
+'''
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def pipeline(kalshi: KalshiClient, polymarket: PolymarketClient, histories: int) -> tuple[dict, dict]:
+    '''(timings, outputs) of one full pass'''
+
+    timings = {}
+
+    (kalshi_table, polymarket_table), timings["pull_s"] = _timed(
+        lambda: (kalshi.get_market_table(status=None), polymarket.get_market_table()))
+
+    kalshi_venue, timings["normalize_s"] = _timed(VenueTable.from_kalshi, kalshi_table)
+    matches, timings["match_s"] = _timed(match_markets, kalshi_venue, polymarket_table)
+    gaps, timings["gaps_s"] = _timed(matches.gaps)
+
+    tokens = polymarket_table["token_id"][polymarket_table.rows(matches.b_ids[:histories])].tolist()
+    frames, timings["histories_s"] = _timed(polymarket.get_price_histories, tokens, fidelity=60, interval="1w", as_frame=True)
+
+    return timings, {"kalshi": kalshi_venue, "polymarket": polymarket_table, "matches": matches, "gaps": gaps, "frames": frames}
+
+
+def _accuracy(matches, polymarket: VenueTable) -> tuple[float, float]:
+    '''(recall, precision) against the twins the mock universe planted (same event, same strike)'''
+
+    planted = {
+        (f"{question.split(' above ')[0]}-T{question.split(' above ')[1].split(' ')[0]}", market_id)
+        for market_id, question in zip(polymarket["market_id"], polymarket["title"]) if " above " in question
+    }
+    found = set(matches.pairs())
+    hits = len(planted & found)
+
+    return hits / len(planted) if planted else 1.0, hits / len(found) if found else 1.0
+
+
+def run(n_series: int, latency: float, histories: int) -> dict:
+
+    config = {"n_series": n_series, "events_per_series": 10, "markets_per_event": 8, "seed": 1}
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            MockKalshiServer(**config, latency=latency) as kalshi_server, \
+            MockPolymarketServer(**config, extra=n_series * 10, latency=latency) as polymarket_server:
+
+        kalshi_recorder = RecordingTransport(HttpTransport(base_url=kalshi_server.url))
+        gamma_recorder = RecordingTransport(HttpTransport(base_url=polymarket_server.url))
+        clob_recorder = RecordingTransport(HttpTransport(base_url=polymarket_server.url))
+
+        with KalshiClient("key", transport=kalshi_recorder) as kalshi, \
+                PolymarketClient(gamma_transport=gamma_recorder, clob_transport=clob_recorder) as polymarket:
+            live_timings, live = pipeline(kalshi, polymarket, histories)
+
+        paths = {}
+        for name, recorder in (("kalshi", kalshi_recorder), ("gamma", gamma_recorder), ("clob", clob_recorder)):
+            paths[name] = os.path.join(tmp, f"{name}.jsonl")
+            recorder.save(paths[name])
+            recorder.close()
+
+        with FixtureServer(load_fixtures(paths["kalshi"])) as kalshi_fixtures, \
+                FixtureServer(load_fixtures(paths["gamma"])) as gamma_fixtures, \
+                FixtureServer(load_fixtures(paths["clob"])) as clob_fixtures, \
+                KalshiClient("key", base_url=kalshi_fixtures.url) as kalshi, \
+                PolymarketClient(gamma_url=gamma_fixtures.url, clob_url=clob_fixtures.url) as polymarket:
+            replay_timings, replay = pipeline(kalshi, polymarket, histories)
+            missing = kalshi_fixtures.missing + gamma_fixtures.missing + clob_fixtures.missing
+
+    assert not missing, f"requests missing from the recording: {missing[:5]}"
+    assert live["matches"].pairs() == replay["matches"].pairs()
+
+    for name, values in live["gaps"].items():
+        other = replay["gaps"][name]
+        assert (np.array_equal(values, other, equal_nan=True) if values.dtype.kind == "f" else (values == other).all()), name
+
+    for a, b in zip(live["frames"], replay["frames"]):
+        assert a.equals(b)
+
+    edges = live["gaps"]["edge"]
+    recall, precision = _accuracy(live["matches"], live["polymarket"])
+    row = {
+        "kalshi_markets": len(live["kalshi"]),
+        "polymarket_markets": len(live["polymarket"]),
+        "pairs": len(live["matches"]),
+        "recall": recall,
+        "precision": precision,
+        "crossed": int(np.sum(edges > 0)),
+        "best_edge": float(np.nanmax(edges)) if len(edges) and not np.isnan(edges).all() else None,
+        "bars": sum(len(frame) for frame in live["frames"]),
+        "live": live_timings,
+        "replay": replay_timings,
+    }
+
+    print(row)
+
+    return row
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Kalshi <-> Polymarket matching and gaps against local mock and fixture servers")
+    parser.add_argument("--series", type=int, nargs="+", default=[10, 40])
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--histories", type=int, default=16, help="Price histories pulled per run")
+    args = parser.parse_args()
+
+    for n in args.series:
+        run(n, args.latency, args.histories)
@@ -0,0 +1,92 @@
+import argparse
+import json
+import time
+from ..kalshi.decode import DecodePolicy, STRICT, TRUSTED, build, build_json, loads, orjson
+from ..kalshi.models import MarketsResponse, EventResponse, MarketCandlestickResponse
+from .payloads import make_candlesticks, make_universe
+
+'''
+Response decoding: JSON backends and STRICT vs TRUSTED model building.
+
+    python -m src.benchmarks.decode --markets 1000 10000 --repeat 5
+
+For each payload (a /markets page, an event with nested markets, a candlestick response) times:
+
+    json             stdlib json.loads
+    orjson           decode.loads (orjson; skipped when it isn't installed)
+    strict / trusted build(model, dict)      - the dict path (cached / paged responses)
+    strict / trusted build_json(model, body) - the one-pass bytes -> model path (single-model endpoints)
+
+Every run asserts the TRUSTED models dump to the same dict as the STRICT ones before timing is reported.
+'''
+
+_STRICT = DecodePolicy(STRICT)
+_TRUSTED = DecodePolicy(TRUSTED)
+
+
+def _best(fn, repeat: int) -> float:
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def payloads(n_markets: int) -> dict:
+    '''name -> (model, encoded body) for a markets page of `n_markets`, a nested event and a candle response'''
+
+    universe = make_universe(n_series=max(1, n_markets // 100), events_per_series=10, markets_per_event=10)
+    markets = universe["markets"][:n_markets]
+
+    event = {**universe["events"][0], "markets": [m for m in markets if m["event_ticker"] == universe["events"][0]["event_ticker"]]}
+
+    return {
+        f"markets[{len(markets)}]": (MarketsResponse, json.dumps({"markets": markets, "cursor": "abc"}).encode()),
+        f"event[{len(event['markets'])}]": (EventResponse, json.dumps({"event": event, "markets": event["markets"]}).encode()),
+        "candles[5000]": (MarketCandlestickResponse, json.dumps({"ticker": markets[0]["ticker"], "candlesticks": make_candlesticks(5000)}).encode()),
+    }
+
+
+def run(sizes: list[int], repeat: int) -> list[dict]:
+
+    rows = []
+
+    for n in sizes:
+        for name, (model, body) in payloads(n).items():
+            data = loads(body)
+
+            assert build(model, data, _TRUSTED).model_dump() == build(model, data, _STRICT).model_dump()
+            assert build_json(model, body, _TRUSTED).model_dump() == build_json(model, body, _STRICT).model_dump()
+
+            row = {
+                "payload": name,
+                "kb": len(body) / 1024,
+                "json_s": _best(lambda: json.loads(body), repeat),
+                "orjson_s": _best(lambda: orjson.loads(body), repeat) if orjson is not None else None,
+                "strict_s": _best(lambda: build(model, data, _STRICT), repeat),
+                "trusted_s": _best(lambda: build(model, data, _TRUSTED), repeat),
+                "strict_json_s": _best(lambda: build_json(model, body, _STRICT), repeat),
+                "trusted_json_s": _best(lambda: build_json(model, body, _TRUSTED), repeat),
+            }
+
+            # What a response used to cost (json.loads + model(**data)) vs the one-pass path
+            row["speedup"] = (row["json_s"] + row["strict_s"]) / row["strict_json_s"]
+
+            rows.append(row)
+            print(f"  {name:<16} {row['kb']:8.0f} KB  json {row['json_s'] * 1e3:7.2f}  orjson {(row['orjson_s'] or 0) * 1e3:7.2f}  "
+                  f"strict {row['strict_s'] * 1e3:7.2f}  trusted {row['trusted_s'] * 1e3:7.2f}  "
+                  f"bytes strict {row['strict_json_s'] * 1e3:7.2f}  trusted {row['trusted_json_s'] * 1e3:7.2f} ms  x{row['speedup']:.2f}")
+
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="JSON backends and STRICT vs TRUSTED response decoding")
+    parser.add_argument("--markets", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.markets, args.repeat)
@@ -0,0 +1,113 @@
+import gzip
+import json
+import threading
+from urllib.parse import urlsplit
+from .mock_server import MockServer, _query
+
+'''
+Recorded-fixture servers: capture real (or mock) API traffic once, replay it locally byte-for-byte after
+
+    recorder = RecordingTransport(HttpTransport(base_url=BASE_URL))
+    KalshiClient(key, transport=recorder).get_market_table()
+    recorder.save("fixtures/kalshi.jsonl")
+
+    with FixtureServer(load_fixtures("fixtures/kalshi.jsonl")) as server:
+        client = KalshiClient(key, base_url=server.url)          # same calls -> same answers, no network
+
+Works for any client built on HttpTransport - KalshiClient, and PolymarketClient with one recorder per host
+(gamma_transport= / clob_transport=, one fixture file and one FixtureServer each).
+
+A fixture is a JSON line per successful GET: {"path": ..., "query": [[key, value], ...], "body": ...}, with the
+path relative to the transport's base URL and the query exactly as the server received it. FixtureServer answers
+an exact (path, query) match with the recorded body and anything else with a 404, listed in `missing`, so a
+client that starts asking for something new fails loudly instead of silently testing less. The MockServer knobs
+(latency, error_rate, ...) still apply, to replay real payloads under injected slowness and failures.
+'''
+
+
+def _key(path: str, query: tuple) -> tuple:
+    return "/" + path.strip("/"), query
+
+
+class RecordingTransport:
+    '''Wraps an HttpTransport; every successful GET is kept as a fixture entry'''
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.entries: list[dict] = []
+        self._base_path = urlsplit(transport.base_url).path.rstrip("/")
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return self.transport.base_url
+
+    @property
+    def timeout(self):
+        return self.transport.timeout
+
+    def get(self, path: str, params: dict | None = None, timeout=None, headers: dict | None = None):
+        response = self.transport.get(path, params=params, timeout=timeout, headers=headers)
+
+        if response.status_code < 400:
+            url = urlsplit(str(response.url))
+            entry = {"path": url.path[len(self._base_path):], "query": [list(pair) for pair in _query(url.query)],
+                     "body": response.content.decode()}
+
+            with self._lock:
+                self.entries.append(entry)
+
+        return response
+
+    def save(self, path: str):
+        '''Write the recorded entries (later duplicates of a request replace earlier ones) as JSON lines'''
+
+        unique = {_key(e["path"], tuple(map(tuple, e["query"]))): e for e in self.entries}
+
+        with open(path, "w") as f:
+            for entry in unique.values():
+                f.write(json.dumps(entry) + "\n")
+
+    def close(self):
+        self.transport.close()
+
+
+def load_fixtures(path: str) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class FixtureServer(MockServer):
+
+    def __init__(self, entries: list[dict], latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 throttle_share: float = 0.0, gzip: bool = True, seed: int = 0, host: str = "127.0.0.1", port: int = 0):
+
+        self.bodies = {_key(e["path"], tuple(map(tuple, e["query"]))): e["body"] for e in entries}
+        self.missing: list[tuple[str, tuple]] = []   # Requests with no recording, in arrival order
+
+        super().__init__(seed, latency, jitter, error_rate, throttle_share, gzip=gzip, host=host, port=port)
+
+    def route(self, path: str, query: dict[str, str]) -> tuple[str, str | None]:
+        '''(endpoint label, recorded body text or None)'''
+
+        key = _key(path, tuple(sorted(query.items())))
+        body = self.bodies.get(key)
+        endpoint = path.strip("/").split("/")[0]
+
+        if body is None:
+            with self._lock:
+                self.missing.append(key)
+            return endpoint, None
+
+        return endpoint, body
+
+    def _encode_uncached(self, path: str, query: tuple, compress: bool) -> tuple[str, bytes | None]:
+        # The recorded text goes out as-is, not re-serialized
+        endpoint, body = self.route(path, dict(query))
+
+        if body is None:
+            return endpoint, None
+
+        raw = body.encode()
+
+        return endpoint, gzip.compress(raw, compresslevel=1) if compress else raw
@@ -0,0 +1,156 @@
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from .results import save, load, git_commit
+
+'''
+Cold-start cost of importing the packages, each measured in a fresh interpreter with `python -X importtime`.
+
+    python -m src.benchmarks.import_time
+    python -m src.benchmarks.import_time --out results/imports.json --baseline results/imports_base.json
+
+Per target module: median / min cumulative import time over `repeat` fresh processes, the slowest top-level
+packages it pulled in, and which heavy packages (pandas, pandas_ta, plotext, ...) got loaded at all.
+`import src.kalshi` (and src.polymarket / src.venues) must not load any of the --forbid packages: the DataFrame / indicator / plotting stack
+is only meant to load when one of those features is used, and the run fails if it sneaks back in. Like the
+suite, the CLI also exits non-zero when a target got more than --threshold slower than the baseline.
+'''
+
+TARGETS = ("src.kalshi", "src.polymarket", "src.venues", "src.utils", "src.technical_analysis")
+HEAVY = ("numpy", "pandas", "pandas_ta", "plotext", "httpx", "websockets", "orjson")
+CLIENTS = ("src.kalshi", "src.polymarket", "src.venues")
+FORBIDDEN = {module: ("pandas", "pandas_ta", "plotext") for module in CLIENTS}
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# import time: <self us> | <cumulative us> | <indent><module>
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _import_once(module: str) -> list[tuple[int, int, int, str]]:
+    '''(self us, cumulative us, depth, name) for every module imported by `import module` in a fresh interpreter'''
+
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=ROOT, capture_output=True, text=True)
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+    rows = []
+
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            rows.append((int(match[1]), int(match[2]), len(match[3]) // 2, match[4]))
+
+    return rows
+
+
+def measure(module: str, repeat: int, top: int = 8) -> dict:
+    runs = []
+    rows = []
+
+    for _ in range(repeat):
+        rows = _import_once(module)
+        # The target's own line comes after everything it imported
+        total = next(cumulative for _, cumulative, depth, name in reversed(rows) if name == module and depth == 0)
+        runs.append(total / 1e6)
+
+    # Modules imported on the target's behalf: everything after interpreter start-up (site & co.)
+    start = max((i for i, (_, _, depth, name) in enumerate(rows) if depth == 0 and name != module and not name.startswith(module.split(".")[0])), default=-1) + 1
+    loaded = {name for _, _, _, name in rows[start:]}
+
+    # Where the time goes: self time summed per top-level package (numpy, requests, pydantic, src, ...)
+    packages = {}
+    for own, _, _, name in rows[start:]:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + own
+    slowest = sorted(((us, package) for package, us in packages.items()), reverse=True)[:top]
+
+    return {
+        "median_s": statistics.median(runs),
+        "min_s": min(runs),
+        "runs": repeat,
+        "modules": len(loaded),
+        "heavy": [name for name in HEAVY if name in loaded],
+        "slowest": [{"package": package, "self_s": us / 1e6} for us, package in slowest],
+    }
+
+
+def run(targets: tuple[str, ...], repeat: int) -> dict:
+    results = {}
+
+    for module in targets:
+        row = results[module] = measure(module, repeat)
+        print(f"  {module:<26} {row['median_s'] * 1e3:8.1f} ms  {row['modules']:4d} modules  heavy: {', '.join(row['heavy']) or '-'}")
+
+        for dep in row["slowest"]:
+            print(f"      {dep['package']:<22} {dep['self_s'] * 1e3:8.1f} ms")
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "commit": git_commit(),
+            "python": sys.version.split()[0],
+        },
+        "imports": results,
+    }
+
+
+def violations(results: dict, forbidden: dict[str, tuple[str, ...]]) -> list[str]:
+    return [f"import {module} loads {name}"
+            for module, names in forbidden.items() if module in results["imports"]
+            for name in names if name in results["imports"][module]["heavy"]]
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10) -> list[dict]:
+    rows = []
+
+    for module, now in current["imports"].items():
+        before = baseline.get("imports", {}).get(module)
+
+        if before is None or not before["median_s"]:
+            continue
+
+        ratio = now["median_s"] / before["median_s"]
+        verdict = "regressed" if ratio > 1 + threshold else "improved" if ratio < 1 - threshold else "same"
+        rows.append({"benchmark": f"import {module}", "baseline_s": before["median_s"], "current_s": now["median_s"], "ratio": ratio, "verdict": verdict})
+
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Cold-start import time of the kalshi / utils / technical_analysis packages")
+    parser.add_argument("--targets", nargs="+", default=list(TARGETS))
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--forbid", nargs="*", default=list(FORBIDDEN["src.kalshi"]),
+                        help="Packages the client packages must not load on import")
+    parser.add_argument("--out", default=None, help="Write results JSON here")
+    parser.add_argument("--baseline", default=None, help="Compare against a previous results JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown counted as a regression")
+    args = parser.parse_args()
+
+    results = run(tuple(args.targets), args.repeat)
+    failed = False
+
+    if args.out:
+        save(results, args.out)
+
+    for problem in violations(results, {module: tuple(args.forbid) for module in CLIENTS}):
+        print(f"FAIL: {problem}")
+        failed = True
+
+    if args.baseline:
+        rows = compare(load(args.baseline), results, args.threshold)
+        print("comparison")
+
+        for row in rows:
+            print(f"  {row['benchmark']:<34} {row['baseline_s'] * 1e3:8.1f} -> {row['current_s'] * 1e3:8.1f} ms  x{row['ratio']:.2f}  {row['verdict']}")
+
+        failed = failed or any(row["verdict"] == "regressed" for row in rows)
+
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,125 @@
+import threading
+import zlib
+from .mock_server import MockServer, _truthy
+from .payloads import make_universe, make_polymarket_universe, make_price_history
+
+'''
+Local stand-in for Polymarket's Gamma and CLOB APIs on one port, serving the Polymarket side of a seeded universe
+that overlaps MockKalshiServer's (same n_series / events_per_series / markets_per_event / seed -> same Kalshi markets,
+`share` of them with a Polymarket twin), so cross-venue matching has real pairs to find.
+
+    with MockKalshiServer(seed=1) as kalshi_server, MockPolymarketServer(seed=1) as polymarket_server:
+        kalshi = KalshiClient("key", base_url=kalshi_server.url)
+        polymarket = PolymarketClient(gamma_url=polymarket_server.url, clob_url=polymarket_server.url)
+
+Gamma: markets (limit / offset, active / closed / id filters), markets/{id}, events (nested markets), events/{id}.
+CLOB: prices-history (startTs / endTs or interval, fidelity), points deterministic per (token, first point).
+Same knobs as MockKalshiServer (latency, jitter, error_rate, max_page_size, gzip).
+'''
+
+MAX_HISTORY_POINTS = 20_000
+
+# interval -> seconds back from `now`
+_INTERVALS = {"1h": 3_600, "6h": 6 * 3_600, "1d": 86_400, "1w": 7 * 86_400, "1m": 30 * 86_400, "max": 90 * 86_400}
+
+
+class MockPolymarketServer(MockServer):
+
+    def __init__(self, n_series: int = 20, events_per_series: int = 10, markets_per_event: int = 8, seed: int = 0,
+                 share: float = 0.5, extra: int = 0, now: int = 1_700_000_000 + 90 * 86_400,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, throttle_share: float = 0.0,
+                 max_page_size: int = 500, gzip: bool = True, host: str = "127.0.0.1", port: int = 0):
+
+        kalshi = make_universe(n_series, events_per_series, markets_per_event, seed)
+        universe = make_polymarket_universe(kalshi["markets"], share, extra, seed)
+
+        self.now = now   # What interval= is relative to
+        self.events = universe["events"]
+        self.markets = universe["markets"]
+        self.markets_by_id = {m["id"]: m for m in self.markets}
+        self.events_by_id = {e["id"]: e for e in self.events}
+        self.tokens = {token: m for m in self.markets for token in (f"{m['id']}1", f"{m['id']}2")}
+
+        super().__init__(seed, latency, jitter, error_rate, throttle_share, max_page_size, gzip, host, port)
+
+    # --- ROUTING ---
+
+    def route(self, path: str, query: dict[str, str]) -> tuple[str, dict | list | None]:
+
+        parts = path.strip("/").split("/")
+
+        if parts == ["markets"]:
+            return "markets", self._list(self.markets, query)
+        if parts == ["events"]:
+            return "events", self._list(self.events, query)
+        if parts == ["prices-history"]:
+            return "prices-history", self._history(query)
+
+        if len(parts) == 2 and parts[0] == "markets":
+            return "market", self.markets_by_id.get(parts[1])
+        if len(parts) == 2 and parts[0] == "events":
+            return "event", self.events_by_id.get(parts[1])
+
+        return parts[0], None
+
+    def _list(self, records: list[dict], query: dict) -> list[dict]:
+        '''One limit / offset page of a Gamma list endpoint (a bare JSON list, like the live API)'''
+
+        if query.get("id"):
+            wanted = set(query["id"].split(","))
+            records = [r for r in records if r["id"] in wanted]
+
+        if "closed" in query:
+            closed = _truthy(query["closed"])
+            records = [r for r in records if r["closed"] == closed]
+
+        if "active" in query:
+            active = _truthy(query["active"])
+            records = [r for r in records if r["active"] == active]
+
+        limit = max(1, min(int(query.get("limit", 100)), self.max_page_size))
+        offset = int(query.get("offset", 0))
+
+        return records[offset:offset + limit]
+
+    def _history(self, query: dict) -> dict | None:
+        token = query["market"]
+
+        if token not in self.tokens:
+            return None
+
+        fidelity = int(query.get("fidelity", 1))
+        span = fidelity * 60
+
+        if "startTs" in query or "endTs" in query:
+            start_ts, end_ts = int(query.get("startTs", self.now - _INTERVALS["max"])), int(query.get("endTs", self.now))
+        else:
+            start_ts, end_ts = self.now - _INTERVALS[query.get("interval", "max")], self.now
+
+        first = -(-start_ts // span) * span
+        n = max(0, min(MAX_HISTORY_POINTS, (end_ts - first) // span + 1))
+
+        market = self.tokens[token]
+        start_price = (market["bestBid"] + market["bestAsk"]) / 2
+
+        return {"history": make_price_history(n, first, fidelity, seed=zlib.crc32(f"{token}:{first}".encode()), start_price=start_price)}
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve a synthetic Polymarket Gamma + CLOB API locally")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--series", type=int, default=20)
+    parser.add_argument("--events-per-series", type=int, default=10)
+    parser.add_argument("--markets-per-event", type=int, default=8)
+    parser.add_argument("--share", type=float, default=0.5)
+    parser.add_argument("--extra", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with MockPolymarketServer(args.series, args.events_per_series, args.markets_per_event, share=args.share, extra=args.extra,
+                              latency=args.latency, error_rate=args.error_rate, port=args.port) as server:
+        print(f"Serving {len(server.markets)} markets on {server.url}")
+        threading.Event().wait()
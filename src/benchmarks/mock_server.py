@@ -0,0 +1,391 @@
+import gzip
+import json
+import random
+import socket
+import threading
+import time
+import zlib
+from collections import Counter
+from functools import lru_cache
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from .payloads import make_universe, make_candlesticks, make_milestone
+
+'''
+Local stand-in for the Kalshi REST API, serving a seeded synthetic exchange (payloads.make_universe).
+
+    with MockKalshiServer(n_series=50, latency=0.02, error_rate=0.01) as server:
+        client = KalshiClient("key", base_url=server.url)
+
+Covers every endpoint KalshiClient / AsyncKalshiClient call - markets (filters + cursor), markets/{ticker},
+events (cursor, nested markets, milestones), events/{ticker}, series, series/{ticker}, both candlestick endpoints
+(with the real per-request caps and adjusted_end_ts) and search/tags_by_categories.
+
+Knobs:
+    latency / jitter: seconds added to every response (uniform in latency +- jitter)
+    error_rate: fraction of requests answered with a retryable 503 (or 429 + Retry-After, see throttle_share)
+    max_page_size: server-side cap on `limit`, like the live API's per-endpoint maximums
+    gzip: compress bodies when the client sends Accept-Encoding: gzip
+
+Bodies are encoded once per distinct request and cached, so the server's own cost stays out of client timings.
+Injected failures come from a seeded RNG: the same request sequence fails at the same places on every run.
+
+The HTTP half (server thread, knobs, stats, encoding) is MockServer; mock_polymarket.MockPolymarketServer and
+fixtures.FixtureServer are the same server with a different route().
+'''
+
+MAX_CANDLES_PER_REQUEST = 5000
+
+# Live API: open -> active markets
+_STATUS_FILTER = {"open": {"active"}, "closed": {"closed"}, "settled": {"settled"}, "unopened": {"initialized"}}
+
+
+def _truthy(value: str | None) -> bool:
+    return value is not None and value.lower() in ("true", "1")
+
+
+def _query(raw: str) -> tuple:
+    # Repeated params (Gamma's id=1&id=2) come through comma-joined, like the Kalshi list filters
+    return tuple(sorted((k, ",".join(v)) for k, v in parse_qs(raw).items()))
+
+
+class MockServer:
+    '''
+    The HTTP side shared by the local API stand-ins: threaded keep-alive server, latency / error injection,
+    per-endpoint stats and cached body encoding. Subclasses implement route(path, query).
+    '''
+
+    def __init__(self, seed: int = 0, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, throttle_share: float = 0.0,
+                 max_page_size: int = 1000, gzip: bool = True, host: str = "127.0.0.1", port: int = 0):
+
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_share = throttle_share   # Share of injected errors that are 429 instead of 503
+        self.max_page_size = max_page_size
+        self.gzip = gzip
+
+        self.requests = Counter()   # Endpoint -> requests served (including injected errors)
+        self.errors = Counter()     # Endpoint -> injected errors
+        self.bytes_sent = 0
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._encode = lru_cache(maxsize=4096)(self._encode_uncached)
+
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def reset_stats(self):
+        with self._lock:
+            self.requests.clear()
+            self.errors.clear()
+            self.bytes_sent = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"requests": dict(self.requests), "errors": dict(self.errors), "bytes_sent": self.bytes_sent}
+
+    def route(self, path: str, query: dict[str, str]) -> tuple[str, dict | list | None]:
+        '''(endpoint label, response body or None for 404)'''
+        raise NotImplementedError
+
+    # --- HTTP ---
+
+    def _encode_uncached(self, path: str, query: tuple, compress: bool) -> tuple[str, bytes | None]:
+        endpoint, body = self.route(path, dict(query))
+
+        if body is None:
+            return endpoint, None
+
+        raw = json.dumps(body, separators=(",", ":")).encode()
+
+        return endpoint, gzip.compress(raw, compresslevel=1) if compress else raw
+
+    def _inject(self) -> int | None:
+        '''Status of an injected failure for this request, if any'''
+
+        if not self.error_rate:
+            return None
+
+        with self._lock:
+            if self._rng.random() >= self.error_rate:
+                return None
+            return 429 if self._rng.random() < self.throttle_share else 503
+
+    def _delay(self) -> float:
+        if not self.jitter:
+            return self.latency
+
+        with self._lock:
+            return max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out as separate writes; without this, Nagle + delayed ACK add ~40ms per request
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status: int, body: bytes, headers: dict | None = None):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+                with server._lock:
+                    server.bytes_sent += len(body)
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                path = url.path.split("/trade-api/v2", 1)[-1]
+                query = _query(url.query)
+                compress = server.gzip and "gzip" in self.headers.get("Accept-Encoding", "")
+
+                delay = server._delay()
+                if delay:
+                    time.sleep(delay)
+
+                status = server._inject()
+
+                try:
+                    endpoint, body = server._encode(path, query, compress)
+                except (KeyError, ValueError) as exc:
+                    endpoint, body, status = "bad_request", json.dumps({"error": str(exc)}).encode(), 400
+                    compress = False
+
+                with server._lock:
+                    server.requests[endpoint] += 1
+                    if status in (429, 503):
+                        server.errors[endpoint] += 1
+
+                if status in (429, 503):
+                    self._reply(status, b'{"error":"injected"}', {"Retry-After": "0"} if status == 429 else None)
+                elif status == 400:
+                    self._reply(400, body)
+                elif body is None:
+                    self._reply(404, b'{"error":"not found"}')
+                else:
+                    self._reply(200, body, {"Content-Encoding": "gzip"} if compress else None)
+
+        return Handler
+
+
+class MockKalshiServer(MockServer):
+
+    def __init__(self, n_series: int = 20, events_per_series: int = 10, markets_per_event: int = 8, seed: int = 0,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, throttle_share: float = 0.0,
+                 max_page_size: int = 1000, gzip: bool = True, host: str = "127.0.0.1", port: int = 0):
+
+        universe = make_universe(n_series, events_per_series, markets_per_event, seed)
+        self.series = universe["series"]
+        self.events = universe["events"]
+        self.markets = universe["markets"]
+
+        self.series_by_ticker = {s["ticker"]: s for s in self.series}
+        self.events_by_ticker = {e["event_ticker"]: e for e in self.events}
+        self.markets_by_ticker = {m["ticker"]: m for m in self.markets}
+        self.markets_by_event: dict[str, list[dict]] = {}
+        for market in self.markets:
+            self.markets_by_event.setdefault(market["event_ticker"], []).append(market)
+
+        super().__init__(seed, latency, jitter, error_rate, throttle_share, max_page_size, gzip, host, port)
+
+    # --- ROUTING ---
+
+    def route(self, path: str, query: dict[str, str]) -> tuple[str, dict | None]:
+        '''(endpoint label, response body or None for 404)'''
+
+        parts = path.strip("/").split("/")
+
+        if parts[-1] == "candlesticks" and len(parts) == 5:
+            if parts[2] == "markets":
+                return "market_candlesticks", self._market_candlesticks(parts[3], query)
+            return "event_candlesticks", self._event_candlesticks(parts[3], query)
+
+        if parts == ["markets"]:
+            return "markets", self._list_markets(query)
+        if parts == ["events"]:
+            return "events", self._list_events(query)
+        if parts == ["series"]:
+            return "series_list", self._page(self.series, "series", query, 1000)
+        if parts == ["search", "tags_by_categories"]:
+            return "tags", self._tags()
+
+        if len(parts) == 2 and parts[0] == "markets":
+            # Bare market object: what get_single_market_from_market_ticker parses
+            return "market", self.markets_by_ticker.get(parts[1])
+        if len(parts) == 2 and parts[0] == "events":
+            return "event", self._event(parts[1], query)
+        if len(parts) == 2 and parts[0] == "series":
+            series = self.series_by_ticker.get(parts[1])
+            return "series", {"series": series} if series is not None else None
+
+        return parts[0], None
+
+    def _page(self, records: list[dict], key: str, query: dict, default_limit: int) -> dict:
+        '''One cursor page of `records`; the cursor is the offset of the next page ("" on the last one)'''
+
+        limit = max(1, min(int(query.get("limit", default_limit)), self.max_page_size))
+        offset = int(query.get("cursor") or 0)
+        end = offset + limit
+
+        return {key: records[offset:end], "cursor": str(end) if end < len(records) else ""}
+
+    def _list_markets(self, query: dict) -> dict:
+        markets = self.markets
+
+        if query.get("tickers"):
+            markets = [self.markets_by_ticker[t] for t in query["tickers"].split(",") if t in self.markets_by_ticker]
+        elif query.get("event_ticker"):
+            markets = [m for e in query["event_ticker"].split(",") for m in self.markets_by_event.get(e, [])]
+        elif query.get("series_ticker"):
+            prefix = query["series_ticker"] + "-"
+            markets = [m for m in markets if m["event_ticker"].startswith(prefix)]
+
+        statuses = _STATUS_FILTER.get(query.get("status", ""))
+        if statuses is not None:
+            markets = [m for m in markets if m["status"] in statuses]
+
+        return self._page(markets, "markets", query, 100)
+
+    def _with_markets(self, event: dict) -> dict:
+        return {**event, "markets": self.markets_by_event.get(event["event_ticker"], [])}
+
+    def _list_events(self, query: dict) -> dict:
+        events = self.events
+
+        if query.get("series_ticker"):
+            events = [e for e in events if e["series_ticker"] == query["series_ticker"]]
+
+        statuses = _STATUS_FILTER.get(query.get("status", ""))
+        if statuses is not None:
+            events = [e for e in events if any(m["status"] in statuses for m in self.markets_by_event.get(e["event_ticker"], []))]
+
+        page = self._page(events, "events", query, 200)
+
+        if _truthy(query.get("with_nested_markets")):
+            page["events"] = [self._with_markets(e) for e in page["events"]]
+
+        if _truthy(query.get("with_milestones")):
+            tickers = [e["event_ticker"] for e in page["events"]]
+            page["milestones"] = [make_milestone(i, tickers[i:i + 3]) for i in range(0, len(tickers), 3)]
+
+        return page
+
+    def _event(self, event_ticker: str, query: dict) -> dict | None:
+        event = self.events_by_ticker.get(event_ticker)
+
+        if event is None:
+            return None
+
+        markets = self.markets_by_event.get(event_ticker, [])
+        nested = self._with_markets(event) if _truthy(query.get("with_nested_markets")) else event
+
+        return {"event": nested, "markets": markets}
+
+    def _tags(self) -> dict:
+        tags: dict[str, list[str]] = {}
+
+        for series in self.series:
+            tags.setdefault(series["category"], [])
+            tags[series["category"]] = sorted(set(tags[series["category"]]) | set(series["tags"] or ()))
+
+        return {"tags": tags}
+
+    def _candles(self, ticker: str, start_ts: int, end_ts: int, period_interval: int, cap: int) -> list[dict]:
+        '''Aligned candles ending in [start_ts, end_ts], at most `cap`; deterministic per (ticker, first bar)'''
+
+        span = period_interval * 60
+        first = -(-start_ts // span) * span
+        n = max(0, min(cap, (end_ts - first) // span + 1))
+
+        if n == 0:
+            return []
+
+        return make_candlesticks(n, start_ts=first - span, period_interval=period_interval,
+                                 seed=zlib.crc32(f"{ticker}:{first}".encode()))
+
+    def _candle_query(self, query: dict) -> tuple[int, int, int]:
+        return int(query["start_ts"]), int(query["end_ts"]), int(query.get("period_interval", 1))
+
+    def _market_candlesticks(self, market_ticker: str, query: dict) -> dict | None:
+        if market_ticker not in self.markets_by_ticker:
+            return None
+
+        start_ts, end_ts, period_interval = self._candle_query(query)
+
+        # Like the live endpoint: silently truncated at the cap
+        return {"ticker": market_ticker,
+                "candlesticks": self._candles(market_ticker, start_ts, end_ts, period_interval, MAX_CANDLES_PER_REQUEST)}
+
+    def _event_candlesticks(self, event_ticker: str, query: dict) -> dict | None:
+        markets = self.markets_by_event.get(event_ticker)
+
+        if markets is None:
+            return None
+
+        start_ts, end_ts, period_interval = self._candle_query(query)
+
+        # The cap is shared by the event's markets; adjusted_end_ts says how far this answer got
+        cap = MAX_CANDLES_PER_REQUEST // len(markets)
+        span = period_interval * 60
+        first = -(-start_ts // span) * span
+        adjusted = min(end_ts, first + (cap - 1) * span)
+
+        return {
+            "market_tickers": [m["ticker"] for m in markets],
+            "market_candlesticks": [self._candles(m["ticker"], start_ts, adjusted, period_interval, cap) for m in markets],
+            "adjusted_end_ts": adjusted,
+        }
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve a synthetic Kalshi API locally")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--series", type=int, default=20)
+    parser.add_argument("--events-per-series", type=int, default=10)
+    parser.add_argument("--markets-per-event", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-page-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with MockKalshiServer(args.series, args.events_per_series, args.markets_per_event, latency=args.latency, jitter=args.jitter,
+                          error_rate=args.error_rate, max_page_size=args.max_page_size, port=args.port) as server:
+        print(f"Serving {len(server.markets)} markets on {server.url}")
+        threading.Event().wait()
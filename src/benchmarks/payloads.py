@@ -0,0 +1,315 @@
+import calendar
+import random
+import time
+
+'''
+Synthetic, schema-faithful Kalshi (and Polymarket Gamma / CLOB) payloads for offline benchmarks.
+
+Everything is seeded, so two runs with the same arguments produce byte-identical JSON.
+'''
+
+
+def _dollars(cents: int) -> str:
+    return f"{cents / 100:.4f}"
+
+
+def _ohlc(open_: int, low: int, high: int, close: int) -> dict:
+    return {
+        "open": open_, "open_dollars": _dollars(open_),
+        "low": low, "low_dollars": _dollars(low),
+        "high": high, "high_dollars": _dollars(high),
+        "close": close, "close_dollars": _dollars(close),
+    }
+
+
+def make_candlesticks(n: int, start_ts: int = 1_700_000_000, period_interval: int = 1, seed: int = 0, trade_prob: float = 0.6) -> list[dict]:
+    '''Random-walk candles; roughly (1 - trade_prob) of periods have no trades and an empty `price` object'''
+
+    rng = random.Random(seed)
+    mid = 50
+    open_interest = 0
+    previous = None
+    candles = []
+
+    for i in range(n):
+        mid = min(95, max(5, mid + rng.choice((-1, 0, 0, 1))))
+        bid = mid - rng.randint(0, 2)
+        ask = mid + rng.randint(1, 3)
+
+        price = {}
+        volume = 0
+
+        if rng.random() < trade_prob:
+            o, c = rng.randint(bid, ask), rng.randint(bid, ask)
+            lo, hi = min(o, c) - rng.randint(0, 1), max(o, c) + rng.randint(0, 1)
+            price = {**_ohlc(o, lo, hi, c), "mean": (lo + hi) // 2, "mean_dollars": _dollars((lo + hi) // 2)}
+            if previous is not None:
+                price.update(previous=previous, previous_dollars=_dollars(previous))
+            previous = c
+            volume = rng.randint(1, 500)
+            open_interest += rng.randint(0, volume)
+
+        candles.append({
+            "end_period_ts": start_ts + (i + 1) * period_interval * 60,
+            "yes_bid": _ohlc(bid, bid - 1, bid + 1, bid),
+            "yes_ask": _ohlc(ask, ask - 1, ask + 1, ask),
+            "price": price,
+            "volume": volume,
+            "volume_fp": f"{volume:.2f}",
+            "open_interest": open_interest,
+            "open_interest_fp": f"{open_interest:.2f}",
+        })
+
+    return candles
+
+
+# --- REFERENCE DATA ---
+
+CATEGORIES = ("Economics", "Weather", "Politics", "Financials", "Sports", "Climate and Weather")
+STATUSES = ("active", "active", "active", "active", "closed", "settled")
+
+_RULES = "If the outcome is reported by the source agency on or before the expiration date, the market resolves to Yes. "
+
+
+def _iso(ts: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
+
+
+def make_series(ticker: str, rng: random.Random) -> dict:
+    volume = rng.randint(0, 50_000_000)
+
+    return {
+        "ticker": ticker,
+        "frequency": rng.choice(("daily", "weekly", "monthly", "custom")),
+        "title": f"{ticker} series",
+        "category": rng.choice(CATEGORIES),
+        "tags": rng.sample(("rates", "inflation", "temperature", "elections", "crypto", "indices"), 2),
+        "settlement_sources": [{"name": "Source agency", "url": "https://example.com/source"}],
+        "contract_url": f"https://kalshi.com/contracts/{ticker.lower()}.pdf",
+        "fee_type": "quadratic",
+        "fee_multiplier": 1.0,
+        "additional_prohibitions": [],
+        "product_metadata": None,
+        "volume": volume,
+        "volume_fp": f"{volume:.2f}",
+    }
+
+
+def make_market(ticker: str, event_ticker: str, rng: random.Random, open_ts: int = 1_700_000_000, strike: int | None = None) -> dict:
+    '''One /markets record with every field the live API sends (cents plus *_dollars / *_fp twins)'''
+
+    bid = rng.randint(1, 97)
+    ask = bid + rng.randint(1, 3)
+    last = rng.randint(bid, ask)
+    volume = rng.randint(0, 200_000)
+    volume_24h = rng.randint(0, volume)
+    open_interest = rng.randint(0, volume)
+    liquidity = rng.randint(0, 5_000_000)
+    close_ts = open_ts + rng.randint(1, 90) * 86_400
+    status = rng.choice(STATUSES)
+
+    return {
+        "ticker": ticker,
+        "event_ticker": event_ticker,
+        "market_type": "binary",
+        "title": f"Will {event_ticker} be above {strike}?" if strike is not None else f"{ticker}?",
+        "subtitle": "",
+        "yes_sub_title": f"{strike} or above" if strike is not None else "Yes",
+        "no_sub_title": f"Below {strike}" if strike is not None else "No",
+        "created_time": _iso(open_ts - 3_600),
+        "updated_time": _iso(open_ts + 60),
+        "open_time": _iso(open_ts),
+        "close_time": _iso(close_ts),
+        "expiration_time": _iso(close_ts + 86_400),
+        "latest_expiration_time": _iso(close_ts + 7 * 86_400),
+        "settlement_timer_seconds": 300,
+        "status": status,
+        "response_price_units": "usd_cent",
+        "yes_bid": bid, "yes_bid_dollars": _dollars(bid),
+        "yes_ask": ask, "yes_ask_dollars": _dollars(ask),
+        "no_bid": 100 - ask, "no_bid_dollars": _dollars(100 - ask),
+        "no_ask": 100 - bid, "no_ask_dollars": _dollars(100 - bid),
+        "last_price": last, "last_price_dollars": _dollars(last),
+        "volume": volume, "volume_fp": f"{volume:.2f}",
+        "volume_24h": volume_24h, "volume_24h_fp": f"{volume_24h:.2f}",
+        "result": rng.choice(("yes", "no")) if status == "settled" else "",
+        "can_close_early": rng.random() < 0.5,
+        "open_interest": open_interest, "open_interest_fp": f"{open_interest:.2f}",
+        "notional_value": 100, "notional_value_dollars": "1.0000",
+        "previous_yes_bid": bid, "previous_yes_bid_dollars": _dollars(bid),
+        "previous_yes_ask": ask, "previous_yes_ask_dollars": _dollars(ask),
+        "previous_price": last, "previous_price_dollars": _dollars(last),
+        "liquidity": liquidity, "liquidity_dollars": _dollars(liquidity),
+        "expiration_value": "",
+        "tick_size": 1,
+        "rules_primary": _RULES * rng.randint(1, 4),
+        "rules_secondary": "",
+        "price_level_structure": "linear_cent",
+        "price_ranges": [{"start": "0.0000", "end": "1.0000", "step": "0.0100"}],
+        "expected_expiration_time": _iso(close_ts + 3_600),
+        "strike_type": "greater" if strike is not None else None,
+        "floor_strike": strike,
+    }
+
+
+def make_event(event_ticker: str, series_ticker: str, rng: random.Random) -> dict:
+    '''Event record without nested markets'''
+
+    return {
+        "event_ticker": event_ticker,
+        "series_ticker": series_ticker,
+        "title": f"{series_ticker} on {event_ticker.rsplit('-', 1)[-1]}",
+        "sub_title": event_ticker.rsplit("-", 1)[-1],
+        "collateral_return_type": "",
+        "mutually_exclusive": rng.random() < 0.5,
+        "category": rng.choice(CATEGORIES),
+        "available_on_brokers": True,
+        "product_metadata": None,
+        "strike_date": None,
+        "strike_period": None,
+    }
+
+
+def make_milestone(i: int, event_tickers: list[str]) -> dict:
+    return {
+        "id": f"milestone-{i}",
+        "category": "Economics",
+        "type": "economic_release",
+        "start_date": _iso(1_700_000_000 + i * 86_400),
+        "related_event_tickers": event_tickers,
+        "title": f"Release {i}",
+        "notification_message": "",
+        "details": {},
+        "primary_event_tickers": event_tickers[:1],
+        "last_updated_ts": _iso(1_700_000_000),
+    }
+
+
+def make_universe(n_series: int = 20, events_per_series: int = 10, markets_per_event: int = 8, seed: int = 0) -> dict:
+    '''
+    A seeded exchange: {"series": [...], "events": [...], "markets": [...]} where every event belongs to a series
+    and every market to an event, with tickers in the live format (KXS0, KXS0-25JAN01, KXS0-25JAN01-T42)
+    '''
+
+    rng = random.Random(seed)
+    series, events, markets = [], [], []
+
+    for s in range(n_series):
+        series_ticker = f"KXS{s}"
+        series.append(make_series(series_ticker, rng))
+
+        for e in range(events_per_series):
+            event_ticker = f"{series_ticker}-{_iso(1_700_000_000 + e * 86_400)[2:10].replace('-', '')}"
+            events.append(make_event(event_ticker, series_ticker, rng))
+            open_ts = 1_700_000_000 + e * 86_400
+
+            for m in range(markets_per_event):
+                strike = 10 + m * 5
+                markets.append(make_market(f"{event_ticker}-T{strike}", event_ticker, rng, open_ts, strike))
+
+    return {"series": series, "events": events, "markets": markets}
+
+
+# --- POLYMARKET ---
+
+def make_price_history(n: int, start_ts: int = 1_700_000_000, fidelity: int = 1, seed: int = 0, start_price: float = 0.5) -> list[dict]:
+    '''CLOB /prices-history points: a random walk in [0.001, 0.999], one point every `fidelity` minutes'''
+
+    rng = random.Random(seed)
+    price = start_price
+    points = []
+
+    for i in range(n):
+        price = min(0.999, max(0.001, price + rng.choice((-0.01, -0.005, 0.0, 0.0, 0.005, 0.01))))
+        points.append({"t": start_ts + i * fidelity * 60, "p": round(price, 3)})
+
+    return points
+
+
+def _polymarket_market(market_id: int, question: str, label: str, end_ts: int, mid: float, event: dict, rng: random.Random) -> dict:
+    '''One Gamma /markets record (JSON-encoded outcome lists, numbers as the live API sends them)'''
+
+    half = rng.choice((0.005, 0.01, 0.015))
+    bid, ask = round(max(0.001, mid - half), 3), round(min(0.999, mid + half), 3)
+    volume = round(rng.uniform(0, 2_000_000), 2)
+    liquidity = round(rng.uniform(0, 200_000), 2)
+    closed = rng.random() < 0.05
+
+    return {
+        "id": str(market_id),
+        "question": question,
+        "conditionId": f"0x{market_id:064x}",
+        "slug": question.lower().replace(" ", "-").replace("?", ""),
+        "endDate": _iso(end_ts),
+        "startDate": _iso(end_ts - 30 * 86_400),
+        "description": _RULES,
+        "groupItemTitle": label,
+        "outcomes": '["Yes", "No"]',
+        "outcomePrices": f'["{mid:.3f}", "{1 - mid:.3f}"]',
+        "clobTokenIds": f'["{market_id}1", "{market_id}2"]',
+        "active": True,
+        "closed": closed,
+        "archived": False,
+        "acceptingOrders": not closed,
+        "bestBid": bid,
+        "bestAsk": ask,
+        "lastTradePrice": round(rng.uniform(bid, ask), 3),
+        "spread": round(ask - bid, 3),
+        "volumeNum": volume,
+        "volume24hr": round(volume * rng.uniform(0, 0.1), 2),
+        "liquidityNum": liquidity,
+        "orderPriceMinTickSize": 0.001,
+        "negRisk": False,
+        "events": [{"id": event["id"], "slug": event["slug"], "title": event["title"]}],
+    }
+
+
+def make_polymarket_universe(kalshi_markets: list[dict], share: float = 0.5, extra: int = 0, seed: int = 0) -> dict:
+    '''
+    A seeded Polymarket listing {"events": [...], "markets": [...]} that overlaps a make_universe exchange: `share` of the
+    Kalshi markets get a Polymarket twin (reworded question, close a few hours off, mid within a few cents of Kalshi's
+    so some pairs cross), plus `extra` markets with no Kalshi counterpart
+    '''
+
+    rng = random.Random(seed)
+    events: dict[str, dict] = {}
+    markets = []
+    next_id = 500_000
+
+    for market in kalshi_markets:
+        if rng.random() >= share:
+            continue
+
+        event_ticker = market["event_ticker"]
+        event = events.get(event_ticker)
+
+        if event is None:
+            event = events[event_ticker] = {"id": str(900_000 + len(events)), "slug": event_ticker.lower(), "title": f"{event_ticker} outcomes",
+                                            "active": True, "closed": False, "markets": []}
+
+        strike = market.get("floor_strike")
+        question = f"{event_ticker} above {strike} at close?" if strike is not None else f"{market['title']} (close)"
+        label = f"{strike}+" if strike is not None else "Yes"
+
+        end_ts = calendar.timegm(time.strptime(market["close_time"], "%Y-%m-%dT%H:%M:%SZ")) + rng.randint(-6, 6) * 3_600
+        kalshi_mid = (market["yes_bid"] + market["yes_ask"]) / 200
+        mid = min(0.98, max(0.02, kalshi_mid + rng.uniform(-0.04, 0.04)))
+
+        record = _polymarket_market(next_id, question, label, end_ts, mid, event, rng)
+        event["markets"].append(record)
+        markets.append(record)
+        next_id += 1
+
+    extra_event = {"id": "999999", "slug": "unrelated", "title": "Unrelated questions", "active": True, "closed": False, "markets": []}
+
+    for i in range(extra):
+        record = _polymarket_market(next_id, f"Will unrelated question {i} resolve yes?", "", 1_700_000_000 + rng.randint(1, 90) * 86_400,
+                                    rng.uniform(0.05, 0.95), extra_event, rng)
+        extra_event["markets"].append(record)
+        markets.append(record)
+        next_id += 1
+
+    if extra:
+        events["unrelated"] = extra_event
+
+    return {"events": list(events.values()), "markets": markets}
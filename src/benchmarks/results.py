@@ -0,0 +1,27 @@
+import json
+import os
+import subprocess
+
+'''
+Benchmark results I/O shared by the suite and the import-time benchmark. Standard library only, so a benchmark
+can save / load / stamp results without importing anything it measures.
+'''
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def save(results: dict, path: str):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
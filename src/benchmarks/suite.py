@@ -0,0 +1,269 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+import pandas_ta as ta
+from ..kalshi import KalshiClient, RetryPolicy
+from ..kalshi.models import Market, MarketsResponse, MarketCandlestickResponse, Series
+from ..technical_analysis import crossover, crossunder, const_to_series
+from ..utils import pydantic_model_to_dataframe, unwrap_candlesticks, to_ta_data, to_ta_frame
+from .mock_server import MockKalshiServer
+from .results import save, load, git_commit
+
+'''
+Offline benchmark suite: KalshiClient against a local MockKalshiServer.
+
+    python -m src.benchmarks.suite --out results/base.json
+    python -m src.benchmarks.suite --out results/new.json --baseline results/base.json
+    python -m src.benchmarks.suite --quick --latency 0.02 --error-rate 0.02
+
+Three groups of measurements, each repeated and reported as median / min seconds:
+
+    end_to_end   whole client calls over HTTP (market sweep, compact table, nested events, concurrent event
+                 lookups, candles -> indicators for a set of markets) with throughput and tracemalloc peak
+    stages       the candle and market pipelines split into http, json, pydantic, unwrap, to_ta_data,
+                 DataFrame and indicators, all fed the same payload, so a regression points at one stage
+    server       what the mock served (requests per endpoint, injected errors, bytes)
+
+Results are JSON (config + environment + numbers). compare() lines two runs up stage by stage and flags
+anything slower than the threshold; the CLI exits non-zero on a regression so it can gate CI.
+'''
+
+FULL = {"n_series": 40, "events_per_series": 25, "markets_per_event": 10, "candle_markets": 16, "candle_bars": 20_000, "repeat": 5}
+QUICK = {"n_series": 10, "events_per_series": 10, "markets_per_event": 8, "candle_markets": 4, "candle_bars": 5_000, "repeat": 3}
+
+PERIOD_INTERVAL = 1
+CANDLE_START_TS = 1_700_000_000 - 1_700_000_000 % 60
+RSI_LENGTH = 7
+
+
+def _measure(fn, repeat: int, memory: bool = False) -> tuple[dict, object]:
+    '''(row, last result): median / min wall time of fn() over `repeat` runs; with memory, the tracemalloc peak of one extra run'''
+
+    times = []
+    result = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+
+    row = {"median_s": statistics.median(times), "min_s": min(times), "runs": repeat}
+
+    if memory:
+        tracemalloc.start()
+        fn()
+        row["peak_mb"] = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+
+    return row, result
+
+
+def _indicators(df):
+    midline = const_to_series(50, len(df["close"]))
+    df["rsi"] = ta.rsi(df["close"], length=RSI_LENGTH)
+    df["buy"] = crossover(df["rsi"], midline)
+    df["sell"] = crossunder(df["rsi"], midline)
+    return df
+
+
+# --- END TO END ---
+
+def end_to_end(client: KalshiClient, server: MockKalshiServer, config: dict) -> dict:
+    repeat = config["repeat"]
+    results = {}
+
+    def add(name, fn, unit):
+        # fn returns how many items (markets, bars) it processed
+        row, count = _measure(fn, repeat, memory=True)
+        row.update(items=count, unit=unit, throughput=count / row["median_s"] if row["median_s"] else None)
+        results[name] = row
+        print(f"  {name:<22} {row['median_s'] * 1e3:9.1f} ms  {row['throughput'] or 0:12.0f} {unit}/s  peak {row['peak_mb']:.1f} MB")
+
+    add("iter_markets", lambda: sum(1 for _ in client.iter_markets(status=None, page_size=1000)), "markets")
+    add("get_market_table", lambda: len(client.get_market_table(status=None, page_size=1000)), "markets")
+    add("iter_events_nested", lambda: sum(len(e.markets or ()) for e in client.iter_events(status=None, with_nested_markets=True)), "markets")
+
+    event_tickers = [e["event_ticker"] for e in server.events[:200]]
+
+    def event_lookups():
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            return sum(len(r.markets) for r in pool.map(client.get_event, event_tickers))
+
+    add("get_event_x16", event_lookups, "markets")
+
+    # Candles -> unwrap -> to_ta_data -> DataFrame -> indicators, per market, on a thread pool like a scanner
+    candle_markets = server.markets[:config["candle_markets"]]
+    series = {m["ticker"]: Series(**server.series_by_ticker[m["event_ticker"].split("-")[0]]) for m in candle_markets}
+    end_ts = CANDLE_START_TS + config["candle_bars"] * PERIOD_INTERVAL * 60
+
+    def candle_pipeline(market: dict) -> int:
+        response = client.get_market_candle_sticks(series[market["ticker"]], Market(**market), period_interval=PERIOD_INTERVAL,
+                                                   start_ts=CANDLE_START_TS + 60, end_ts=end_ts)
+        df = pydantic_model_to_dataframe(to_ta_data(unwrap_candlesticks(response.candlesticks), PERIOD_INTERVAL))
+        return len(_indicators(df))
+
+    def candle_sweep():
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            return sum(pool.map(candle_pipeline, candle_markets))
+
+    add("candles_to_signals", candle_sweep, "bars")
+
+    def candle_sweep_frame():
+        def one(market):
+            df = client.get_market_candle_sticks(series[market["ticker"]], Market(**market), period_interval=PERIOD_INTERVAL,
+                                                 start_ts=CANDLE_START_TS + 60, end_ts=end_ts, as_frame=True)
+            return len(_indicators(df))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            return sum(pool.map(one, candle_markets))
+
+    add("candles_to_signals_frame", candle_sweep_frame, "bars")
+
+    return results
+
+
+# --- STAGES ---
+
+def stages(client: KalshiClient, server: MockKalshiServer, config: dict) -> dict:
+    '''The candle and market pipelines split stage by stage; each stage is timed on the previous stage's output'''
+
+    repeat = config["repeat"]
+    results = {}
+    market = server.markets[0]
+    series_ticker = market["event_ticker"].split("-")[0]
+    end_ts = CANDLE_START_TS + min(config["candle_bars"], 5000) * PERIOD_INTERVAL * 60
+
+    path = f"series/{series_ticker}/markets/{market['ticker']}/candlesticks"
+    params = {"start_ts": CANDLE_START_TS + 60, "end_ts": end_ts, "period_interval": PERIOD_INTERVAL}
+
+    def stage(name, fn, items=None):
+        row, out = _measure(fn, repeat)
+        row["items"] = items
+        results[name] = row
+        print(f"  {name:<22} {row['median_s'] * 1e3:9.2f} ms")
+        return out
+
+    body = stage("candles.http", lambda: client._send(path, params=params).content)
+    raw = stage("candles.json", lambda: json.loads(body))
+    bars = len(raw["candlesticks"])
+    response = stage("candles.pydantic", lambda: MarketCandlestickResponse(**raw), bars)
+    unwrapped = stage("candles.unwrap", lambda: unwrap_candlesticks(response.candlesticks), bars)
+    data = stage("candles.to_ta_data", lambda: to_ta_data(unwrapped, PERIOD_INTERVAL), bars)
+    df = stage("candles.dataframe", lambda: pydantic_model_to_dataframe(data), bars)
+    stage("candles.indicators", lambda: _indicators(df.copy()), bars)
+    stage("candles.to_ta_frame", lambda: to_ta_frame(raw, PERIOD_INTERVAL), bars)
+
+    params = {"limit": 1000, "status": None}
+    body = stage("markets.http", lambda: client._send("markets", params=params).content)
+    raw = stage("markets.json", lambda: json.loads(body))
+    stage("markets.pydantic", lambda: MarketsResponse(**raw), len(raw["markets"]))
+
+    return results
+
+
+# --- RESULTS ---
+
+def run(config: dict, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, max_page_size: int = 1000) -> dict:
+    server_config = {"latency": latency, "jitter": jitter, "error_rate": error_rate, "max_page_size": max_page_size}
+
+    with MockKalshiServer(config["n_series"], config["events_per_series"], config["markets_per_event"], **server_config) as server:
+        # Injected errors are retried without sleeping so backoff doesn't swamp the measurement
+        with KalshiClient("benchmark", base_url=server.url, retry=RetryPolicy(max_attempts=8, base_delay=0.0, max_delay=0.0)) as client:
+            print(f"{len(server.markets)} markets, {len(server.events)} events, {len(server.series)} series on {server.url}")
+
+            print("end to end")
+            e2e = end_to_end(client, server, config)
+            server_stats = server.stats()
+
+            print("stages")
+            stage_results = stages(client, server, config)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "commit": git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "config": {**config, **server_config},
+        "end_to_end": e2e,
+        "stages": stage_results,
+        "server": server_stats,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10) -> list[dict]:
+    '''
+    Per benchmark: baseline vs current median and their ratio. Anything more than `threshold` slower is a
+    regression, more than `threshold` faster an improvement. Benchmarks missing from either run are skipped.
+    '''
+
+    rows = []
+
+    if baseline.get("config") != current.get("config"):
+        print("warning: runs used different configs, ratios may not be comparable")
+
+    for group in ("end_to_end", "stages"):
+        for name, now in current.get(group, {}).items():
+            before = baseline.get(group, {}).get(name)
+
+            if before is None or not before["median_s"]:
+                continue
+
+            ratio = now["median_s"] / before["median_s"]
+            verdict = "regressed" if ratio > 1 + threshold else "improved" if ratio < 1 - threshold else "same"
+
+            row = {"benchmark": f"{group}.{name}", "baseline_s": before["median_s"], "current_s": now["median_s"],
+                   "ratio": ratio, "verdict": verdict}
+
+            if "peak_mb" in now and "peak_mb" in before:
+                row["peak_mb_ratio"] = now["peak_mb"] / before["peak_mb"] if before["peak_mb"] else None
+
+            rows.append(row)
+
+    return rows
+
+
+def print_comparison(rows: list[dict]):
+    for row in rows:
+        memory = f"  mem x{row['peak_mb_ratio']:.2f}" if row.get("peak_mb_ratio") else ""
+        print(f"  {row['benchmark']:<40} {row['baseline_s'] * 1e3:9.2f} -> {row['current_s'] * 1e3:9.2f} ms  "
+              f"x{row['ratio']:.2f}  {row['verdict']}{memory}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Offline KalshiClient benchmarks against a local mock API")
+    parser.add_argument("--quick", action="store_true", help="Smaller universe and fewer repeats")
+    parser.add_argument("--repeat", type=int, default=None)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--max-page-size", type=int, default=1000)
+    parser.add_argument("--out", default=None, help="Write results JSON here")
+    parser.add_argument("--baseline", default=None, help="Compare against a previous results JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown counted as a regression")
+    args = parser.parse_args()
+
+    config = dict(QUICK if args.quick else FULL)
+    if args.repeat is not None:
+        config["repeat"] = args.repeat
+
+    results = run(config, args.latency, args.jitter, args.error_rate, args.max_page_size)
+
+    if args.out:
+        save(results, args.out)
+
+    if args.baseline:
+        rows = compare(load(args.baseline), results, args.threshold)
+        print("comparison")
+        print_comparison(rows)
+
+        if any(row["verdict"] == "regressed" for row in rows):
+            sys.exit(1)
@@ -0,0 +1,75 @@
+import argparse
+import time
+from datetime import datetime
+import numpy as np
+from ..kalshi.models import Market, MarketTable
+from ..utils.time import iso_to_unix, iso_to_epoch, unix_to_datestr, epoch_to_labels, TimeIndex
+from .payloads import make_universe
+
+'''
+Timestamp handling: per-value datetime parsing vs the utils.time column paths.
+
+    python -m src.benchmarks.timestamps --markets 10000 100000
+
+    parse       close_time of every market: datetime.fromisoformat per string vs iso_to_epoch vs MarketTable.epoch
+    labels      "%d/%m/%Y" for a column of minute bars: unix_to_datestr per bar vs epoch_to_labels
+    query       "closing in the next hour": parse-and-filter scan over Markets vs a prebuilt TimeIndex
+
+Every run asserts the fast paths agree with the per-value ones before timing is reported.
+'''
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def _parse_each(values: list[str]) -> list[int]:
+    return [int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()) for value in values]
+
+
+def run(sizes: list[int]) -> list[dict]:
+
+    rows = []
+
+    for n in sizes:
+        universe = make_universe(n_series=max(1, n // 100), events_per_series=10, markets_per_event=10)
+        raw = universe["markets"][:n]
+        markets = [Market(**m) for m in raw]
+        table = MarketTable.from_json(raw)
+        close_times = [m.close_time for m in markets]
+
+        slow, parse_s = _timed(_parse_each, close_times)
+        fast, column_s = _timed(iso_to_epoch, close_times)
+        pooled, table_s = _timed(table.epoch, "close_time")
+        assert fast.tolist() == slow and pooled.tolist() == slow
+
+        bars = np.arange(1_700_000_000, 1_700_000_000 + 60 * n, 60)
+        slow_labels, labels_s = _timed(lambda: [unix_to_datestr(int(ts)) for ts in bars])
+        fast_labels, fast_labels_s = _timed(epoch_to_labels, bars)
+        assert fast_labels == slow_labels
+
+        now = int(np.median(slow))
+        iso_to_unix.cache_clear()
+        scan, scan_s = _timed(lambda: [m.ticker for m in markets if now <= iso_to_unix(m.close_time) < now + 3600])
+        index, index_build_s = _timed(TimeIndex.from_markets, table, "close_time")
+        found, query_s = _timed(index.within, 3600, now)
+        assert sorted(found) == sorted(scan)
+
+        row = {"markets": n, "parse_s": parse_s, "iso_to_epoch_s": column_s, "table_epoch_s": table_s,
+               "labels_s": labels_s, "epoch_to_labels_s": fast_labels_s,
+               "scan_s": scan_s, "index_build_s": index_build_s, "index_query_s": query_s, "matches": len(found)}
+
+        rows.append(row)
+        print(row)
+
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Per-value vs column timestamp handling")
+    parser.add_argument("--markets", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    run(args.markets)
@@ -1,6 +1,20 @@
 # At main.py lets me do from kalshi import KalshiClient; Cleaner than from kalshi.kalshi_client
 from .kalshi_client import KalshiClient
-from .models import Series, PriceRange, MVESelectedLeg, Market, MarketsResponse, TagList, SeriesList, Event, EventsResponse, EventResponse, EventResponse
+from .async_kalshi_client import AsyncKalshiClient
+from .transport import HttpTransport, AsyncHttpTransport
+from .cache import ResponseCache, MemoryCache, DiskCache
+from .resilience import RetryPolicy, HedgePolicy
+from .metrics import Metrics
+from .decode import DecodePolicy, decoding, STRICT, TRUSTED
+from .errors import KalshiError, KalshiTransportError, KalshiTimeoutError, KalshiHTTPError, KalshiDecodeError
+from .rate_limit import RateLimiter, request_priority, PRIORITY_INTERACTIVE, PRIORITY_NORMAL, PRIORITY_BULK
+from .snapshot import UniverseSnapshot, ChangeFeed, MarketChange, ADDED, REMOVED, CHANGED
+from .orderbook import OrderBook, YES, NO
+from .market_data import MarketDataStream, ReplayServer, load_recording
+from .models import Series, PriceRange, MVESelectedLeg, Market, MarketsResponse, TagList, SeriesList, Event, EventsResponse, EventResponse, EventResponse, MarketTable
 
 # Optionally, for clarity:
-__all__ = ['KalshiClient']
\ No newline at end of file
+__all__ = ['KalshiClient', 'AsyncKalshiClient', 'HttpTransport', 'AsyncHttpTransport', 'ResponseCache', 'MemoryCache', 'DiskCache', 'RateLimiter', 'request_priority',
+           'RetryPolicy', 'HedgePolicy', 'Metrics', 'DecodePolicy', 'decoding', 'STRICT', 'TRUSTED', 'KalshiError', 'KalshiTransportError', 'KalshiTimeoutError', 'KalshiHTTPError', 'KalshiDecodeError',
+           'UniverseSnapshot', 'ChangeFeed', 'MarketChange', 'ADDED', 'REMOVED', 'CHANGED',
+           'OrderBook', 'YES', 'NO', 'MarketDataStream', 'ReplayServer', 'load_recording']
\ No newline at end of file
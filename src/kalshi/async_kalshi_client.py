@@ -0,0 +1,429 @@
+import asyncio
+import time
+from typing import AsyncIterator
+from pydantic import ValidationError
+from .transport import AsyncHttpTransport, BASE_URL, DEFAULT_POOL_MAXSIZE, DEFAULT_TIMEOUT, endpoint_name
+from .cache import ResponseCache
+from .rate_limit import RateLimiter
+from .resilience import RetryPolicy, HedgePolicy, LatencyTracker
+from .pipeline import AsyncRequestPipeline
+from .metrics import Metrics, CACHE_HIT, CACHE_MISS, CACHE_REVALIDATED
+from .decode import DecodePolicy, as_policy, current_policy, build, build_json
+from .coalesce import AsyncSingleFlight, coalesced_async as coalesced, chunked, MAX_TICKERS_PER_REQUEST, MAX_EVENTS_PER_REQUEST
+from .candle_windows import candle_windows, covered_until, merge_candles, merge_event_candles, MAX_CANDLES_PER_REQUEST, WINDOW_CONCURRENCY
+from .errors import KalshiDecodeError
+from .models import MarketCandlestickResponse, Series, Market, MarketsResponse, TagList, SeriesList, SeriesResponse, EventsResponse, Event, EventResponse, EventCandlesticksResponse, MarketTable, MarketTableBuilder
+from ..trading_constants import DEFAULT_TIMEFRAME
+from ..utils.time import get_end_ts, get_start_ts
+
+DEFAULT_CONCURRENCY = 8  # In-flight requests per gather_* fan-out
+
+
+class AsyncKalshiClient(AsyncRequestPipeline):
+    '''
+    asyncio mirror of KalshiClient: same methods, same pydantic models, awaited.
+
+    The gather_* helpers fan a batch of requests out under a semaphore, so pulling candles
+    for a whole series costs a few round trips instead of one blocking request per market.
+    '''
+
+    API_KEY: str
+
+    def __init__(self, API_KEY, transport: AsyncHttpTransport | None = None, base_url=BASE_URL,
+                 max_connections=DEFAULT_POOL_MAXSIZE, timeout=DEFAULT_TIMEOUT, cache: ResponseCache | None = None,
+                 rate_limiter: RateLimiter | None = None, retry: RetryPolicy = RetryPolicy(), hedge: HedgePolicy | None = None,
+                 metrics: Metrics | None = None, coalesce: bool = True, decode: DecodePolicy | str | None = None):
+        self.API_KEY = API_KEY
+
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.hedge = hedge
+        self.latency = LatencyTracker()
+        self.metrics = metrics
+        self.decode = as_policy(decode)
+        self._flights = AsyncSingleFlight() if coalesce else None
+
+        self._owns_transport = transport is None
+        self.transport = transport or AsyncHttpTransport(base_url=base_url, max_connections=max_connections, timeout=timeout)
+
+    async def aclose(self):
+        if self._owns_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    def _parse(self, model, data: dict):
+        start = time.perf_counter() if self.metrics is not None else None
+
+        try:
+            parsed = build(model, data, current_policy(self.decode))
+        except (ValidationError, TypeError) as exc:
+            raise KalshiDecodeError(model.__name__, model.__module__, str(exc)) from exc
+
+        if start is not None:
+            self.metrics.stage(f"model.{model.__name__}", time.perf_counter() - start)
+
+        return parsed
+
+    def _table(self, builder: MarketTableBuilder, markets: list[dict]) -> None:
+        start = time.perf_counter() if self.metrics is not None else None
+
+        try:
+            builder.extend(markets)
+        except ValueError as exc:
+            raise KalshiDecodeError(MarketTable.__name__, MarketTable.__module__, str(exc)) from exc
+
+        if start is not None:
+            self.metrics.stage("model.MarketTable", time.perf_counter() - start)
+
+    def _decode(self, model, response):
+        start = time.perf_counter() if self.metrics is not None else None
+
+        try:
+            parsed = build_json(model, response.content, current_policy(self.decode))
+        except (ValidationError, TypeError) as exc:
+            raise KalshiDecodeError(model.__name__, str(response.url), str(exc)) from exc
+
+        if start is not None:
+            self.metrics.stage(f"model.{model.__name__}", time.perf_counter() - start)
+
+        return parsed
+
+    async def _get_model(self, model, path: str, params: dict | None = None):
+        '''See KalshiClient._get_model'''
+
+        if self.cache is not None and self.cache.ttl(endpoint_name(path)):
+            return self._parse(model, await self._get(path, params))
+
+        async def fetch():
+            return self._decode(model, await self._send(path, params=params))
+
+        if self._flights is None:
+            return await fetch()
+
+        return await self._flights.do(("MODEL", model, current_policy(self.decode), ResponseCache.key(path, params)), fetch)
+
+    async def _markets(self, params: dict, compact: bool) -> MarketsResponse | MarketTable:
+        if not compact:
+            return await self._get_model(MarketsResponse, "markets", params)
+
+        data = await self._get("markets", params=params)
+        builder = MarketTableBuilder()
+        self._table(builder, data["markets"])
+
+        return builder.build(data.get("cursor"))
+
+    async def _get(self, path: str, params: dict | None = None, timeout=None) -> dict:
+        '''See KalshiClient._get'''
+
+        if self._flights is None:
+            return await self._get_once(path, params, timeout)
+
+        return await self._flights.do(("GET", ResponseCache.key(path, params)), lambda: self._get_once(path, params, timeout))
+
+    async def _get_once(self, path: str, params: dict | None, timeout) -> dict:
+
+        ttl = self.cache.ttl(endpoint_name(path)) if self.cache is not None else 0
+
+        if not ttl:
+            return self._json(await self._send(path, params=params, timeout=timeout))
+
+        key = self.cache.key(path, params)
+        data, stale = self.cache.lookup(key)
+
+        if self.metrics is not None:
+            self.metrics.cache(endpoint_name(path), CACHE_HIT if data is not None else CACHE_MISS)
+
+        if data is not None:
+            return data
+
+        response = await self._send(path, params=params, timeout=timeout, headers=stale.validators() if stale else None)
+
+        if response.status_code == 304 and stale is not None:
+            if self.metrics is not None:
+                self.metrics.cache(endpoint_name(path), CACHE_REVALIDATED)
+            return self.cache.renew(key, stale, ttl)
+
+        data = self._json(response)
+
+        if response.status_code == 200:
+            self.cache.store(key, data, ttl, response.headers)
+
+        return data
+
+    async def _fetch_windows(self, fetch, windows: list[tuple[int, int]]) -> list:
+        '''See KalshiClient._fetch_windows'''
+
+        return await self._bounded_gather([fetch(*window) for window in windows], WINDOW_CONCURRENCY)
+
+    async def _paginate(self, path: str, params: dict, limit: int) -> AsyncIterator[dict]:
+        '''Follow a list endpoint's cursor, requesting page N+1 while the caller consumes page N'''
+
+        params = {**params, "limit": limit}
+        pending = asyncio.ensure_future(self._get(path, params))
+
+        try:
+            while pending is not None:
+                page = await pending
+
+                cursor = page.get("cursor")
+                pending = asyncio.ensure_future(self._get(path, {**params, "cursor": cursor})) if cursor else None
+
+                yield page
+        finally:
+            # Caller stopped early - don't leave the prefetch dangling
+            if pending is not None:
+                pending.cancel()
+
+    async def iter_markets(self, status="open", series_ticker=None, event_ticker=None, tickers=None, page_size=1000) -> AsyncIterator[Market]:
+
+        params = {"status": status, "series_ticker": series_ticker, "event_ticker": event_ticker,
+                  "tickers": ",".join(tickers) if tickers else None}
+
+        async for page in self._paginate("markets", params, page_size):
+            for market in page["markets"]:
+                yield self._parse(Market, market)
+
+    async def get_market_table(self, status="open", series_ticker=None, event_ticker=None, tickers=None, page_size=1000) -> MarketTable:
+
+        params = {"status": status, "series_ticker": series_ticker, "event_ticker": event_ticker,
+                  "tickers": ",".join(tickers) if tickers else None}
+
+        builder = MarketTableBuilder()
+
+        async for page in self._paginate("markets", params, page_size):
+            self._table(builder, page["markets"])
+
+        return builder.build()
+
+    async def iter_events(self, status="open", series_ticker=None, with_nested_markets=False, page_size=200) -> AsyncIterator[Event]:
+
+        params = {"status": status, "series_ticker": series_ticker, "with_nested_markets": with_nested_markets}
+
+        async for page in self._paginate("events", params, page_size):
+            for event in page["events"]:
+                yield self._parse(Event, event)
+
+    async def iter_series(self, category=None, tags=None, include_product_metadata=False, include_volume=True, page_size=1000) -> AsyncIterator[Series]:
+
+        params = {
+            "category": category,
+            "tags": tags,
+            "include_product_metadata": include_product_metadata,
+            "include_volume": include_volume
+        }
+
+        async for page in self._paginate("series", params, page_size):
+            for series in page["series"]:
+                yield self._parse(Series, series)
+
+    @coalesced
+    async def get_tags_by_categories(self) -> TagList:
+
+        return await self._get_model(TagList, "search/tags_by_categories")
+
+    @coalesced
+    async def get_series(self, series_ticker: str, include_volume=True) -> Series:
+
+        response = await self._get_model(SeriesResponse, f"series/{series_ticker}", params={"include_volume": include_volume})
+
+        return response.series
+
+    async def get_series_list(self, category=None, tags=None, include_product_metadata=False, include_volume=True) -> SeriesList:
+
+        params = {}
+
+        params["include_volume"] = include_volume
+        params["include_product_metadata"] = include_product_metadata
+
+        if category:
+            params["category"] = category
+
+        if tags:
+            params["tags"] = tags
+
+        return await self._get_model(SeriesList, "series", params)
+
+    async def get_open_markets_general(self, limit=100, status="open", compact=False) -> MarketsResponse | MarketTable:
+
+        return await self._markets({"limit": limit, "status": status}, compact)
+
+    async def get_markets_from_series_ticker(self, series_ticker, limit=1000, status="open", compact=False) -> MarketsResponse | MarketTable:
+
+        return await self._markets({
+            "limit": limit,
+            "status": status,
+            "series_ticker": series_ticker
+        }, compact)
+
+    @coalesced
+    async def get_single_market_from_market_ticker(self, market_ticker) -> Market:
+
+        return await self._get_model(Market, f"markets/{market_ticker}")
+
+    async def _market_chunks(self, filter_name: str, chunks: list[list[str]], status, page_size: int) -> list[dict]:
+        '''See KalshiClient._market_chunks'''
+
+        async def fetch(chunk):
+            params = {"status": status, filter_name: ",".join(chunk)}
+            return [market async for page in self._paginate("markets", params, page_size) for market in page["markets"]]
+
+        pages = await self._bounded_gather([fetch(chunk) for chunk in chunks], WINDOW_CONCURRENCY)
+
+        return [market for markets in pages for market in markets]
+
+    async def get_markets(self, tickers: list[str], status=None, page_size=1000) -> dict[str, Market]:
+        '''See KalshiClient.get_markets'''
+
+        found = {market["ticker"]: market for market in
+                 await self._market_chunks("tickers", chunked(tickers, MAX_TICKERS_PER_REQUEST), status, page_size)}
+
+        return {ticker: self._parse(Market, found[ticker]) for ticker in dict.fromkeys(tickers) if ticker in found}
+
+    async def get_markets_by_event(self, event_tickers: list[str], status=None, page_size=1000) -> dict[str, list[Market]]:
+        '''See KalshiClient.get_markets_by_event'''
+
+        grouped: dict[str, list[Market]] = {event_ticker: [] for event_ticker in dict.fromkeys(event_tickers)}
+
+        for market in await self._market_chunks("event_ticker", chunked(event_tickers, MAX_EVENTS_PER_REQUEST), status, page_size):
+            if market["event_ticker"] in grouped:
+                grouped[market["event_ticker"]].append(self._parse(Market, market))
+
+        return grouped
+
+    async def get_market_candle_sticks(self, series: Series, market: Market, period_interval=DEFAULT_TIMEFRAME, include_latest_before_start=True, as_frame=False,
+                                       start_ts=None, end_ts=None, as_columns=False) -> MarketCandlestickResponse:
+        '''See KalshiClient.get_market_candle_sticks'''
+
+        series_ticker = getattr(series, 'ticker', None)
+        market_ticker = getattr(market, 'ticker', None)
+
+        if not series_ticker or not market_ticker:
+            print(
+                f"Skipping Series-{series_ticker if series_ticker is not None else 'DNE'} : Market-{market_ticker if market_ticker is not None else 'DNE'}")
+            return None
+
+        start_ts = start_ts if start_ts is not None else market.open_epoch
+        end_ts = end_ts if end_ts is not None else get_end_ts()
+        path = f"series/{series_ticker}/markets/{market_ticker}/candlesticks"
+
+        # Long ranges are split into windows the API will answer in full, fetched concurrently, then merged
+        async def fetch(window_start, window_end):
+            return await self._get(path, params={
+                "start_ts": window_start,
+                "end_ts": window_end,
+                "period_interval": period_interval,
+                "include_latest_before_start": include_latest_before_start and window_start == start_ts
+            })
+
+        pages = await self._fetch_windows(fetch, candle_windows(start_ts, end_ts, period_interval))
+
+        # The frame / column decoders skip the pydantic model, so their malformed-payload errors are mapped here
+        try:
+            raw = {"ticker": pages[0].get("ticker", market_ticker), "candlesticks": merge_candles([p["candlesticks"] for p in pages])}
+
+            # pandas is only loaded when a frame is asked for
+            if as_frame:
+                from ..utils.candlestick import to_ta_frame
+                return to_ta_frame(raw, period_interval)
+
+            if as_columns:
+                from ..utils.candlestick import decode_candlestick_columns
+                return decode_candlestick_columns(raw["candlesticks"])
+
+        except (KeyError, TypeError, ValueError) as exc:
+            raise KalshiDecodeError("candlesticks", path, str(exc)) from exc
+
+        return self._parse(MarketCandlestickResponse, raw)
+
+    async def get_events(self, limit=100, status="open", series_ticker=None, with_milestones=True) -> EventsResponse:
+        '''Batch Introduction to Event Data: Nothing on Volume, Inner Markets, ...'''
+
+        return await self._get_model(EventsResponse, "events", params={
+            "limit": limit,
+            "status": status,
+            "series_ticker": series_ticker,
+            "with_milestones": with_milestones
+        })
+
+    @coalesced
+    async def get_event(self, event_ticker) -> EventResponse:
+        '''More Specific Single Event -> All Markets Detailed Data'''
+
+        return await self._get_model(EventResponse, f"events/{event_ticker}", params={
+            "with_nested_markets": True
+        })
+
+    async def get_event_candle_sticks(self, event: Event, period_interval=DEFAULT_TIMEFRAME, start_ts=None, end_ts=None) -> EventCandlesticksResponse:
+        '''See KalshiClient.get_event_candle_sticks'''
+
+        start_ts = start_ts if start_ts is not None else get_start_ts(event.markets)
+        end_ts = end_ts if end_ts is not None else get_end_ts()
+
+        path = f"series/{event.series_ticker}/events/{event.event_ticker}/candlesticks"
+        max_candles = MAX_CANDLES_PER_REQUEST // max(1, len(event.markets or []))
+
+        async def fetch(window_start, window_end):
+            responses = []
+            reached = window_start - 1     # Last second of the window the server has covered
+
+            while window_start <= window_end:
+                response = await self._get(path, params={
+                    "start_ts": window_start,
+                    "end_ts": window_end,
+                    "period_interval": period_interval
+                })
+                responses.append(response)
+
+                adjusted = response.get("adjusted_end_ts", window_end)
+                if adjusted < window_start:
+                    break
+
+                reached = min(adjusted, window_end)
+                if adjusted >= window_end:
+                    break
+                window_start = adjusted + 1
+
+            return responses, reached
+
+        windows = candle_windows(start_ts, end_ts, period_interval, max_candles)
+        fetched = await self._fetch_windows(fetch, windows)
+
+        # A window the server stopped short in is a gap: report coverage up to it, not the requested end_ts
+        adjusted_end_ts = covered_until(windows, [reached for _, reached in fetched], end_ts)
+        raw = merge_event_candles([r for responses, _ in fetched for r in responses], adjusted_end_ts)
+
+        return self._parse(EventCandlesticksResponse, raw)
+
+    # --- FAN-OUT HELPERS ---
+
+    async def _bounded_gather(self, coros, concurrency: int) -> list:
+        '''Run coroutines with at most `concurrency` in flight; results keep input order'''
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(coro):
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(run(c) for c in coros))
+
+    async def gather_market_candlesticks(self, series: Series, markets: list[Market], period_interval=DEFAULT_TIMEFRAME,
+                                         concurrency=DEFAULT_CONCURRENCY) -> list[MarketCandlestickResponse]:
+        '''Candles for every market of a series, `concurrency` requests at a time (None for skipped markets)'''
+
+        return await self._bounded_gather(
+            [self.get_market_candle_sticks(series, market, period_interval) for market in markets], concurrency)
+
+    async def gather_events(self, event_tickers: list[str], concurrency=DEFAULT_CONCURRENCY) -> list[EventResponse]:
+
+        return await self._bounded_gather([self.get_event(t) for t in event_tickers], concurrency)
+
+    async def gather_series(self, series_tickers: list[str], concurrency=DEFAULT_CONCURRENCY) -> list[Series]:
+
+        return await self._bounded_gather([self.get_series(t) for t in series_tickers], concurrency)
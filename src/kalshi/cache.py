@@ -0,0 +1,210 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+'''
+Response cache for reference endpoints (series, tags, events) that barely change between calls.
+
+Sits between the client methods and the transport: fresh entries are served without touching the network,
+stale entries carrying an ETag / Last-Modified are revalidated with a conditional GET (a 304 just renews the TTL).
+'''
+
+# Seconds a response stays fresh, per client endpoint name. Endpoints not listed are never cached.
+DEFAULT_TTLS: dict[str, float] = {
+    "tags": 24 * 60 * 60,
+    "series": 60 * 60,
+    "series_list": 60 * 60,
+    "event": 5 * 60,
+}
+
+
+@dataclass
+class CacheEntry:
+    data: dict                                               # Decoded JSON body
+    expires_at: float                                        # time.time() after which the entry is stale
+    etag: str | None = None                                  # ETag header, for If-None-Match
+    last_modified: str | None = None                         # Last-Modified header, for If-Modified-Since
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def validators(self) -> dict | None:
+        '''Conditional request headers, or None if the server gave us nothing to revalidate with'''
+
+        headers = {}
+
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers or None
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0                                            # Served fresh from the cache
+    misses: int = 0                                          # Missing or stale - went to the network
+    revalidated: int = 0                                     # Misses the server answered with 304 Not Modified
+    evictions: int = 0                                       # Entries dropped to respect the size bound
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class MemoryCache:
+    '''Size-bounded in-memory LRU backend'''
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> int:
+        '''Store an entry; returns how many old entries were evicted'''
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+
+            return evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache:
+    '''
+    Size-bounded on-disk backend: one JSON file per entry, so the cache survives process restarts
+    (cron-style jobs). Least recently used by file mtime is evicted first.
+    '''
+
+    def __init__(self, root: str | os.PathLike, max_entries: int = 16384):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    def __len__(self):
+        return sum(1 for _ in self.root.glob("*.json"))
+
+    def get(self, key: str) -> CacheEntry | None:
+        path = self._path(key)
+
+        try:
+            entry = CacheEntry(**json.loads(path.read_bytes()))
+        except (FileNotFoundError, ValueError, TypeError):
+            return None
+
+        os.utime(path)  # Mark as recently used
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> int:
+        path = self._path(key)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+
+        tmp.write_text(json.dumps(asdict(entry)))
+        os.replace(tmp, path)
+
+        with self._lock:
+            files = list(self.root.glob("*.json"))
+            overflow = len(files) - self.max_entries
+
+            if overflow <= 0:
+                return 0
+
+            files.sort(key=lambda f: f.stat().st_mtime)
+            for f in files[:overflow]:
+                f.unlink(missing_ok=True)
+
+            return overflow
+
+    def clear(self):
+        for f in self.root.glob("*.json"):
+            f.unlink(missing_ok=True)
+
+
+class ResponseCache:
+    '''
+    Per-endpoint TTL cache in front of the transport.
+
+    @params
+    backend: MemoryCache (default) or DiskCache
+    ttls: endpoint name -> seconds fresh; merged over DEFAULT_TTLS (set an endpoint to 0 to disable it)
+    '''
+
+    def __init__(self, backend: MemoryCache | DiskCache | None = None, ttls: dict[str, float] | None = None):
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.stats = CacheStats()
+
+    def ttl(self, endpoint: str | None) -> float:
+        return self.ttls.get(endpoint, 0)
+
+    @staticmethod
+    def key(path: str, params: dict | None) -> str:
+        # None params are never sent, so they must not split the key either
+        items = sorted((k, str(v)) for k, v in (params or {}).items() if v is not None)
+        return f"{path}?{items}"
+
+    def lookup(self, key: str) -> tuple[dict | None, CacheEntry | None]:
+        '''(fresh data, None) on a hit; (None, stale entry or None) when the caller has to go to the network'''
+
+        entry = self.backend.get(key)
+
+        if entry is not None and entry.fresh:
+            self.stats.hits += 1
+            return entry.data, None
+
+        self.stats.misses += 1
+        return None, entry
+
+    def store(self, key: str, data: dict, ttl: float, headers) -> None:
+
+        entry = CacheEntry(data=data, expires_at=time.time() + ttl,
+                           etag=headers.get("ETag"), last_modified=headers.get("Last-Modified"))
+
+        self.stats.evictions += self.backend.set(key, entry)
+
+    def renew(self, key: str, entry: CacheEntry, ttl: float) -> dict:
+        '''Server confirmed the stale entry (304): extend its TTL and serve it'''
+
+        self.stats.revalidated += 1
+
+        entry.expires_at = time.time() + ttl
+        self.stats.evictions += self.backend.set(key, entry)
+
+        return entry.data
+
+    def clear(self):
+        self.backend.clear()
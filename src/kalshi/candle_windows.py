@@ -0,0 +1,72 @@
+'''
+Splitting long candlestick ranges into server-legal request windows, and merging the answers back
+
+The candlestick endpoints return at most MAX_CANDLES_PER_REQUEST bars per call. A market's full 1-minute history
+blows through that in a few days; the market endpoint then silently truncates, the event endpoint reports how far
+it got in `adjusted_end_ts`. Windows are sized so each request stays under the cap, and an event window is
+re-requested from `adjusted_end_ts` until it is covered. If the server stops making progress the merged
+response's `adjusted_end_ts` is where coverage first stops (covered_until), not the requested end.
+'''
+
+MAX_CANDLES_PER_REQUEST = 5000    # Per call; for event candlesticks the cap is shared by all markets in the event
+WINDOW_CONCURRENCY = 4            # Windows fetched in parallel per call
+
+
+def candle_windows(start_ts: int, end_ts: int, period_interval: int, max_candles: int = MAX_CANDLES_PER_REQUEST) -> list[tuple[int, int]]:
+    '''Consecutive, non-overlapping [start, end] windows (inclusive, Unix seconds) of at most max_candles bars each'''
+
+    span = period_interval * 60 * max(1, max_candles)
+    windows = []
+
+    window_start = start_ts
+    while window_start <= end_ts:
+        window_end = min(end_ts, window_start + span - 1)
+        windows.append((window_start, window_end))
+        window_start = window_end + 1
+
+    return windows or [(start_ts, end_ts)]
+
+
+def covered_until(windows: list[tuple[int, int]], reached: list[int], end_ts: int) -> int:
+    '''
+    adjusted_end_ts of the merged response: the furthest time covered by the first window the server didn't finish
+    (windows in time order, reached[i] = how far window i got), or end_ts when every window was covered
+    '''
+
+    for (_, window_end), got_to in zip(windows, reached):
+        if got_to < window_end:
+            return got_to
+
+    return end_ts
+
+
+def merge_candles(pages: list[list[dict]]) -> list[dict]:
+    '''Concatenate raw candle pages, dropping duplicate end_period_ts (later pages win) and sorting by time'''
+
+    by_ts = {}
+
+    for page in pages:
+        for candle in page:
+            by_ts[candle["end_period_ts"]] = candle
+
+    return [by_ts[ts] for ts in sorted(by_ts)]
+
+
+def merge_event_candles(responses: list[dict], adjusted_end_ts: int) -> dict:
+    '''Merge raw event candlestick responses (any window order) into one response covering up to adjusted_end_ts'''
+
+    tickers: list[str] = []
+    pages: dict[str, list[list[dict]]] = {}
+
+    for response in responses:
+        for ticker, candles in zip(response["market_tickers"], response["market_candlesticks"]):
+            if ticker not in pages:
+                tickers.append(ticker)
+                pages[ticker] = []
+            pages[ticker].append(candles)
+
+    return {
+        "market_tickers": tickers,
+        "market_candlesticks": [merge_candles(pages[t]) for t in tickers],
+        "adjusted_end_ts": adjusted_end_ts,
+    }
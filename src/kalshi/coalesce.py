@@ -0,0 +1,114 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import Future
+from .decode import current_policy
+
+'''
+Request coalescing: single-flight for identical calls, chunking for batch lookups
+
+Parallel scanners tend to ask for the same event / series / market at the same moment. A single-flight group
+runs the first caller's request and parks everyone else with the same key on it, so N identical concurrent
+calls cost one HTTP round trip and one parsed model, shared by all N. The active decode policy is part of every
+key, so a STRICT caller never gets handed a model a concurrent TRUSTED caller built. Nothing is cached: once the call
+finishes the key is free again, and the next caller goes back to the network (or the ResponseCache).
+
+The batch helpers go the other way, turning many single-ticker lookups into a few /markets list calls.
+'''
+
+MAX_TICKERS_PER_REQUEST = 100   # Market tickers per /markets?tickers=... request (keeps the URL well under 8 KB)
+MAX_EVENTS_PER_REQUEST = 10     # Event tickers per /markets?event_ticker=... request
+
+
+def chunked(items: list, size: int) -> list[list]:
+    '''Order-preserving, de-duplicated chunks of at most `size`'''
+
+    unique = list(dict.fromkeys(items))
+    return [unique[i:i + size] for i in range(0, len(unique), size)]
+
+
+class SingleFlight:
+    '''Thread-safe single-flight group: do(key, fn) runs fn once per key among overlapping callers'''
+
+    def __init__(self):
+        self._calls: dict = {}
+        self._lock = threading.Lock()
+        self.shared = 0   # Calls answered by joining another caller's request
+
+    def do(self, key, fn):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    '''
+    asyncio single-flight group. The shared call runs as its own task, so a caller being cancelled
+    doesn't cancel the request for everyone else waiting on it.
+    '''
+
+    def __init__(self):
+        self._calls: dict = {}
+        self.shared = 0
+
+    async def do(self, key, fn):
+        task = self._calls.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.shared += 1
+
+        return await asyncio.shield(task)
+
+
+def _key(self, method, args, kwargs) -> tuple:
+    return (method.__name__, current_policy(self.decode), args, tuple(sorted(kwargs.items())))
+
+
+def coalesced(method):
+    '''Share one in-flight call of a client method among concurrent callers with the same arguments'''
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._flights is None:
+            return method(self, *args, **kwargs)
+
+        return self._flights.do(_key(self, method, args, kwargs), lambda: method(self, *args, **kwargs))
+
+    return wrapper
+
+
+def coalesced_async(method):
+    '''coalesced() for AsyncKalshiClient coroutines'''
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if self._flights is None:
+            return await method(self, *args, **kwargs)
+
+        return await self._flights.do(_key(self, method, args, kwargs), lambda: method(self, *args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,189 @@
+import contextvars
+import json
+import os
+import random
+import types
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Union, get_args, get_origin
+from pydantic import BaseModel
+from pydantic_core import SchemaValidator, core_schema
+
+'''
+Response decoding: JSON backend and how models get built
+
+    STRICT   model(**data) - full pydantic validation of every field (the default)
+    TRUSTED  models assembled straight from the decoded JSON, no per-field validation. Nested models are still
+             models (Event.markets[0].price_ranges[0] is a PriceRange), missing optional fields get their
+             defaults, unknown fields are dropped - but types are whatever the exchange sent.
+
+TRUSTED is for high-volume sweeps where the exchange's schema is taken as given: one odd field doesn't fail the
+call. Validation isn't gone, it's deferred: `sample_rate` re-validates that fraction of responses in full (schema
+drift still surfaces, as KalshiDecodeError), and debug mode (DecodePolicy(debug=True), or KALSHI_DECODE_DEBUG=1)
+validates everything. pydantic-core builds the models either way, and instance construction rather than field
+checks is most of its cost, so TRUSTED saves little per model - the decode speedup comes from the byte paths below.
+
+Bodies are parsed from the raw bytes. Single-model responses go straight into their model in one pass
+(build_json: pydantic-core's JSON parser, no intermediate dicts); responses that are cached, merged or paged are
+decoded to dicts first, with orjson when it is installed and stdlib json otherwise.
+
+    client = KalshiClient(key, decode=DecodePolicy(TRUSTED, sample_rate=0.01))   # per client
+    with decoding(TRUSTED):                                                       # per call (any client, this context)
+        client.get_event(ticker)
+'''
+
+STRICT = "strict"
+TRUSTED = "trusted"
+
+try:
+    import orjson
+except ImportError:   # Optional speedup
+    orjson = None
+
+
+def loads(body: bytes | str):
+    '''Raw response body -> Python objects (orjson if available); ValueError on malformed JSON'''
+
+    if orjson is not None:
+        return orjson.loads(body)
+
+    return json.loads(body)
+
+
+@dataclass(frozen=True)
+class DecodePolicy:
+    mode: str = STRICT
+    sample_rate: float = 0.0        # TRUSTED: fraction of responses also validated in full
+    debug: bool = False             # Validate everything whatever the mode
+
+    def __post_init__(self):
+        if self.mode not in (STRICT, TRUSTED):
+            raise ValueError(f"unknown decode mode '{self.mode}' (expected '{STRICT}' or '{TRUSTED}')")
+        if not 0.0 <= self.sample_rate <= 1.0:
+            raise ValueError("sample_rate must be in [0, 1]")
+
+    def validates(self) -> bool:
+        '''Does this response get full validation?'''
+
+        if self.mode == STRICT or self.debug or _DEBUG:
+            return True
+
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+
+_DEBUG = os.environ.get("KALSHI_DECODE_DEBUG", "").lower() in ("1", "true", "yes")
+
+_override: contextvars.ContextVar[DecodePolicy | None] = contextvars.ContextVar("kalshi_decode_policy", default=None)
+
+
+def as_policy(decode: DecodePolicy | str | None) -> DecodePolicy:
+    if decode is None:
+        return DecodePolicy()
+    if isinstance(decode, DecodePolicy):
+        return decode
+    return DecodePolicy(decode)
+
+
+@contextmanager
+def decoding(decode: DecodePolicy | str):
+    '''Override every client's decode policy inside this block (thread / task local)'''
+
+    token = _override.set(as_policy(decode))
+    try:
+        yield
+    finally:
+        _override.reset(token)
+
+
+def current_policy(default: DecodePolicy) -> DecodePolicy:
+    override = _override.get()
+    return override if override is not None else default
+
+
+# --- TRUSTED CONSTRUCTION ---
+
+# Model -> core schema / validator of its "trusted twin": same model class, same fields, defaults and nesting,
+# but every leaf field accepts any value as-is. pydantic-core still builds the instances (nested models included),
+# which is faster than any pure-Python construction - model_construct() is ~2x slower than validating.
+_schemas: dict[type, dict] = {}
+_validators: dict[type, SchemaValidator] = {}
+
+
+def _field_schema(annotation) -> dict:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _model_schema(annotation)
+
+    origin = get_origin(annotation)
+
+    if origin in (Union, types.UnionType):
+        options = [a for a in get_args(annotation) if a is not type(None)]
+        # Optional[X] keeps X's structure; unions of several types are taken as-is rather than guessed at
+        if len(options) == 1:
+            return core_schema.nullable_schema(_field_schema(options[0]))
+        return core_schema.any_schema()
+
+    if origin is list:
+        args = get_args(annotation)
+        return core_schema.list_schema(_field_schema(args[0]) if args else core_schema.any_schema())
+
+    return core_schema.any_schema()
+
+
+def _model_schema(model: type) -> dict:
+    schema = _schemas.get(model)
+
+    if schema is None:
+        fields = {}
+
+        for name, info in model.model_fields.items():
+            field = _field_schema(info.annotation)
+
+            if info.default_factory is not None:
+                field = core_schema.with_default_schema(field, default_factory=info.default_factory)
+            elif not info.is_required():
+                field = core_schema.with_default_schema(field, default=info.default)
+
+            fields[name] = core_schema.model_field(field)
+
+        schema = _schemas[model] = core_schema.model_schema(model, core_schema.model_fields_schema(fields))
+
+    return schema
+
+
+def trusted_validator(model: type) -> SchemaValidator:
+    validator = _validators.get(model)
+
+    if validator is None:
+        validator = _validators[model] = SchemaValidator(_model_schema(model))
+
+    return validator
+
+
+def construct(model: type, data: dict):
+    '''
+    `model` from decoded JSON without per-field validation. Unlike model_construct() nested dicts become nested
+    models; missing required fields still raise ValidationError. The input dict is not modified.
+    '''
+
+    return trusted_validator(model).validate_python(data)
+
+
+def build(model: type, data: dict, policy: DecodePolicy):
+    '''`model` from decoded JSON under `policy`; raises pydantic ValidationError / TypeError on bad data'''
+
+    if policy.validates():
+        return model(**data)
+
+    return construct(model, data)
+
+
+def build_json(model: type, body: bytes | str, policy: DecodePolicy):
+    '''
+    `model` straight from a response body in one pass - pydantic-core parses the JSON and builds the models
+    without materialising the intermediate dicts. Malformed JSON raises ValidationError like a schema mismatch.
+    '''
+
+    if policy.validates():
+        return model.model_validate_json(body)
+
+    return trusted_validator(model).validate_json(body)
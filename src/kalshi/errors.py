@@ -0,0 +1,37 @@
+'''
+Typed client errors - what callers catch instead of requests / httpx / pydantic internals
+
+KalshiError
+ ├── KalshiTransportError        (connection reset, DNS, TLS, ...)
+ │    └── KalshiTimeoutError      (a single attempt timed out, or the per-call deadline ran out)
+ ├── KalshiHTTPError             (non-2xx status after retries)
+ └── KalshiDecodeError           (body isn't JSON, or doesn't fit the pydantic model)
+'''
+
+
+class KalshiError(Exception):
+    pass
+
+
+class KalshiTransportError(KalshiError):
+    pass
+
+
+class KalshiTimeoutError(KalshiTransportError):
+    pass
+
+
+class KalshiHTTPError(KalshiError):
+
+    def __init__(self, status_code: int, url: str, body: str = ""):
+        self.status_code = status_code
+        self.url = url
+        self.body = body[:500]
+        super().__init__(f"HTTP {status_code} from {url}: {self.body}")
+
+
+class KalshiDecodeError(KalshiError):
+
+    def __init__(self, what: str, url_or_model: str, detail: str):
+        self.what = what
+        super().__init__(f"Could not decode {what} ({url_or_model}): {detail}")
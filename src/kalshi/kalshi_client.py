@@ -1,10 +1,20 @@
-import requests
-from .models import UnwrappedCandlestick, MarketCandlestickResponse, Series, PriceRange, MVESelectedLeg, Market, MarketsResponse, TagList, SeriesList,EventsResponse, Event, EventResponse,  Candlestick, CandlestickOHLC, CandlestickPriceOHLC, EventCandlesticksResponse
+from .transport import HttpTransport, BASE_URL, DEFAULT_POOL_MAXSIZE, DEFAULT_TIMEOUT, endpoint_name
+from .cache import ResponseCache
+from .rate_limit import RateLimiter
+from .resilience import RetryPolicy, HedgePolicy, LatencyTracker
+from .pipeline import RequestPipeline, submit, pool_map
+from .metrics import Metrics, CACHE_HIT, CACHE_MISS, CACHE_REVALIDATED
+from .decode import DecodePolicy, as_policy, current_policy, build, build_json
+from .coalesce import SingleFlight, coalesced, chunked, MAX_TICKERS_PER_REQUEST, MAX_EVENTS_PER_REQUEST
+from .candle_windows import candle_windows, covered_until, merge_candles, merge_event_candles, MAX_CANDLES_PER_REQUEST, WINDOW_CONCURRENCY
+from .errors import KalshiDecodeError
+from .models import UnwrappedCandlestick, MarketCandlestickResponse, Series, PriceRange, MVESelectedLeg, Market, MarketsResponse, TagList, SeriesList, SeriesResponse, EventsResponse, Event, EventResponse,  Candlestick, CandlestickOHLC, CandlestickPriceOHLC, EventCandlesticksResponse, MarketTable, MarketTableBuilder
 from ..trading_constants import DEFAULT_TIMEFRAME
-from ..utils import pydantic_model_to_dataframe, iso_to_unix, get_end_ts, get_start_ts, unwrap_candlesticks, to_ta_data, plot_rsi
-from ..technical_analysis import crossover, crossunder, const_to_series
-import pandas as pd
-import pandas_ta as ta
+from ..utils.time import get_end_ts, get_start_ts
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+from pydantic import ValidationError
+import time
 
 '''
 KALSHI Semantics: Series v.s. Event v.s. Markets
@@ -26,39 +36,260 @@ Markets:
 '''
 
 
-class KalshiClient:
+class KalshiClient(RequestPipeline):
 
     API_KEY: str
 
-    def __init__(self, API_KEY):
+    def __init__(self, API_KEY, transport: HttpTransport | None = None, base_url=BASE_URL,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, timeout=DEFAULT_TIMEOUT, cache: ResponseCache | None = None,
+                 rate_limiter: RateLimiter | None = None, retry: RetryPolicy = RetryPolicy(), hedge: HedgePolicy | None = None,
+                 metrics: Metrics | None = None, coalesce: bool = True, decode: DecodePolicy | str | None = None):
         self.API_KEY = API_KEY
 
-    def get_tags_by_categories(self) -> TagList:
-        url = "https://api.elections.kalshi.com/trade-api/v2/search/tags_by_categories"
+        # Optional response cache for reference endpoints (see cache.DEFAULT_TTLS)
+        self.cache = cache
 
-        response = requests.get(url)
+        # Optional client-side pacing; share one RateLimiter between clients that share an API key
+        self.rate_limiter = rate_limiter
 
-        data = response.json()
+        # Retries / deadlines always on; hedging is opt-in and races duplicates on a small thread pool
+        self.retry = retry
+        self.hedge = hedge
+        self.latency = LatencyTracker()
 
-        tags = TagList(**data)
+        # Optional instrumentation (see metrics.Metrics); None costs one check per call
+        self.metrics = metrics
 
-        return tags
-    
-    def get_series(self, series_ticker: str, include_volume=True) -> Series:
+        # STRICT (validate everything) or TRUSTED (see decode.py); decode.decoding() overrides it per call
+        self.decode = as_policy(decode)
 
-        # Insert Series into Base URL Format
-        url = f"https://api.elections.kalshi.com/trade-api/v2/series/{series_ticker}"
+        # Identical concurrent calls share one request and one parsed result (see coalesce.SingleFlight)
+        self._flights = SingleFlight() if coalesce else None
+        self._hedge_pool = ThreadPoolExecutor(max_workers=pool_maxsize) if hedge is not None else None
 
-        # Call HTTP Endpoint, and Parse to JSON
-        response = requests.get(url, params={"include_volume": include_volume})
-        series_data = response.json()
+        # Share a caller-provided transport, or own one (and close it with the client)
+        self._owns_transport = transport is None
+        self.transport = transport or HttpTransport(base_url=base_url, pool_maxsize=pool_maxsize, timeout=timeout)
 
-        series_data = series_data['series']  # Remove Outer Nesting
+    def close(self):
+        if self._hedge_pool is not None:
+            # Losing hedges are abandoned, not awaited
+            self._hedge_pool.shutdown(wait=False)
 
-        # Unpack into Pydantic Model
-        series = Series(**series_data)
+        if self._owns_transport:
+            self.transport.close()
 
-        return series
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _parse(self, model, data: dict):
+        '''Build a response model, surfacing schema mismatches as KalshiDecodeError'''
+
+        start = time.perf_counter() if self.metrics is not None else None
+
+        try:
+            parsed = build(model, data, current_policy(self.decode))
+        except (ValidationError, TypeError) as exc:
+            raise KalshiDecodeError(model.__name__, model.__module__, str(exc)) from exc
+
+        if start is not None:
+            self.metrics.stage(f"model.{model.__name__}", time.perf_counter() - start)
+
+        return parsed
+
+    def _table(self, builder: MarketTableBuilder, markets: list[dict]) -> None:
+        '''Add raw markets to a compact table, surfacing schema mismatches as KalshiDecodeError'''
+
+        start = time.perf_counter() if self.metrics is not None else None
+
+        try:
+            builder.extend(markets)
+        except ValueError as exc:
+            raise KalshiDecodeError(MarketTable.__name__, MarketTable.__module__, str(exc)) from exc
+
+        if start is not None:
+            self.metrics.stage("model.MarketTable", time.perf_counter() - start)
+
+    def _decode(self, model, response):
+        '''Response body -> model in one pass, surfacing malformed JSON and schema mismatches as KalshiDecodeError'''
+
+        start = time.perf_counter() if self.metrics is not None else None
+
+        try:
+            parsed = build_json(model, response.content, current_policy(self.decode))
+        except (ValidationError, TypeError) as exc:
+            raise KalshiDecodeError(model.__name__, str(response.url), str(exc)) from exc
+
+        if start is not None:
+            self.metrics.stage(f"model.{model.__name__}", time.perf_counter() - start)
+
+        return parsed
+
+    def _get_model(self, model, path: str, params: dict | None = None):
+        '''
+        _parse(model, _get(path, params)) without the intermediate dicts: the body goes straight into the model.
+        Cached endpoints keep the dict path, since the cache stores decoded JSON.
+        '''
+
+        if self.cache is not None and self.cache.ttl(endpoint_name(path)):
+            return self._parse(model, self._get(path, params))
+
+        def fetch():
+            return self._decode(model, self._send(path, params=params))
+
+        if self._flights is None:
+            return fetch()
+
+        return self._flights.do(("MODEL", model, current_policy(self.decode), ResponseCache.key(path, params)), fetch)
+
+    def _markets(self, params: dict, compact: bool) -> MarketsResponse | MarketTable:
+        '''One /markets page as a MarketsResponse, or as a MarketTable when compact'''
+
+        if not compact:
+            return self._get_model(MarketsResponse, "markets", params)
+
+        data = self._get("markets", params=params)
+        builder = MarketTableBuilder()
+        self._table(builder, data["markets"])
+
+        return builder.build(data.get("cursor"))
+
+    def _get(self, path: str, params: dict | None = None, timeout=None) -> dict:
+        '''
+        Every endpoint goes through here: single-flight (identical in-flight GETs share one response)
+        -> response cache (if configured) -> retries -> pooled keep-alive transport
+        '''
+
+        if self._flights is None:
+            return self._get_once(path, params, timeout)
+
+        return self._flights.do(("GET", ResponseCache.key(path, params)), lambda: self._get_once(path, params, timeout))
+
+    def _get_once(self, path: str, params: dict | None, timeout) -> dict:
+
+        ttl = self.cache.ttl(endpoint_name(path)) if self.cache is not None else 0
+
+        if not ttl:
+            return self._json(self._send(path, params=params, timeout=timeout))
+
+        key = self.cache.key(path, params)
+        data, stale = self.cache.lookup(key)
+
+        if self.metrics is not None:
+            self.metrics.cache(endpoint_name(path), CACHE_HIT if data is not None else CACHE_MISS)
+
+        if data is not None:
+            return data
+
+        # Stale entry with an ETag / Last-Modified -> conditional GET
+        response = self._send(path, params=params, timeout=timeout, headers=stale.validators() if stale else None)
+
+        if response.status_code == 304 and stale is not None:
+            if self.metrics is not None:
+                self.metrics.cache(endpoint_name(path), CACHE_REVALIDATED)
+            return self.cache.renew(key, stale, ttl)
+
+        data = self._json(response)
+
+        if response.status_code == 200:
+            self.cache.store(key, data, ttl, response.headers)
+
+        return data
+
+    def _fetch_windows(self, fetch, windows: list[tuple[int, int]]) -> list:
+        '''fetch(start, end) for every window, concurrently when there is more than one; results in window order'''
+
+        if len(windows) == 1:
+            return [fetch(*windows[0])]
+
+        with ThreadPoolExecutor(max_workers=min(WINDOW_CONCURRENCY, len(windows))) as pool:
+            return pool_map(pool, lambda window: fetch(*window), windows)
+
+    def _paginate(self, path: str, params: dict, limit: int) -> Iterator[dict]:
+        '''
+        Follow a list endpoint's cursor lazily, yielding one raw page at a time.
+
+        The next page is requested on a background thread as soon as the current one arrives,
+        so the network round trip overlaps with whatever the caller does with the page.
+        '''
+
+        params = {**params, "limit": limit}
+
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = submit(prefetcher, self._get, path, params)
+
+            while pending is not None:
+                page = pending.result()
+
+                # Empty / missing cursor marks the last page
+                cursor = page.get("cursor")
+                pending = submit(prefetcher, self._get, path, {**params, "cursor": cursor}) if cursor else None
+
+                yield page
+
+    def iter_markets(self, status="open", series_ticker=None, event_ticker=None, tickers=None, page_size=1000) -> Iterator[Market]:
+        '''Every market matching the filters, across all pages, with flat memory'''
+
+        params = {"status": status, "series_ticker": series_ticker, "event_ticker": event_ticker,
+                  "tickers": ",".join(tickers) if tickers else None}
+
+        for page in self._paginate("markets", params, page_size):
+            for market in page["markets"]:
+                yield self._parse(Market, market)
+
+    def get_market_table(self, status="open", series_ticker=None, event_ticker=None, tickers=None, page_size=1000) -> MarketTable:
+        '''Every market matching the filters as one compact MarketTable, built page by page (no Market objects)'''
+
+        params = {"status": status, "series_ticker": series_ticker, "event_ticker": event_ticker,
+                  "tickers": ",".join(tickers) if tickers else None}
+
+        builder = MarketTableBuilder()
+
+        for page in self._paginate("markets", params, page_size):
+            self._table(builder, page["markets"])
+
+        return builder.build()
+
+    def iter_events(self, status="open", series_ticker=None, with_nested_markets=False, page_size=200) -> Iterator[Event]:
+        '''Every event matching the filters, across all pages'''
+
+        params = {"status": status, "series_ticker": series_ticker, "with_nested_markets": with_nested_markets}
+
+        for page in self._paginate("events", params, page_size):
+            for event in page["events"]:
+                yield self._parse(Event, event)
+
+    def iter_series(self, category=None, tags=None, include_product_metadata=False, include_volume=True, page_size=1000) -> Iterator[Series]:
+        '''Every series matching the filters; single-page responses simply stop after the first page'''
+
+        params = {
+            "category": category,
+            "tags": tags,
+            "include_product_metadata": include_product_metadata,
+            "include_volume": include_volume
+        }
+
+        for page in self._paginate("series", params, page_size):
+            for series in page["series"]:
+                yield self._parse(Series, series)
+
+    @coalesced
+    def get_tags_by_categories(self) -> TagList:
+
+        tags = self._get_model(TagList, "search/tags_by_categories")
+
+        return tags
+    
+    @coalesced
+    def get_series(self, series_ticker: str, include_volume=True) -> Series:
+
+        # Pull + Unpack (the outer {"series": ...} nesting is part of the model, so a missing key is a KalshiDecodeError)
+        response = self._get_model(SeriesResponse, f"series/{series_ticker}", params={"include_volume": include_volume})
+
+        return response.series
 
     def get_series_list(self, category=None, tags=None, include_product_metadata=False, include_volume=True) -> SeriesList:
 
@@ -73,69 +304,88 @@ class KalshiClient:
         if tags:
             params["tags"] = tags
 
-        url = "https://api.elections.kalshi.com/trade-api/v2/series"
+        series = self._get_model(SeriesList, "series", params)
 
-        response = requests.get(url, params=params)
+        return series
 
-        data = response.json()
+    def get_open_markets_general(self, limit=100, status="open", compact=False) -> MarketsResponse | MarketTable:
+        '''compact: return a MarketTable instead of a MarketsResponse'''
 
-        series = SeriesList(**data)
+        # Fetch and unpack straight into pydantic (or the compact table)
+        markets_response = self._markets({"limit": limit, "status": status}, compact)
 
-        return series
+        return markets_response
 
-    def get_open_markets_general(self, limit=100, status="open") -> MarketsResponse:
+    def get_markets_from_series_ticker(self, series_ticker,  limit=1000, status="open", compact=False) -> MarketsResponse | MarketTable:
+        '''
+        First page only - use iter_markets(series_ticker=...) / get_market_table(series_ticker=...) for series with
+        more than `limit` markets. compact: return a MarketTable instead of a MarketsResponse
+        '''
 
-        # Join URL params after first w/ &
-        url = f"https://api.elections.kalshi.com/trade-api/v2/markets?limit={limit}&status={status}"
+        # Fetch and unpack straight into pydantic (or the compact table)
+        markets_response = self._markets({
+            "limit": limit,
+            "status": status,
+            "series_ticker": series_ticker
+        }, compact)
 
-        # Fetch and parse to JSON
-        response = requests.get(url)
-        response_data = response.json()
+        return markets_response
 
-        # No need to iterate through and pull field by field, can unpack via pydantic
-        markets_response = MarketsResponse(**response_data)
+    @coalesced
+    def get_single_market_from_market_ticker(self, market_ticker) -> Market:
 
-        return markets_response
+        # Pull + Unpack
+        market = self._get_model(Market, f"markets/{market_ticker}")
 
-    def get_markets_from_series_ticker(self, series_ticker,  limit=1000, status="open") -> MarketsResponse:
-        # Join URL params after first w/ &
-        url = f"https://api.elections.kalshi.com/trade-api/v2/markets?limit={limit}&status={status}"
+        return market
 
-        # Fetch and parse to JSON
-        response = requests.get(url, params={
-            "series_ticker": series_ticker
-        })
-        response_data = response.json()
+    def _market_chunks(self, filter_name: str, chunks: list[list[str]], status, page_size: int) -> list[dict]:
+        '''Raw markets for each chunk of a comma-joined /markets filter; chunks are fetched concurrently'''
 
-        # No need to iterate through and pull field by field, can unpack via pydantic
-        markets_response = MarketsResponse(**response_data)
+        def fetch(chunk):
+            params = {"status": status, filter_name: ",".join(chunk)}
+            return [market for page in self._paginate("markets", params, page_size) for market in page["markets"]]
 
-        return markets_response
+        if len(chunks) <= 1:
+            return [market for chunk in chunks for market in fetch(chunk)]
 
-    def get_single_market_from_market_ticker(self, market_ticker) -> Market:
+        with ThreadPoolExecutor(max_workers=min(WINDOW_CONCURRENCY, len(chunks))) as pool:
+            return [market for markets in pool_map(pool, fetch, chunks) for market in markets]
 
-        url = f"https://api.elections.kalshi.com/trade-api/v2/markets/{market_ticker}"
+    def get_markets(self, tickers: list[str], status=None, page_size=1000) -> dict[str, Market]:
+        '''
+        Batch get_single_market_from_market_ticker: ticker -> Market (input order) in one /markets call per
+        MAX_TICKERS_PER_REQUEST tickers. Tickers the exchange doesn't know are missing from the result.
+        '''
 
-        # Pull
-        response = requests.get(url)
+        found = {market["ticker"]: market for market in
+                 self._market_chunks("tickers", chunked(tickers, MAX_TICKERS_PER_REQUEST), status, page_size)}
 
-        # Serialize
-        data = response.json()
+        return {ticker: self._parse(Market, found[ticker]) for ticker in dict.fromkeys(tickers) if ticker in found}
 
-        # Unpack
-        market = Market(**data)
+    def get_markets_by_event(self, event_tickers: list[str], status=None, page_size=1000) -> dict[str, list[Market]]:
+        '''Every market of many events, split back out per event, in one /markets call per MAX_EVENTS_PER_REQUEST events'''
 
-        return market
+        grouped: dict[str, list[Market]] = {event_ticker: [] for event_ticker in dict.fromkeys(event_tickers)}
 
-    def get_market_candle_sticks(self, series: Series, market: Market, period_interval=DEFAULT_TIMEFRAME, include_latest_before_start=True)->MarketCandlestickResponse:
+        for market in self._market_chunks("event_ticker", chunked(event_tickers, MAX_EVENTS_PER_REQUEST), status, page_size):
+            if market["event_ticker"] in grouped:
+                grouped[market["event_ticker"]].append(self._parse(Market, market))
+
+        return grouped
+
+    def get_market_candle_sticks(self, series: Series, market: Market, period_interval=DEFAULT_TIMEFRAME, include_latest_before_start=True, as_frame=False,
+                                 start_ts=None, end_ts=None, as_columns=False)->MarketCandlestickResponse:
         '''
         @params
         series_ticker: Series ticker - the series that contains the target market
         market_ticker: Market ticker - unique identifier for the specific market
-        start_ts: Start timestamp (Unix timestamp). Candlesticks will include those ending on or after this time.
-        end_ts: End timestamp (Unix timestamp). Candlesticks will include those ending on or before this time.
+        start_ts: Start timestamp (Unix timestamp). Candlesticks will include those ending on or after this time. Defaults to market open.
+        end_ts: End timestamp (Unix timestamp). Candlesticks will include those ending on or before this time. Defaults to now.
         period_interval: Time period length of each candlestick in minutes. Valid values are 1 (1 minute), 60 (1 hour), or 1440 (1 day).
         included_latest_before_start: In cur candle(not closed) append a final synthetic candle to series "imagining" current price as a 'close' for cur
+        as_frame: Decode straight into the to_ta_data DataFrame (columnar, no per-candle models) instead of a MarketCandlestickResponse
+        as_columns: Decode into the full {column: array} layout of decode_candlestick_columns (what CandleStore appends)
 
         '''
 
@@ -145,76 +395,114 @@ class KalshiClient:
 
         if not series_ticker or not market_ticker:
             print(
-                f"Skipping Series-{series_ticker if series_ticker is not None else "DNE"} : Market-{market_ticker if market_ticker is not None else "DNE"}")
+                f"Skipping Series-{series_ticker if series_ticker is not None else 'DNE'} : Market-{market_ticker if market_ticker is not None else 'DNE'}")
             return None
 
-        url = f"https://api.elections.kalshi.com/trade-api/v2/series/{series_ticker}/markets/{market_ticker}/candlesticks"
+        start_ts = start_ts if start_ts is not None else market.open_epoch
+        end_ts = end_ts if end_ts is not None else get_end_ts()
+        path = f"series/{series_ticker}/markets/{market_ticker}/candlesticks"
 
-        response = requests.get(url, params={
-            "start_ts": iso_to_unix(market.open_time),
-            "end_ts": get_end_ts(),
-            "period_interval": period_interval,
-            "include_latest_before_start": include_latest_before_start
-        })
+        # Long ranges are split into windows the API will answer in full, fetched concurrently, then merged
+        def fetch(window_start, window_end):
+            return self._get(path, params={
+                "start_ts": window_start,
+                "end_ts": window_end,
+                "period_interval": period_interval,
+                "include_latest_before_start": include_latest_before_start and window_start == start_ts
+            })
+
+        pages = self._fetch_windows(fetch, candle_windows(start_ts, end_ts, period_interval))
+
+        # The frame / column decoders skip the pydantic model, so their malformed-payload errors are mapped here
+        try:
+            raw = {"ticker": pages[0].get("ticker", market_ticker), "candlesticks": merge_candles([p["candlesticks"] for p in pages])}
+
+            # pandas is only loaded when a frame is asked for
+            if as_frame:
+                from ..utils.candlestick import to_ta_frame
+                return to_ta_frame(raw, period_interval)
+
+            if as_columns:
+                from ..utils.candlestick import decode_candlestick_columns
+                return decode_candlestick_columns(raw["candlesticks"])
 
-        raw = response.json()
-       
-        return MarketCandlestickResponse(**raw)
+        except (KeyError, TypeError, ValueError) as exc:
+            raise KalshiDecodeError("candlesticks", path, str(exc)) from exc
+
+        return self._parse(MarketCandlestickResponse, raw)
 
     def get_events(self, limit=100, status="open", series_ticker=None, with_milestones=True) -> EventsResponse:
         '''Batch Introduction to Event Data: Nothing on Volume, Inner Markets, ...'''
 
-        url = f"https://api.elections.kalshi.com/trade-api/v2/events?limit={limit}"
-
-        response = requests.get(url,params={
+        events = self._get_model(EventsResponse, "events", params={
+            "limit": limit,
             "status" : status,
             "series_ticker": series_ticker,
             "with_milestones": with_milestones
         })
 
-        raw =  response.json()
-
-        events = EventsResponse(**raw)
-
         return events
     
+    @coalesced
     def get_event(self, event_ticker) -> EventResponse:
         '''More Specific Single Event -> All Markets Detailed Data'''
 
         with_nested_markets=True
 
-        url = f"https://api.elections.kalshi.com/trade-api/v2/events/{event_ticker}"
-        
-        response = requests.get(url, params={
+        event = self._get_model(EventResponse, f"events/{event_ticker}", params={
             "with_nested_markets": with_nested_markets
         })
 
-        raw = response.json()
-
-        event = EventResponse(**raw)
-
         return event
     
 
-    def get_event_candle_sticks(self, event:Event, period_interval= DEFAULT_TIMEFRAME) -> EventCandlesticksResponse:
+    def get_event_candle_sticks(self, event:Event, period_interval= DEFAULT_TIMEFRAME, start_ts=None, end_ts=None) -> EventCandlesticksResponse:
+        '''
+        Candles for every market in the event. The per-request cap is shared by all of the event's markets,
+        so windows shrink with market count, and each window is re-requested from `adjusted_end_ts` until covered.
+        '''
 
         series_ticker = event.series_ticker
         event_ticker = event.event_ticker
 
-        start_ts = get_start_ts(event.markets)
-        end_ts = get_end_ts()
+        start_ts = start_ts if start_ts is not None else get_start_ts(event.markets)
+        end_ts = end_ts if end_ts is not None else get_end_ts()
 
-        url = f"https://api.elections.kalshi.com/trade-api/v2/series/{series_ticker}/events/{event_ticker}/candlesticks"
+        path = f"series/{series_ticker}/events/{event_ticker}/candlesticks"
+        max_candles = MAX_CANDLES_PER_REQUEST // max(1, len(event.markets or []))
 
-        response = requests.get(url, params={
-            "start_ts" : start_ts,
-            "end_ts" : end_ts,
-            "period_interval" : period_interval 
-        })
+        def fetch(window_start, window_end):
+            responses = []
+            reached = window_start - 1     # Last second of the window the server has covered
+
+            while window_start <= window_end:
+                response = self._get(path, params={
+                    "start_ts" : window_start,
+                    "end_ts" : window_end,
+                    "period_interval" : period_interval 
+                })
+                responses.append(response)
+
+                # Server stopped short: continue from where it got to (bail if it made no progress)
+                adjusted = response.get("adjusted_end_ts", window_end)
+                if adjusted < window_start:
+                    break
+
+                reached = min(adjusted, window_end)
+                if adjusted >= window_end:
+                    break
+                window_start = adjusted + 1
 
-        raw = response.json()
+            return responses, reached
 
-        candles = EventCandlesticksResponse(**raw)
+        windows = candle_windows(start_ts, end_ts, period_interval, max_candles)
+        fetched = self._fetch_windows(fetch, windows)
+
+        # A window the server stopped short in is a gap: report coverage up to it, not the requested end_ts
+        adjusted_end_ts = covered_until(windows, [reached for _, reached in fetched], end_ts)
+        raw = merge_event_candles([r for responses, _ in fetched for r in responses], adjusted_end_ts)
+
+        candles = self._parse(EventCandlesticksResponse, raw)
 
         return candles
 
@@ -222,6 +510,10 @@ class KalshiClient:
 
 
 if __name__ == '__main__':
+    import pandas_ta as ta
+    from ..utils import pydantic_model_to_dataframe, unwrap_candlesticks, to_ta_data, plot_rsi
+    from ..technical_analysis import crossover, crossunder, const_to_series
+
     kc = KalshiClient("fake")
     # series_list = kc.get_series_list()
 
@@ -0,0 +1,296 @@
+import asyncio
+import itertools
+import json
+import random
+from .orderbook import OrderBook
+
+'''
+Streaming order books over the Kalshi websocket API
+
+MarketDataStream subscribes to the orderbook_delta channel for a set of tickers and keeps one OrderBook per
+market current: an orderbook_snapshot replaces a book, each orderbook_delta is applied in place.
+
+Every message on a subscription (sid) carries a sequence number that grows by exactly one. A jump means a message
+was lost, so the books on that subscription can no longer be trusted: they are marked stale, the subscription is
+dropped and re-made, and the fresh snapshots that follow bring them back. A dropped connection does the same
+for every subscription after a jittered backoff.
+
+handle() is the whole protocol state machine - it takes one decoded message and returns the commands to send -
+so it runs the same against the exchange, a ReplayServer, or a list of recorded messages in a unit test.
+'''
+
+WS_URL = "wss://api.elections.kalshi.com/trade-api/ws/v2"
+ORDERBOOK_CHANNEL = "orderbook_delta"
+
+
+def _connect(url: str, headers: dict | None):
+    # websockets is only needed for live streaming, so it is imported on first use
+    from websockets.asyncio.client import connect
+    return connect(url, additional_headers=headers, max_size=None)
+
+
+class MarketDataStream:
+    '''
+    @params
+    tickers: markets to keep books for
+    headers: authentication headers for the websocket handshake (KALSHI-ACCESS-KEY / -SIGNATURE / -TIMESTAMP)
+    on_update: callback(book, message_type) after every applied snapshot or delta
+    record: path to append every received message to (JSON lines), for replaying later
+    '''
+
+    def __init__(self, tickers: list[str], url: str = WS_URL, headers: dict | None = None, on_update=None,
+                 record: str | None = None, reconnect_delay: float = 0.5, max_reconnect_delay: float = 30.0):
+
+        self.url = url
+        self.headers = headers
+        self.on_update = on_update
+        self.record = record
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self.books = {ticker: OrderBook(ticker) for ticker in tickers}
+
+        self._ids = itertools.count(1)
+        self._pending: dict[int, list[str]] = {}       # Command id -> tickers of a subscribe awaiting its sid
+        self._subscriptions: dict[int, dict] = {}      # sid -> {"tickers": [...], "seq": last seq or None}
+
+        self.messages = 0   # Messages handled
+        self.gaps = 0       # Sequence gaps detected
+        self.resyncs = 0    # Resubscriptions (gaps + reconnects)
+        self.ready = asyncio.Event()  # Set once every book has had a snapshot
+
+    # --- COMMANDS ---
+
+    def subscribe_command(self, tickers: list[str]) -> dict:
+        command_id = next(self._ids)
+        self._pending[command_id] = list(tickers)
+
+        return {"id": command_id, "cmd": "subscribe", "params": {"channels": [ORDERBOOK_CHANNEL], "market_tickers": list(tickers)}}
+
+    def _resync(self, sid: int) -> list[dict]:
+        '''Drop a subscription whose stream can't be trusted and ask for fresh snapshots'''
+
+        subscription = self._subscriptions.pop(sid)
+        self.resyncs += 1
+        self.ready.clear()
+
+        for ticker in subscription["tickers"]:
+            self.books[ticker].stale = True
+
+        return [
+            {"id": next(self._ids), "cmd": "unsubscribe", "params": {"sids": [sid]}},
+            self.subscribe_command(subscription["tickers"]),
+        ]
+
+    # --- PROTOCOL ---
+
+    def handle(self, message: dict) -> list[dict]:
+        '''Apply one decoded message; returns commands to send back (empty unless a resync is needed)'''
+
+        self.messages += 1
+        kind = message.get("type")
+
+        if kind == "subscribed":
+            tickers = self._pending.pop(message.get("id"), None)
+            if tickers is not None:
+                self._subscriptions[message["msg"]["sid"]] = {"tickers": tickers, "seq": None}
+            return []
+
+        if kind == "error":
+            raise RuntimeError(f"market data subscription error: {message.get('msg')}")
+
+        if kind not in ("orderbook_snapshot", "orderbook_delta"):
+            return []
+
+        sid, seq, body = message.get("sid"), message.get("seq"), message["msg"]
+        subscription = self._subscriptions.get(sid)
+
+        # Late messages from a subscription we already dropped
+        if subscription is None:
+            return []
+
+        if seq is not None and subscription["seq"] is not None and seq != subscription["seq"] + 1:
+            self.gaps += 1
+            return self._resync(sid)
+
+        if seq is not None:
+            subscription["seq"] = seq
+
+        book = self.books.get(body["market_ticker"])
+        if book is None:
+            return []
+
+        if kind == "orderbook_snapshot":
+            book.apply_snapshot(body.get("yes", body.get("yes_dollars")), body.get("no", body.get("no_dollars")), seq)
+
+            if not self.ready.is_set() and not any(b.stale for b in self.books.values()):
+                self.ready.set()
+
+        elif not book.stale:
+            price = body["price"] if "price" in body else body["price_dollars"]
+            delta = body["delta"] if "delta" in body else body["delta_fp"]
+            book.apply_delta(body["side"], price, delta, seq)
+
+        else:
+            # Deltas before the snapshot that anchors them
+            return []
+
+        if self.on_update is not None:
+            self.on_update(book, kind)
+
+        return []
+
+    # --- CONNECTION LOOP ---
+
+    def _reset(self):
+        '''Connection lost: every subscription is gone, every book waits for a new snapshot'''
+
+        self._pending.clear()
+        self._subscriptions.clear()
+        self.ready.clear()
+
+        for book in self.books.values():
+            book.stale = True
+
+    async def run(self, stop: asyncio.Event | None = None):
+        '''Stream until `stop` is set (or forever), reconnecting with jittered exponential backoff'''
+
+        stop = stop if stop is not None else asyncio.Event()
+        delay = self.reconnect_delay
+        log = open(self.record, "a") if self.record else None
+
+        try:
+            while not stop.is_set():
+                try:
+                    async with _connect(self.url, self.headers) as websocket:
+                        delay = self.reconnect_delay
+                        await websocket.send(json.dumps(self.subscribe_command(list(self.books))))
+
+                        await self._consume(websocket, stop, log)
+
+                except Exception as exc:
+                    # Network errors, timeouts and websockets.ConnectionClosed & co (not importable until first use)
+                    retryable = isinstance(exc, (OSError, asyncio.TimeoutError)) or type(exc).__module__.split(".")[0] == "websockets"
+
+                    if not retryable:
+                        raise
+                    if stop.is_set():
+                        break
+
+                    self._reset()
+                    self.resyncs += 1
+                    await asyncio.sleep(random.uniform(0, delay))
+                    delay = min(self.max_reconnect_delay, delay * 2)
+
+        finally:
+            if log is not None:
+                log.close()
+
+    async def _consume(self, websocket, stop: asyncio.Event, log):
+
+        stopping = asyncio.ensure_future(stop.wait())
+
+        try:
+            while True:
+                receiving = asyncio.ensure_future(websocket.recv())
+                done, _ = await asyncio.wait({receiving, stopping}, return_when=asyncio.FIRST_COMPLETED)
+
+                if receiving not in done:
+                    receiving.cancel()
+                    return
+
+                raw = receiving.result()
+
+                if log is not None:
+                    log.write(raw if isinstance(raw, str) else raw.decode())
+                    log.write("\n")
+
+                for command in self.handle(json.loads(raw)):
+                    await websocket.send(json.dumps(command))
+        finally:
+            stopping.cancel()
+
+
+# --- LOCAL STAND-IN ---
+
+def load_recording(path: str) -> list[list[dict]]:
+    '''
+    A recorded stream (MarketDataStream(record=...)) as replay scripts: the book messages that followed each
+    "subscribed" acknowledgement, one script per subscription
+    '''
+
+    scripts: list[list[dict]] = []
+
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+
+            message = json.loads(line)
+
+            if message.get("type") == "subscribed":
+                scripts.append([])
+            elif message.get("type") in ("orderbook_snapshot", "orderbook_delta") and scripts:
+                scripts[-1].append(message)
+
+    return scripts
+
+
+class ReplayServer:
+    '''
+    Local websocket stand-in for the exchange. The k-th subscribe command (across connections) is acknowledged
+    with a new sid and answered with scripts[k], with every message re-stamped with that sid. Scripts can carry
+    deliberate sequence gaps to exercise resyncs; after the last script, subscriptions are acknowledged but silent.
+
+    async with ReplayServer(load_recording("session.jsonl")) as server:
+        stream = MarketDataStream(tickers, url=server.url)
+    '''
+
+    def __init__(self, scripts: list[list[dict]], host: str = "127.0.0.1", port: int = 0, delay: float = 0.0):
+        self.scripts = scripts
+        self.host = host
+        self.port = port
+        self.delay = delay              # Seconds between replayed messages
+        self.received: list[dict] = []  # Every command a client sent
+        self._sids = itertools.count(1)
+        self._script = 0
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    async def _handler(self, websocket):
+        async for raw in websocket:
+            command = json.loads(raw)
+            self.received.append(command)
+
+            if command.get("cmd") != "subscribe":
+                continue
+
+            sid = next(self._sids)
+            await websocket.send(json.dumps({"id": command.get("id"), "type": "subscribed",
+                                             "msg": {"channel": ORDERBOOK_CHANNEL, "sid": sid}}))
+
+            if self._script >= len(self.scripts):
+                continue
+
+            script = self.scripts[self._script]
+            self._script += 1
+
+            for message in script:
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                await websocket.send(json.dumps({**message, "sid": sid}))
+
+    async def __aenter__(self):
+        from websockets.asyncio.server import serve
+
+        self._server = await serve(self._handler, self.host, self.port).__aenter__()
+        self.port = self._server.sockets[0].getsockname()[1] if not self.port else self.port
+
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
@@ -0,0 +1,331 @@
+import bisect
+import functools
+import math
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+'''
+Client instrumentation: per-endpoint request metrics and pipeline stage timers
+
+    metrics = Metrics()
+    client = KalshiClient(key, metrics=metrics)   # HTTP, JSON decode, model building, cache, retries, hedges
+    metrics.install()                             # + utils transformation stages (unwrap, to_ta_data, DataFrame, ...)
+    ...
+    metrics.snapshot()          # nested dict: endpoints -> counts / bytes / latency p50 p95 p99, stages -> timings
+    metrics.to_prometheus()     # text exposition format
+
+Recorded per endpoint (transport.endpoint_name labels): requests by status, response bytes, latency histogram,
+retries, final errors, hedges fired and cache hits / misses / revalidations. Stages are named timers
+("json", "model.MarketsResponse", "unwrap_candlesticks", ...).
+
+Hooks see every event as it happens: hook(event, name, **fields), e.g. hook("request", "markets", seconds=0.08,
+status=200, bytes=51234) - to forward into StatsD, logs, a tracer.
+
+Disabled is the default and costs a None check: clients without metrics=... skip every call, and @timed
+stages only pay one global lookup while nothing is installed.
+'''
+
+REQUEST = "request"
+RETRY = "retry"
+ERROR = "error"
+HEDGE = "hedge"
+CACHE = "cache"
+STAGE = "stage"
+
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+CACHE_REVALIDATED = "revalidated"
+
+# Log-spaced bucket bounds, 10us .. ~140s in 10% steps: quantiles are accurate to ~5% at any scale
+_GROWTH = 1.1
+BOUNDS = tuple(1e-5 * _GROWTH ** i for i in range(int(math.log(1.5e7) / math.log(_GROWTH)) + 1))
+
+# Every 8th bound (~2.1x apart) is exported as a Prometheus `le` bucket
+PROMETHEUS_STRIDE = 8
+
+
+class Histogram:
+    '''Counts of observations per log-spaced bucket, plus count / sum / max'''
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BOUNDS) + 1)   # Last slot: above the top bound
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(BOUNDS, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float | None:
+        '''Linear interpolation inside the bucket holding the q-th observation'''
+
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = BOUNDS[i - 1] if i > 0 else 0.0
+                upper = BOUNDS[i] if i < len(BOUNDS) else self.max
+                return min(self.max, lower + (upper - lower) * max(0.0, rank - seen) / n)
+            seen += n
+
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "total_s": self.sum,
+            "mean_s": self.sum / self.count if self.count else None,
+            "p50_s": self.quantile(0.50),
+            "p95_s": self.quantile(0.95),
+            "p99_s": self.quantile(0.99),
+            "max_s": self.max if self.count else None,
+        }
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        '''(le, cumulative count) pairs for Prometheus, ending with +Inf'''
+
+        out = []
+        running = 0
+
+        for i, n in enumerate(self.counts[:-1]):
+            running += n
+            if i % PROMETHEUS_STRIDE == PROMETHEUS_STRIDE - 1:
+                out.append((f"{BOUNDS[i]:.6g}", running))
+
+        out.append(("+Inf", self.count))
+
+        return out
+
+
+class _Endpoint:
+    __slots__ = ("status", "bytes", "latency", "retries", "errors", "hedges", "cache")
+
+    def __init__(self):
+        self.status = Counter()
+        self.bytes = 0
+        self.latency = Histogram()
+        self.retries = 0
+        self.errors = 0
+        self.hedges = 0
+        self.cache = Counter()
+
+
+class Metrics:
+    '''Thread-safe metrics sink shared by any number of clients (sync or async)'''
+
+    def __init__(self, hooks=()):
+        self.hooks = list(hooks)
+        self._endpoints: dict[str, _Endpoint] = {}
+        self._stages: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    def _endpoint(self, endpoint: str) -> _Endpoint:
+        stats = self._endpoints.get(endpoint)
+
+        if stats is None:
+            stats = self._endpoints.setdefault(endpoint, _Endpoint())
+
+        return stats
+
+    def _emit(self, event: str, name: str, **fields):
+        for hook in self.hooks:
+            hook(event, name, **fields)
+
+    # --- RECORDING ---
+
+    def request(self, endpoint: str, seconds: float, status: int, nbytes: int):
+        '''One HTTP attempt that got a response (any status)'''
+
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats.status[status] += 1
+            stats.bytes += nbytes
+            stats.latency.observe(seconds)
+
+        if self.hooks:
+            self._emit(REQUEST, endpoint, seconds=seconds, status=status, bytes=nbytes)
+
+    def retry(self, endpoint: str):
+        with self._lock:
+            self._endpoint(endpoint).retries += 1
+
+        if self.hooks:
+            self._emit(RETRY, endpoint)
+
+    def error(self, endpoint: str, error: Exception):
+        '''A logical call that failed for good (after retries)'''
+
+        with self._lock:
+            self._endpoint(endpoint).errors += 1
+
+        if self.hooks:
+            self._emit(ERROR, endpoint, error=error)
+
+    def hedge(self, endpoint: str):
+        with self._lock:
+            self._endpoint(endpoint).hedges += 1
+
+        if self.hooks:
+            self._emit(HEDGE, endpoint)
+
+    def cache(self, endpoint: str, outcome: str):
+        with self._lock:
+            self._endpoint(endpoint).cache[outcome] += 1
+
+        if self.hooks:
+            self._emit(CACHE, endpoint, outcome=outcome)
+
+    def stage(self, name: str, seconds: float):
+        with self._lock:
+            histogram = self._stages.get(name)
+            if histogram is None:
+                histogram = self._stages[name] = Histogram()
+            histogram.observe(seconds)
+
+        if self.hooks:
+            self._emit(STAGE, name, seconds=seconds)
+
+    @contextmanager
+    def time(self, name: str):
+        '''with metrics.time("indicators"): ...'''
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage(name, time.perf_counter() - start)
+
+    def install(self) -> "Metrics":
+        '''Make this the sink for @timed pipeline stages (process-wide; one at a time)'''
+        install(self)
+        return self
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self._stages.clear()
+
+    # --- EXPORT ---
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            endpoints = {}
+
+            for name, stats in sorted(self._endpoints.items()):
+                lookups = stats.cache[CACHE_HIT] + stats.cache[CACHE_MISS]
+                endpoints[name] = {
+                    "requests": sum(stats.status.values()),
+                    "status": dict(stats.status),
+                    "bytes": stats.bytes,
+                    "retries": stats.retries,
+                    "errors": stats.errors,
+                    "hedges": stats.hedges,
+                    "cache": {**stats.cache, "hit_rate": stats.cache[CACHE_HIT] / lookups if lookups else None},
+                    "latency": stats.latency.summary(),
+                }
+
+            stages = {name: histogram.summary() for name, histogram in sorted(self._stages.items())}
+
+        return {"endpoints": endpoints, "stages": stages}
+
+    def to_prometheus(self, prefix: str = "kalshi") -> str:
+        lines = []
+
+        def header(name, kind, text):
+            lines.append(f"# HELP {prefix}_{name} {text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def histogram(name, label, value, h: Histogram):
+            for le, count in h.cumulative():
+                lines.append(f'{prefix}_{name}_bucket{{{label}="{value}",le="{le}"}} {count}')
+            lines.append(f'{prefix}_{name}_sum{{{label}="{value}"}} {h.sum:.9g}')
+            lines.append(f'{prefix}_{name}_count{{{label}="{value}"}} {h.count}')
+
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            stages = sorted(self._stages.items())
+
+            header("requests_total", "counter", "HTTP attempts by endpoint and status")
+            for name, stats in endpoints:
+                for status, count in sorted(stats.status.items()):
+                    lines.append(f'{prefix}_requests_total{{endpoint="{name}",status="{status}"}} {count}')
+
+            for metric, attribute, text in (("response_bytes_total", "bytes", "Response body bytes"),
+                                            ("retries_total", "retries", "Retried attempts"),
+                                            ("errors_total", "errors", "Calls that failed after retries"),
+                                            ("hedges_total", "hedges", "Hedge requests fired")):
+                header(metric, "counter", text)
+                for name, stats in endpoints:
+                    lines.append(f'{prefix}_{metric}{{endpoint="{name}"}} {getattr(stats, attribute)}')
+
+            header("cache_total", "counter", "Response cache lookups by outcome")
+            for name, stats in endpoints:
+                for outcome, count in sorted(stats.cache.items()):
+                    lines.append(f'{prefix}_cache_total{{endpoint="{name}",outcome="{outcome}"}} {count}')
+
+            header("request_duration_seconds", "histogram", "HTTP attempt latency")
+            for name, stats in endpoints:
+                histogram("request_duration_seconds", "endpoint", name, stats.latency)
+
+            header("stage_duration_seconds", "histogram", "Decode / transformation stage time")
+            for name, h in stages:
+                histogram("stage_duration_seconds", "stage", name, h)
+
+        return "\n".join(lines) + "\n"
+
+
+# --- PIPELINE STAGES ---
+
+_active: Metrics | None = None
+
+
+def install(metrics: Metrics | None):
+    '''Route @timed stages to `metrics` (None switches them back off)'''
+    global _active
+    _active = metrics
+
+
+def uninstall():
+    install(None)
+
+
+def active() -> Metrics | None:
+    return _active
+
+
+def timed(name: str):
+    '''Time every call of the decorated function as stage `name` while a Metrics is installed'''
+
+    def decorate(fn):
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            metrics = _active
+
+            if metrics is None:
+                return fn(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                metrics.stage(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorate
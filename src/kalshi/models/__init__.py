@@ -1 +1,2 @@
-from .models import Series, PriceRange, MVESelectedLeg, Market, MarketsResponse, TagList, SeriesList, Event, EventsResponse, EventResponse, MarketCandlestickResponse, Candlestick, CandlestickOHLC, CandlestickPriceOHLC, EventCandlesticksResponse, UnwrappedCandlestick
\ No newline at end of file
+from .models import Series, PriceRange, MVESelectedLeg, Market, MarketsResponse, TagList, SeriesList, SeriesResponse, Event, EventsResponse, EventResponse, MarketCandlestickResponse, Candlestick, CandlestickOHLC, CandlestickPriceOHLC, EventCandlesticksResponse, UnwrappedCandlestick
+from .market_table import MarketTable, MarketTableBuilder
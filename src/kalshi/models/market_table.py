@@ -0,0 +1,379 @@
+import marshal
+import sys
+import zlib
+from array import array
+from itertools import islice
+from operator import itemgetter
+import numpy as np
+from .models import Market
+from ...utils.time import iso_to_epoch
+
+'''
+Compact, column-oriented storage for large Market universes
+
+A full-universe MarketsResponse is tens of thousands of pydantic objects with ~60 attributes each, every price
+stored twice (cents int and dollars str), plus long rule texts that are rarely read. MarketTable keeps:
+
+    ticker                      one list of interned strings (+ ticker -> row index)
+    int / bool fields           one int64 / bool numpy array per field
+    repeated strings            status, event_ticker, timestamps, ... as int32 codes into a shared pool
+    *_dollars / *_fp strings    not stored: re-derived from the int column (values the derivation would not
+                                reproduce exactly are kept in a small per-field overflow dict, so nothing is lost)
+    cold fields                 rules, titles, strikes, price ranges, ... as zlib-compressed marshal blobs, COLD_BLOCK rows
+                                per blob (sibling markets share most of their text, so blocks compress well);
+                                decoded only when asked for
+
+Round trips are lossless: MarketTable.from_markets(markets).to_markets() == markets. Missing fields and
+non-integer ints are rejected while building; everything else is stored as sent and only validated when a
+Market is built from a row.
+'''
+
+INT_FIELDS = ("settlement_timer_seconds", "yes_bid", "yes_ask", "no_bid", "no_ask", "last_price", "volume", "volume_24h",
+              "open_interest", "notional_value", "previous_yes_bid", "previous_yes_ask", "previous_price", "liquidity", "tick_size")
+
+BOOL_FIELDS = ("can_close_early",)
+
+CATEGORY_FIELDS = ("event_ticker", "market_type", "status", "response_price_units", "result", "created_time", "updated_time",
+                   "open_time", "close_time", "expiration_time", "latest_expiration_time", "expected_expiration_time")
+
+# Derived string field -> (int field it is rendered from, candidate (format, divisor) renderings tried in order)
+_CENTS = (("{:.4f}", 100), ("{:.2f}", 100))
+_COUNT = (("{:.2f}", 1), ("{}", 1), ("{:.4f}", 1))
+
+DERIVED_FIELDS: dict[str, tuple[str, tuple]] = {
+    **{f"{name}_dollars": (name, _CENTS) for name in ("yes_bid", "yes_ask", "no_bid", "no_ask", "last_price", "notional_value",
+                                                       "previous_yes_bid", "previous_yes_ask", "previous_price", "liquidity")},
+    **{f"{name}_fp": (name, _COUNT) for name in ("volume", "volume_24h", "open_interest")},
+}
+
+_HOT = {"ticker", *INT_FIELDS, *BOOL_FIELDS, *CATEGORY_FIELDS, *DERIVED_FIELDS}
+
+# Everything else: read rarely, stored compressed
+COLD_FIELDS = tuple(name for name in Market.model_fields if name not in _HOT)
+
+COLD_BLOCK = 256     # Rows per compressed cold blob
+
+_COLD_GETTER = itemgetter(*COLD_FIELDS)
+_PAGE = 1000
+
+
+_LOOKUP_SIZE = 10_001                    # Small ints (every price in cents) render through a precomputed table
+_lookups: dict[tuple[str, int], list[str]] = {}
+
+
+def _format(rendering: tuple[str, int], values) -> list[str]:
+    template, divisor = rendering
+    if divisor != 1:
+        values = (np.asarray(values, dtype=np.int64) / divisor).tolist()
+    return list(map(template.format, values))
+
+
+def _render(rendering: tuple[str, int], values) -> list[str]:
+    '''Derived strings for a column of ints'''
+
+    if len(values) and 0 <= min(values) and max(values) < _LOOKUP_SIZE:
+        lookup = _lookups.get(rendering)
+        if lookup is None:
+            lookup = _lookups[rendering] = _format(rendering, range(_LOOKUP_SIZE))
+        return list(map(lookup.__getitem__, values))
+
+    return _format(rendering, values)
+
+
+class MarketTableBuilder:
+    '''
+    Accumulates pages of raw market dicts into compact buffers; build() turns them into a MarketTable.
+
+    Columns are pulled out a page at a time with map / itemgetter, so the per-market work happens in C
+    rather than in a Python loop over ~60 fields.
+    '''
+
+    def __init__(self):
+        self.tickers: list[str] = []
+        self.ints = {name: array("q") for name in INT_FIELDS}
+        self.bools = {name: array("b") for name in BOOL_FIELDS}
+        self.codes = {name: array("i") for name in CATEGORY_FIELDS}
+        self.pools: dict[str, dict[str, int]] = {name: {} for name in CATEGORY_FIELDS}
+        self.renderers: dict[str, int] = {}
+        self.overflow: dict[str, dict[int, str]] = {name: {} for name in DERIVED_FIELDS}
+        self.cold_blocks: list[bytes] = []
+        self._cold_pending: list = []
+
+    def _pick_renderers(self, row: dict):
+        '''First row decides which rendering the API uses for each derived field'''
+
+        for name, (source, renderings) in DERIVED_FIELDS.items():
+            value = row[name]
+            self.renderers[name] = next((k for k, rendering in enumerate(renderings) if _render(rendering, [row[source]])[0] == value), 0)
+
+    def _columns(self, page: list[dict]) -> dict:
+        '''Every stored column of one page, or ValueError naming the first malformed market'''
+
+        columns = {}
+
+        try:
+            columns["ticker"] = list(map(sys.intern, map(itemgetter("ticker"), page)))
+
+            for name in INT_FIELDS:
+                columns[name] = array("q", map(itemgetter(name), page))
+
+            for name in BOOL_FIELDS:
+                columns[name] = array("b", map(bool, map(itemgetter(name), page)))
+
+            for name in CATEGORY_FIELDS:
+                columns[name] = list(map(itemgetter(name), page))
+
+            for name in DERIVED_FIELDS:
+                columns[name] = list(map(itemgetter(name), page))
+
+        except (KeyError, TypeError, OverflowError) as exc:
+            field = exc.args[0] if isinstance(exc, KeyError) else name
+            row = next((i for i, market in enumerate(page) if field not in market), None)
+            raise ValueError(f"malformed market{f' at row {len(self.tickers) + row}' if row is not None else ''}: "
+                             f"field '{field}' ({exc!r})") from exc
+
+        return columns
+
+    def extend(self, page: list[dict]):
+        '''Add one page (or any list) of raw market dicts; nothing is added if any of them is malformed'''
+
+        page = page if isinstance(page, list) else list(page)
+        if not page:
+            return
+
+        columns = self._columns(page)
+
+        if not self.renderers:
+            self._pick_renderers(page[0])
+
+        offset = len(self.tickers)
+
+        for name, (source, renderings) in DERIVED_FIELDS.items():
+            try:
+                rendered = _render(renderings[self.renderers[name]], columns[source])
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"malformed market: field '{source}' ({exc!r})") from exc
+
+            # Keep whatever the API sent when it isn't what we would render
+            if rendered != columns[name]:
+                overflow = self.overflow[name]
+                for i, (expected, actual) in enumerate(zip(rendered, columns[name])):
+                    if expected != actual:
+                        overflow[offset + i] = actual
+
+        self.tickers.extend(columns["ticker"])
+
+        for name in INT_FIELDS:
+            self.ints[name].extend(columns[name])
+
+        for name in BOOL_FIELDS:
+            self.bools[name].extend(columns[name])
+
+        for name in CATEGORY_FIELDS:
+            pool = self.pools[name]
+            for value in dict.fromkeys(columns[name]):
+                if value not in pool:
+                    pool[value] = len(pool)
+            self.codes[name].extend(map(pool.__getitem__, columns[name]))
+
+        try:
+            cold = list(map(_COLD_GETTER, page))
+        except KeyError:
+            # Optional fields left out of some markets
+            cold = [tuple(map(market.get, COLD_FIELDS)) for market in page]
+
+        self._cold_pending.extend(cold)
+        self._flush_cold(full_blocks_only=True)
+
+    def add(self, row: dict):
+        self.extend([row])
+
+    def _flush_cold(self, full_blocks_only: bool = False):
+        pending = self._cold_pending
+        end = len(pending) - len(pending) % COLD_BLOCK if full_blocks_only else len(pending)
+
+        for start in range(0, end, COLD_BLOCK):
+            block = pending[start:start + COLD_BLOCK]
+            self.cold_blocks.append(zlib.compress(marshal.dumps(block), 1))
+
+        self._cold_pending = pending[end:]
+
+    def build(self, cursor: str | None = None) -> "MarketTable":
+        return MarketTable(self, cursor)
+
+
+class MarketTable:
+    '''
+    Struct-of-arrays Market snapshot.
+
+    table = client.get_market_table(status="open")   # or MarketTable.from_json(dicts) / from_markets(list[Market])
+    table["yes_ask"]                         # int64 array (cents), no per-market objects
+    table["status"] == "active"              # boolean mask
+    table.select(mask).to_frame()            # hot columns as a DataFrame
+    table.market("KXHIGHNY-26FEB04-T70")     # full Market, cold fields decoded on demand
+    '''
+
+    def __init__(self, builder: MarketTableBuilder | None = None, cursor: str | None = None):
+        builder = builder if builder is not None else MarketTableBuilder()
+        builder._flush_cold()
+
+        n = len(builder.tickers)
+
+        self.tickers = builder.tickers
+        self.ints = {name: np.frombuffer(values, dtype=np.int64) if n else np.empty(0, np.int64) for name, values in builder.ints.items()}
+        self.bools = {name: np.frombuffer(values, dtype=np.int8).astype(bool) if n else np.empty(0, bool) for name, values in builder.bools.items()}
+        self.codes = {name: np.frombuffer(values, dtype=np.int32) if n else np.empty(0, np.int32) for name, values in builder.codes.items()}
+        self.categories = {name: np.array(list(pool), dtype=object) for name, pool in builder.pools.items()}
+        self.renderers = builder.renderers
+        self.overflow = builder.overflow
+        self.cold_blocks = builder.cold_blocks
+        self.cold_rows = np.arange(n)        # Row -> position in the cold blocks (select() keeps the parent's blocks)
+        self.cursor = cursor
+        self._index: dict[str, int] | None = None
+        self._block_cache: tuple[int, list] | None = None
+
+    # --- CONSTRUCTION ---
+
+    @classmethod
+    def from_json(cls, markets, cursor: str | None = None) -> "MarketTable":
+        '''From raw market dicts (a /markets page's "markets" list, or any iterable of them across pages)'''
+
+        builder = MarketTableBuilder()
+        markets = iter(markets)
+
+        # Page-sized slices keep the column passes cache-friendly
+        while page := list(islice(markets, _PAGE)):
+            builder.extend(page)
+
+        return cls(builder, cursor)
+
+    @classmethod
+    def from_markets(cls, markets: list[Market], cursor: str | None = None) -> "MarketTable":
+        return cls.from_json((market.model_dump() for market in markets), cursor)
+
+    # --- ACCESS ---
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self.index
+
+    @property
+    def index(self) -> dict[str, int]:
+        '''ticker -> row'''
+        if self._index is None:
+            self._index = {ticker: i for i, ticker in enumerate(self.tickers)}
+        return self._index
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        '''Whole column: numpy arrays for numeric / categorical fields, object arrays for derived and cold ones'''
+
+        if field == "ticker":
+            return np.array(self.tickers, dtype=object)
+        if field in self.ints:
+            return self.ints[field]
+        if field in self.bools:
+            return self.bools[field]
+        if field in self.codes:
+            return self.categories[field][self.codes[field]]
+        if field in DERIVED_FIELDS:
+            source, renderings = DERIVED_FIELDS[field]
+            values = np.array(_render(renderings[self.renderers.get(field, 0)], self.ints[source]), dtype=object)
+            for i, value in self.overflow[field].items():
+                values[i] = value
+            return values
+        if field in COLD_FIELDS:
+            position = COLD_FIELDS.index(field)
+            return np.array([self._cold(i)[position] for i in range(len(self))], dtype=object)
+
+        raise KeyError(field)
+
+    def epoch(self, field: str) -> np.ndarray:
+        '''
+        A time field as int64 epoch seconds (utils.NO_TIME where missing). Hot time fields are pooled, so only
+        the distinct strings are parsed; the codes then index the parsed pool.
+        '''
+
+        if field in self.codes:
+            pool = self.categories[field]
+            return iso_to_epoch(pool)[self.codes[field]] if len(pool) else np.empty(0, np.int64)
+
+        return iso_to_epoch(self[field])
+
+    def _derived(self, field: str, i: int) -> str:
+        overflow = self.overflow[field]
+        if i in overflow:
+            return overflow[i]
+
+        source, renderings = DERIVED_FIELDS[field]
+        return _render(renderings[self.renderers.get(field, 0)], [int(self.ints[source][i])])[0]
+
+    def _cold(self, i: int) -> list:
+        block, offset = divmod(int(self.cold_rows[i]), COLD_BLOCK)
+
+        # Keep the last decoded block: column reads and iteration walk rows in order
+        if self._block_cache is None or self._block_cache[0] != block:
+            self._block_cache = (block, marshal.loads(zlib.decompress(self.cold_blocks[block])))
+
+        return self._block_cache[1][offset]
+
+    def row(self, i: int) -> dict:
+        '''Row i as the raw market dict'''
+
+        row = {"ticker": self.tickers[i]}
+        row.update({name: int(values[i]) for name, values in self.ints.items()})
+        row.update({name: bool(values[i]) for name, values in self.bools.items()})
+        row.update({name: self.categories[name][codes[i]] for name, codes in self.codes.items()})
+        row.update({name: self._derived(name, i) for name in DERIVED_FIELDS})
+        row.update(zip(COLD_FIELDS, self._cold(i)))
+
+        return row
+
+    def market(self, ticker_or_row: str | int) -> Market:
+        i = self.index[ticker_or_row] if isinstance(ticker_or_row, str) else ticker_or_row
+        return Market(**self.row(i))
+
+    def __iter__(self):
+        '''Full Market models, built one at a time'''
+        return (self.market(i) for i in range(len(self)))
+
+    def to_markets(self) -> list[Market]:
+        return list(self)
+
+    # --- SLICING ---
+
+    def select(self, rows) -> "MarketTable":
+        '''Sub-table from a boolean mask or row indices (cold blocks are shared with this table, not copied)'''
+
+        rows = np.flatnonzero(rows) if np.asarray(rows).dtype == bool else np.asarray(rows, dtype=np.int64)
+
+        table = MarketTable.__new__(MarketTable)
+        table.tickers = [self.tickers[i] for i in rows]
+        table.ints = {name: values[rows] for name, values in self.ints.items()}
+        table.bools = {name: values[rows] for name, values in self.bools.items()}
+        table.codes = {name: values[rows] for name, values in self.codes.items()}
+        table.categories = self.categories
+        table.renderers = self.renderers
+        table.overflow = {name: {new: values[old] for new, old in enumerate(rows.tolist()) if old in values}
+                          for name, values in self.overflow.items()}
+        table.cold_blocks = self.cold_blocks
+        table.cold_rows = self.cold_rows[rows]
+        table.cursor = self.cursor
+        table._index = None
+        table._block_cache = None
+
+        return table
+
+    def to_frame(self, columns=None) -> "pd.DataFrame":
+        '''Hot columns (ticker, ints, bools, categoricals) as a DataFrame; categoricals stay pandas Categoricals'''
+
+        import pandas as pd   # Only table users who want a DataFrame pay for pandas
+
+        frame = {"ticker": self.tickers, **self.ints, **self.bools}
+        frame.update({name: pd.Categorical.from_codes(codes, self.categories[name]) for name, codes in self.codes.items()})
+
+        if columns is not None:
+            frame = {name: frame[name] if name in frame else self[name] for name in columns}
+
+        return pd.DataFrame(frame)
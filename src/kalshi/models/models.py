@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional
+from ...utils.time import iso_to_unix, optional_epoch
 
 class Series(BaseModel):
     ticker: str                                          # Unique identifier (e.g., "KXHIGHNY", "INX")
@@ -18,6 +19,10 @@ class Series(BaseModel):
 
 class SeriesList(BaseModel):
     series: list[Series]
+    cursor: Optional[str] = None                         # Pagination cursor for next page (when paginated)
+
+class SeriesResponse(BaseModel):
+    series: Series                                       # GET /series/{ticker} wraps the series in one key
 
 class PriceRange(BaseModel):
     start: str                                           # Start of price range
@@ -99,6 +104,44 @@ class Market(BaseModel):
     primary_participant_key: Optional[str] = None        # Primary participant identifier
     is_provisional: Optional[bool] = None               # Whether market is provisional
 
+    # Epoch seconds of the ISO 8601 fields. Parses are cached per string (markets share their times), so
+    # filtering on these doesn't re-parse; for whole columns use MarketTable.epoch / utils.iso_to_epoch
+    @property
+    def created_epoch(self) -> int:
+        return iso_to_unix(self.created_time)
+
+    @property
+    def updated_epoch(self) -> int:
+        return iso_to_unix(self.updated_time)
+
+    @property
+    def open_epoch(self) -> int:
+        return iso_to_unix(self.open_time)
+
+    @property
+    def close_epoch(self) -> int:
+        return iso_to_unix(self.close_time)
+
+    @property
+    def expiration_epoch(self) -> int:
+        return iso_to_unix(self.expiration_time)
+
+    @property
+    def latest_expiration_epoch(self) -> int:
+        return iso_to_unix(self.latest_expiration_time)
+
+    @property
+    def expected_expiration_epoch(self) -> int:
+        return iso_to_unix(self.expected_expiration_time)
+
+    @property
+    def settlement_epoch(self) -> int | None:
+        return optional_epoch(self.settlement_ts)
+
+    @property
+    def fee_waiver_expiration_epoch(self) -> int | None:
+        return optional_epoch(self.fee_waiver_expiration_time)
+
 
 class MarketsResponse(BaseModel):
     markets: list[Market]                                # List of markets
@@ -119,6 +162,20 @@ class Event(BaseModel):
     strike_period: Optional[str] = None                      # Period strike e.g., "week", "month" (mutually exclusive with strike_date)
     markets: Optional[list[Market]] = None                   # Nested markets (only with with_nested_markets=true)
 
+    @property
+    def strike_epoch(self) -> int | None:
+        return optional_epoch(self.strike_date)
+
+    @property
+    def open_epoch(self) -> int | None:
+        '''Earliest open time of the nested markets'''
+        return min((m.open_epoch for m in self.markets), default=None) if self.markets else None
+
+    @property
+    def close_epoch(self) -> int | None:
+        '''Latest close time of the nested markets'''
+        return max((m.close_epoch for m in self.markets), default=None) if self.markets else None
+
 
 class Milestone(BaseModel):
     id: str                                                  # Unique identifier for the milestone
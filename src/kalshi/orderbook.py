@@ -0,0 +1,173 @@
+import numpy as np
+
+'''
+Local order book for one Kalshi market
+
+Kalshi books hold resting bids on both sides: YES bids and NO bids. A NO bid at p cents is a YES offer at 100 - p,
+so the YES ask is derived from the best NO bid. Prices are whole cents 1-99, which makes each side a 100-slot array
+indexed by price: a delta is one array write, and the best level is tracked incrementally (a rescan only happens
+when the best level empties, and only walks down from it).
+
+Levels may arrive in cents ([price, quantity]) or dollars (["0.4200", quantity]); both are accepted.
+'''
+
+TICKS = 100  # Index = price in cents; slots 1-99 are tradeable
+
+YES = "yes"
+NO = "no"
+
+
+def price_to_cents(price) -> int:
+    '''42 / "42" -> 42 (cents), "0.4200" / 0.42 -> 42 (dollars)'''
+
+    if isinstance(price, str):
+        return int(price) if "." not in price else round(float(price) * 100)
+    if isinstance(price, float):
+        return round(price * 100)
+    return int(price)
+
+
+def _quantity(value) -> int:
+    # Fixed-point strings ("300.00") or plain ints
+    return int(float(value)) if isinstance(value, str) else int(value)
+
+
+def _check_price(price: int):
+    if not 0 < price < TICKS:
+        raise ValueError(f"price {price} outside 1-{TICKS - 1} cents")
+
+
+class _Side:
+    '''One side of the book: quantity per cent and the best (highest) non-empty price'''
+
+    __slots__ = ("levels", "best")
+
+    def __init__(self):
+        self.levels = [0] * TICKS
+        self.best = 0  # 0 -> empty
+
+    def clear(self):
+        self.levels = [0] * TICKS
+        self.best = 0
+
+    def set(self, price: int, quantity: int):
+        _check_price(price)
+
+        levels = self.levels
+        levels[price] = max(0, quantity)
+
+        if levels[price] and price > self.best:
+            self.best = price
+        elif not levels[price] and price == self.best:
+            # Walk down to the next resting level
+            best = price - 1
+            while best > 0 and not levels[best]:
+                best -= 1
+            self.best = best
+
+    def add(self, price: int, delta: int):
+        _check_price(price)
+        self.set(price, self.levels[price] + delta)
+
+    def top(self, n: int) -> list[tuple[int, int]]:
+        '''Up to n (price, quantity) levels, best first'''
+
+        out = []
+        levels = self.levels
+        price = self.best
+
+        while price > 0 and len(out) < n:
+            if levels[price]:
+                out.append((price, levels[price]))
+            price -= 1
+
+        return out
+
+
+class OrderBook:
+    '''
+    Price-level book for one market, fed by snapshot / delta messages.
+
+    book.apply_snapshot(yes=[[42, 100], [41, 250]], no=[[55, 80]])
+    book.apply_delta(YES, 43, 20)
+    book.best_bid(), book.best_ask()      # (43, 20), (45, 80)  - YES side, cents
+    book.depth(5), book.imbalance()
+    '''
+
+    __slots__ = ("ticker", "yes", "no", "seq", "stale")
+
+    def __init__(self, ticker: str):
+        self.ticker = ticker
+        self.yes = _Side()
+        self.no = _Side()
+        self.seq: int | None = None   # Sequence number of the last applied message
+        self.stale = True             # No snapshot yet, or a gap was detected and a resync is pending
+
+    def _side(self, side: str) -> _Side:
+        if side == YES:
+            return self.yes
+        if side == NO:
+            return self.no
+        raise ValueError(f"unknown book side '{side}'")
+
+    # --- UPDATES ---
+
+    def apply_snapshot(self, yes=(), no=(), seq: int | None = None):
+        '''Replace the whole book with [price, quantity] levels per side'''
+
+        for side, levels in ((self.yes, yes), (self.no, no)):
+            side.clear()
+            for price, quantity in levels or ():
+                side.set(price_to_cents(price), _quantity(quantity))
+
+        self.seq = seq
+        self.stale = False
+
+    def apply_delta(self, side: str, price, delta, seq: int | None = None):
+        '''Change the resting quantity at one price by delta contracts'''
+
+        self._side(side).add(price_to_cents(price), _quantity(delta))
+
+        if seq is not None:
+            self.seq = seq
+
+    # --- QUERIES ---
+
+    def best_bid(self) -> tuple[int, int] | None:
+        '''(price, quantity) of the best YES bid, in cents'''
+        price = self.yes.best
+        return (price, self.yes.levels[price]) if price else None
+
+    def best_ask(self) -> tuple[int, int] | None:
+        '''(price, quantity) of the best YES offer, in cents (= 100 - best NO bid)'''
+        price = self.no.best
+        return (TICKS - price, self.no.levels[price]) if price else None
+
+    def spread(self) -> int | None:
+        bid, ask = self.best_bid(), self.best_ask()
+        return ask[0] - bid[0] if bid and ask else None
+
+    def midprice(self) -> float | None:
+        bid, ask = self.best_bid(), self.best_ask()
+        return (ask[0] + bid[0]) / 2 if bid and ask else None
+
+    def depth(self, levels: int = 5) -> dict[str, list[tuple[int, int]]]:
+        '''Top levels per side in YES terms: bids best (highest) first, asks best (lowest) first'''
+
+        return {
+            "bids": self.yes.top(levels),
+            "asks": [(TICKS - price, quantity) for price, quantity in self.no.top(levels)],
+        }
+
+    def imbalance(self, levels: int = 1) -> float | None:
+        '''(bid size - ask size) / (bid size + ask size) over the top `levels` of each side, in [-1, 1]'''
+
+        bid_size = sum(q for _, q in self.yes.top(levels))
+        ask_size = sum(q for _, q in self.no.top(levels))
+        total = bid_size + ask_size
+
+        return (bid_size - ask_size) / total if total else None
+
+    def to_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        '''(yes, no) quantity per cent as int64 arrays of length 100'''
+        return np.array(self.yes.levels, dtype=np.int64), np.array(self.no.levels, dtype=np.int64)
@@ -0,0 +1,295 @@
+import asyncio
+import contextvars
+import time
+from concurrent.futures import wait, FIRST_COMPLETED
+from .transport import endpoint_name
+from .rate_limit import retry_after_seconds
+from .resilience import RETRYABLE_STATUSES, attempt_timeout
+from .decode import loads
+from .errors import KalshiTransportError, KalshiTimeoutError, KalshiHTTPError, KalshiDecodeError
+
+'''
+The request pipeline every client is built on: one logical GET ->
+
+    rate limiter token -> (hedged) attempt on the pooled transport -> retries with backoff under a deadline
+    -> metrics (requests, retries, hedges, errors, JSON decode time)
+
+RequestPipeline / AsyncRequestPipeline are mixins. The class using them provides the attributes below and
+adds the API on top (KalshiClient, PolymarketClient's per-host lanes, ...):
+
+    transport       HttpTransport / AsyncHttpTransport (or anything with get() and timeout)
+    rate_limiter    RateLimiter or None
+    retry           RetryPolicy
+    hedge           HedgePolicy or None (sync: plus _hedge_pool, a ThreadPoolExecutor when hedging)
+    latency         LatencyTracker
+    metrics         Metrics or None
+
+Endpoint labels (rate-limit lanes, latency, metrics) come from _endpoint(path); override it to namespace
+another API's paths.
+
+Work handed to a thread pool (hedges, page prefetch, window / chunk fan-out) goes through submit() / pool_map(),
+which run each task in a copy of the caller's context, so request_priority() and decoding() blocks still apply.
+'''
+
+
+def submit(pool, fn, *args, **kwargs):
+    '''pool.submit(fn, *args, **kwargs) in a copy of the calling thread's contextvars'''
+
+    return pool.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def pool_map(pool, fn, items) -> list:
+    '''list(pool.map(fn, items)), each task in its own copy of the calling thread's contextvars'''
+
+    return [future.result() for future in [submit(pool, fn, item) for item in items]]
+
+
+class _Pipeline:
+
+    def _endpoint(self, path: str) -> str:
+        return endpoint_name(path)
+
+    def _failed(self, endpoint: str, error: Exception) -> Exception:
+        '''Count a call that failed for good, and hand the error back to be raised'''
+
+        if self.metrics is not None:
+            self.metrics.error(endpoint, error)
+
+        return error
+
+    def _json(self, response) -> dict:
+        start = time.perf_counter() if self.metrics is not None else None
+
+        try:
+            data = loads(response.content)
+        except ValueError as exc:
+            raise KalshiDecodeError("response body as JSON", str(response.url), str(exc)) from exc
+
+        if start is not None:
+            self.metrics.stage("json", time.perf_counter() - start)
+
+        return data
+
+
+class RequestPipeline(_Pipeline):
+    '''Blocking request pipeline (see module docstring)'''
+
+    def _attempt(self, endpoint: str, path: str, params: dict | None, timeout, headers: dict | None):
+        '''A single HTTP GET: rate limiter token -> transport -> limiter feedback + latency sample'''
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(endpoint)
+
+        return self._request(endpoint, path, params, timeout, headers)
+
+    def _request(self, endpoint: str, path: str, params: dict | None, timeout, headers: dict | None):
+        '''_attempt with the rate limiter token already taken'''
+
+        start = time.perf_counter()
+        response = self.transport.get(path, params=params, timeout=timeout, headers=headers)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_response(endpoint, response.status_code, response.headers)
+
+        elapsed = time.perf_counter() - start
+
+        if response.status_code < 400:
+            self.latency.record(endpoint, elapsed)
+
+        if self.metrics is not None:
+            self.metrics.request(endpoint, elapsed, response.status_code, len(response.content))
+
+        return response
+
+    def _hedged(self, endpoint: str, path: str, params: dict | None, timeout, headers: dict | None):
+        '''If the first attempt is slower than the hedge threshold, race a duplicate and take the first answer'''
+
+        delay = self.hedge.delay(self.latency, endpoint) if self.hedge is not None else None
+
+        if delay is None:
+            return self._attempt(endpoint, path, params, timeout, headers)
+
+        # Queueing for a token isn't slowness: take it first so the hedge timer only sees the transport, and
+        # a throttled client doesn't spend a second scarce token on every queued request
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(endpoint)
+
+        primary = submit(self._hedge_pool, self._request, endpoint, path, params, timeout, headers)
+        done, _ = wait([primary], timeout=delay)
+
+        if done:
+            return primary.result()
+
+        if self.metrics is not None:
+            self.metrics.hedge(endpoint)
+
+        # The backup takes its own token, only now that it actually fires
+        backup = submit(self._hedge_pool, self._attempt, endpoint, path, params, timeout, headers)
+        done, pending = wait([primary, backup], return_when=FIRST_COMPLETED)
+        first = done.pop()
+
+        # A fast failure shouldn't beat a slow success
+        if first.exception() is not None and pending:
+            return pending.pop().result()
+
+        return first.result()
+
+    def _send(self, path: str, params: dict | None = None, timeout=None, headers: dict | None = None):
+        '''
+        One logical GET: retries transport errors, 429 and 5xx with jittered exponential backoff, bounded
+        by the retry policy's per-call deadline. Anything else >= 400 raises KalshiHTTPError immediately.
+        '''
+
+        endpoint = self._endpoint(path)
+        policy = self.retry
+        timeout = timeout if timeout is not None else self.transport.timeout
+        deadline = time.monotonic() + policy.deadline if policy.deadline is not None else None
+
+        error = None
+
+        for attempt in range(policy.max_attempts):
+            remaining = deadline - time.monotonic() if deadline is not None else None
+
+            if remaining is not None and remaining <= 0:
+                raise self._failed(endpoint, KalshiTimeoutError(f"{path}: {policy.deadline}s deadline exceeded after {attempt} attempt(s)")) from error
+
+            if attempt and self.metrics is not None:
+                self.metrics.retry(endpoint)
+
+            try:
+                response = self._hedged(endpoint, path, params, attempt_timeout(timeout, remaining), headers)
+            except KalshiTransportError as exc:
+                error, delay = exc, policy.backoff(attempt)
+            else:
+                if response.status_code < 400:
+                    return response
+
+                error = KalshiHTTPError(response.status_code, str(response.url), response.text)
+
+                if response.status_code not in RETRYABLE_STATUSES:
+                    raise self._failed(endpoint, error)
+
+                delay = policy.backoff(attempt)
+
+                # With a rate limiter the lane itself stays paused for Retry-After
+                if response.status_code == 429 and self.rate_limiter is None:
+                    delay = max(delay, retry_after_seconds(response.headers))
+
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                break
+
+            if attempt + 1 < policy.max_attempts:
+                time.sleep(delay)
+
+        raise self._failed(endpoint, error)
+
+
+class AsyncRequestPipeline(_Pipeline):
+    '''asyncio request pipeline (see module docstring)'''
+
+    async def _attempt(self, endpoint: str, path: str, params: dict | None, timeout, headers: dict | None):
+        '''See RequestPipeline._attempt'''
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(endpoint)
+
+        return await self._request(endpoint, path, params, timeout, headers)
+
+    async def _request(self, endpoint: str, path: str, params: dict | None, timeout, headers: dict | None):
+        '''See RequestPipeline._request'''
+
+        start = time.perf_counter()
+        response = await self.transport.get(path, params=params, timeout=timeout, headers=headers)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_response(endpoint, response.status_code, response.headers)
+
+        elapsed = time.perf_counter() - start
+
+        if response.status_code < 400:
+            self.latency.record(endpoint, elapsed)
+
+        if self.metrics is not None:
+            self.metrics.request(endpoint, elapsed, response.status_code, len(response.content))
+
+        return response
+
+    async def _hedged(self, endpoint: str, path: str, params: dict | None, timeout, headers: dict | None):
+        '''See RequestPipeline._hedged - here the losing request is cancelled'''
+
+        delay = self.hedge.delay(self.latency, endpoint) if self.hedge is not None else None
+
+        if delay is None:
+            return await self._attempt(endpoint, path, params, timeout, headers)
+
+        # As in RequestPipeline._hedged: the token first, so the hedge timer only sees the transport
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(endpoint)
+
+        racers = [asyncio.ensure_future(self._request(endpoint, path, params, timeout, headers))]
+
+        try:
+            done, _ = await asyncio.wait(racers, timeout=delay)
+
+            if not done:
+                if self.metrics is not None:
+                    self.metrics.hedge(endpoint)
+
+                racers.append(asyncio.ensure_future(self._attempt(endpoint, path, params, timeout, headers)))
+                done, pending = await asyncio.wait(racers, return_when=asyncio.FIRST_COMPLETED)
+
+                first = done.pop()
+                if first.exception() is not None and pending:
+                    return await pending.pop()
+
+                return first.result()
+
+            return racers[0].result()
+        finally:
+            for racer in racers:
+                racer.cancel()
+
+    async def _send(self, path: str, params: dict | None = None, timeout=None, headers: dict | None = None):
+        '''See RequestPipeline._send'''
+
+        endpoint = self._endpoint(path)
+        policy = self.retry
+        timeout = timeout if timeout is not None else self.transport.timeout
+        deadline = time.monotonic() + policy.deadline if policy.deadline is not None else None
+
+        error = None
+
+        for attempt in range(policy.max_attempts):
+            remaining = deadline - time.monotonic() if deadline is not None else None
+
+            if remaining is not None and remaining <= 0:
+                raise self._failed(endpoint, KalshiTimeoutError(f"{path}: {policy.deadline}s deadline exceeded after {attempt} attempt(s)")) from error
+
+            if attempt and self.metrics is not None:
+                self.metrics.retry(endpoint)
+
+            try:
+                response = await self._hedged(endpoint, path, params, attempt_timeout(timeout, remaining), headers)
+            except KalshiTransportError as exc:
+                error, delay = exc, policy.backoff(attempt)
+            else:
+                if response.status_code < 400:
+                    return response
+
+                error = KalshiHTTPError(response.status_code, str(response.url), response.text)
+
+                if response.status_code not in RETRYABLE_STATUSES:
+                    raise self._failed(endpoint, error)
+
+                delay = policy.backoff(attempt)
+
+                if response.status_code == 429 and self.rate_limiter is None:
+                    delay = max(delay, retry_after_seconds(response.headers))
+
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                break
+
+            if attempt + 1 < policy.max_attempts:
+                await asyncio.sleep(delay)
+
+        raise self._failed(endpoint, error)
@@ -0,0 +1,256 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+
+'''
+Client-side rate limiting
+
+Each endpoint maps to a lane ("read" or "candles" for Kalshi, "polymarket.gamma" / "polymarket.clob" for
+PolymarketClient's "polymarket."-prefixed endpoints), each lane is a token bucket, so one limiter can pace both
+venues without one's traffic or 429s eating into the other's budget. Callers waiting on the same
+lane are served in priority order (lower number first, FIFO within a priority), so an interactive market lookup
+jumps ahead of a queued bulk candle backfill instead of waiting behind it.
+
+On a 429 the lane is paused for Retry-After and its rate is halved; successful calls creep the rate back up
+to the configured ceiling (AIMD), so the limiter settles at what the exchange actually allows.
+'''
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_NORMAL = 5
+PRIORITY_BULK = 10
+
+# lane -> (requests per second, burst)
+DEFAULT_LANES: dict[str, tuple[float, int]] = {
+    "read": (10.0, 10),
+    "candles": (10.0, 10),
+    "polymarket.gamma": (25.0, 25),     # Well under Gamma's published per-10s limits
+    "polymarket.clob": (50.0, 50),
+}
+
+DEFAULT_ENDPOINT_LANES: dict[str, str] = {
+    "market_candlesticks": "candles",
+    "event_candlesticks": "candles",
+    "polymarket.prices-history": "polymarket.clob",
+}
+
+# Endpoint prefix -> lane for anything not listed in the endpoint lanes
+DEFAULT_PREFIX_LANES: dict[str, str] = {
+    "polymarket.": "polymarket.gamma",
+}
+
+DEFAULT_ENDPOINT_PRIORITIES: dict[str, int] = {
+    "market": PRIORITY_INTERACTIVE,
+    "series": PRIORITY_INTERACTIVE,
+    "event": PRIORITY_INTERACTIVE,
+    "market_candlesticks": PRIORITY_BULK,
+    "event_candlesticks": PRIORITY_BULK,
+}
+
+DEFAULT_RETRY_AFTER = 1.0     # Seconds to back off on a 429 without a Retry-After header
+_MIN_RATE_FRACTION = 0.1      # Never throttle a lane below 10% of its configured rate
+_RECOVERY_FRACTION = 0.02     # Each success wins back 2% of the configured rate
+
+_priority_override: contextvars.ContextVar[int | None] = contextvars.ContextVar("kalshi_priority", default=None)
+
+
+@contextmanager
+def request_priority(priority: int):
+    '''
+    Override the per-endpoint priority for every request made inside the block (thread- and task-local)
+
+    with request_priority(PRIORITY_BULK):
+        backfill(...)
+    '''
+
+    token = _priority_override.set(priority)
+    try:
+        yield
+    finally:
+        _priority_override.reset(token)
+
+
+def retry_after_seconds(headers, default: float = DEFAULT_RETRY_AFTER) -> float:
+    '''Retry-After as seconds - it may be a delay in seconds or an HTTP date'''
+
+    value = headers.get("Retry-After")
+
+    if value is None:
+        return default
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+class TokenBucket:
+
+    def __init__(self, rate: float, burst: int):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        '''Seconds until one token is available (0 if available now)'''
+
+        self._refill(now)
+
+        if now < self.paused_until:
+            return self.paused_until - now
+
+        return max(0.0, (1.0 - self.tokens) / self.rate)
+
+    def take(self):
+        self.tokens -= 1.0
+
+    def throttle(self, now: float, pause: float):
+        self.paused_until = max(self.paused_until, now + pause)
+        self.tokens = 0.0
+        self.rate = max(self.max_rate * _MIN_RATE_FRACTION, self.rate / 2)
+
+    def recover(self):
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * _RECOVERY_FRACTION)
+
+
+class RateLimiter:
+    '''
+    Token-bucket limiter with per-lane priority queues, shared by threads and asyncio tasks.
+
+    @params
+    lanes: lane -> (requests per second, burst); merged over DEFAULT_LANES
+    endpoint_lanes: endpoint name -> lane (anything unlisted goes by DEFAULT_PREFIX_LANES, else "read")
+    priorities: endpoint name -> default priority (anything unlisted is PRIORITY_NORMAL)
+    '''
+
+    def __init__(self, lanes: dict[str, tuple[float, int]] | None = None, endpoint_lanes: dict[str, str] | None = None,
+                 priorities: dict[str, int] | None = None):
+
+        self.buckets = {lane: TokenBucket(rate, burst) for lane, (rate, burst) in {**DEFAULT_LANES, **(lanes or {})}.items()}
+        self.endpoint_lanes = {**DEFAULT_ENDPOINT_LANES, **(endpoint_lanes or {})}
+        self.priorities = {**DEFAULT_ENDPOINT_PRIORITIES, **(priorities or {})}
+
+        self._cond = threading.Condition()
+        self._queues: dict[str, list[tuple[int, int]]] = {lane: [] for lane in self.buckets}
+        self._seq = itertools.count()
+
+        self.throttled = 0  # 429s seen
+
+    def lane(self, endpoint: str) -> str:
+        lane = self.endpoint_lanes.get(endpoint)
+
+        if lane is not None:
+            return lane
+
+        for prefix, lane in DEFAULT_PREFIX_LANES.items():
+            if endpoint.startswith(prefix):
+                return lane
+
+        return "read"
+
+    def _ticket(self, endpoint: str, priority: int | None) -> tuple[str, tuple[int, int]]:
+
+        if priority is None:
+            priority = _priority_override.get()
+        if priority is None:
+            priority = self.priorities.get(endpoint, PRIORITY_NORMAL)
+
+        lane = self.lane(endpoint)
+        ticket = (priority, next(self._seq))
+        heapq.heappush(self._queues[lane], ticket)
+
+        return lane, ticket
+
+    def _try_take(self, lane: str, ticket: tuple[int, int]) -> float | None:
+        '''Caller holds the lock. 0 -> token taken; otherwise seconds to wait (None: not at the head of the queue)'''
+
+        queue = self._queues[lane]
+
+        if queue[0] != ticket:
+            return None
+
+        bucket = self.buckets[lane]
+        wait = bucket.wait_time(time.monotonic())
+
+        if wait > 0:
+            return wait
+
+        heapq.heappop(queue)
+        bucket.take()
+        self._cond.notify_all()
+
+        return 0.0
+
+    def _abandon(self, lane: str, ticket: tuple[int, int]):
+        queue = self._queues[lane]
+        queue.remove(ticket)
+        heapq.heapify(queue)
+        self._cond.notify_all()
+
+    def acquire(self, endpoint: str, priority: int | None = None):
+        '''Block the calling thread until `endpoint` may send one request'''
+
+        with self._cond:
+            lane, ticket = self._ticket(endpoint, priority)
+
+            try:
+                while (wait := self._try_take(lane, ticket)) != 0:
+                    # Not at the head: woken when the head takes its token (timeout guards against async heads)
+                    self._cond.wait(timeout=wait if wait is not None else 0.05)
+            except BaseException:
+                self._abandon(lane, ticket)
+                raise
+
+    async def acquire_async(self, endpoint: str, priority: int | None = None):
+        '''asyncio flavour of acquire: sleeps the task, never the event loop'''
+
+        with self._cond:
+            lane, ticket = self._ticket(endpoint, priority)
+
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_take(lane, ticket)
+
+                if wait == 0:
+                    return
+
+                await asyncio.sleep(wait if wait is not None else 0.005)
+
+        except BaseException:
+            with self._cond:
+                self._abandon(lane, ticket)
+            raise
+
+    def on_response(self, endpoint: str, status_code: int, headers) -> float:
+        '''Feed back a response; returns seconds the lane is paused for (0 unless it was a 429)'''
+
+        bucket = self.buckets[self.lane(endpoint)]
+
+        with self._cond:
+            if status_code != 429:
+                bucket.recover()
+                return 0.0
+
+            self.throttled += 1
+            pause = retry_after_seconds(headers)
+            bucket.throttle(time.monotonic(), pause)
+
+            return pause
@@ -0,0 +1,81 @@
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+'''
+Retry / deadline / hedging policies shared by KalshiClient and AsyncKalshiClient
+
+Only GETs go through the client, so every request is idempotent and safe to retry or duplicate.
+'''
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 4                                    # Total tries per call (1 disables retries)
+    base_delay: float = 0.25                                 # Seconds; backoff ceiling doubles each attempt
+    max_delay: float = 8.0                                   # Cap on any single backoff sleep
+    deadline: float | None = 30.0                            # Seconds for the whole call, retries included (None: unbounded)
+
+    def backoff(self, attempt: int) -> float:
+        '''"Full jitter" exponential backoff: uniform in [0, min(max_delay, base * 2^attempt)]'''
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    '''
+    Fire a duplicate request when the first hasn't answered within a latency threshold, and take whichever
+    returns first. The threshold is `after` seconds if set, else the endpoint's observed `quantile` latency.
+    '''
+    after: float | None = None                               # Fixed hedge delay in seconds
+    quantile: float = 0.95                                   # Observed latency quantile used when `after` is None
+    min_samples: int = 20                                    # Don't hedge an endpoint until this many latencies are seen
+    endpoints: frozenset[str] | None = frozenset({"market_candlesticks", "event_candlesticks"})  # None: hedge everything
+
+    def delay(self, tracker: "LatencyTracker", endpoint: str) -> float | None:
+        '''Seconds to wait before hedging, or None to not hedge this call'''
+
+        if self.endpoints is not None and endpoint not in self.endpoints:
+            return None
+
+        if self.after is not None:
+            return self.after
+
+        return tracker.quantile(endpoint, self.quantile, self.min_samples)
+
+
+class LatencyTracker:
+    '''Recent successful-request latencies per endpoint (bounded window)'''
+
+    def __init__(self, window: int = 512):
+        self.window = window
+        self._samples: dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float):
+        with self._lock:
+            self._samples.setdefault(endpoint, deque(maxlen=self.window)).append(seconds)
+
+    def quantile(self, endpoint: str, q: float, min_samples: int = 1) -> float | None:
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+
+        if len(samples) < max(1, min_samples):
+            return None
+
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+def attempt_timeout(timeout, remaining: float | None):
+    '''Clamp a (connect, read) or scalar timeout so one attempt can't outlive the call's deadline'''
+
+    if remaining is None:
+        return timeout
+
+    if isinstance(timeout, tuple):
+        return tuple(min(t, remaining) for t in timeout)
+
+    return min(timeout, remaining)
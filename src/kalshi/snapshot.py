@@ -0,0 +1,293 @@
+import threading
+from dataclasses import dataclass, field
+import numpy as np
+from .models import Market, MarketsResponse, EventsResponse, MarketTable
+from .models.market_table import CATEGORY_FIELDS
+
+'''
+Universe snapshots and a change feed
+
+A UniverseSnapshot keeps the hot fields of every market as one (markets, fields) int64 matrix indexed by ticker,
+plus a 64-bit hash per row. Diffing a new pull is then array work: rows whose hash matches are skipped outright,
+and only the rows that differ are compared field by field. The result is a list of MarketChange records.
+
+ChangeFeed holds the latest snapshot and pushes each new pull's changes to subscribers, routed by ticker
+and filtered by field, so a job watching 10 markets never sees the other 20,000:
+
+    feed = ChangeFeed()
+    feed.subscribe(on_price, tickers=["KXHIGHNY-26FEB04-T70"], fields=["yes_bid", "yes_ask"])
+    feed.subscribe(on_settle, kinds=[CHANGED], fields=["status"])
+    feed.update(client.get_market_table())     # diffs against the previous pull, dispatches, keeps the new state
+'''
+
+HOT_FIELDS = ("yes_bid", "yes_ask", "last_price", "volume", "status", "open_interest")
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+_HASH_MULTIPLIER = np.uint64(0x100000001B3)   # FNV-1a 64-bit prime
+_HASH_OFFSET = np.uint64(0xCBF29CE484222325)
+
+# String hot fields (status, ...) are hashed / compared as ids from one process-wide table,
+# so ids agree across snapshots built from different MarketTables
+_string_ids: dict[str, int] = {}
+_strings: list[str] = []
+_string_lock = threading.Lock()
+
+
+def _string_id(value: str) -> int:
+    code = _string_ids.get(value)
+
+    if code is None:
+        with _string_lock:
+            code = _string_ids.setdefault(value, len(_strings))
+            if code == len(_strings):
+                _strings.append(value)
+
+    return code
+
+
+@dataclass(frozen=True)
+class MarketChange:
+    ticker: str
+    kind: str                                                # ADDED, REMOVED or CHANGED
+    fields: dict[str, tuple] = field(default_factory=dict)   # field -> (old, new); old is None when ADDED, new is None when REMOVED
+
+    def only(self, fields) -> "MarketChange | None":
+        '''The same change restricted to `fields` (None if none of them changed)'''
+
+        kept = {name: values for name, values in self.fields.items() if name in fields}
+
+        if not kept:
+            return None
+
+        return MarketChange(self.ticker, self.kind, kept)
+
+
+def _as_table(markets) -> MarketTable:
+    if isinstance(markets, MarketTable):
+        return markets
+    if isinstance(markets, MarketsResponse):
+        return MarketTable.from_markets(markets.markets)
+    if isinstance(markets, EventsResponse):
+        return MarketTable.from_markets([m for event in markets.events for m in (event.markets or [])])
+
+    markets = list(markets)
+    if markets and isinstance(markets[0], Market):
+        return MarketTable.from_markets(markets)
+
+    return MarketTable.from_json(markets)
+
+
+class UniverseSnapshot:
+    '''Hot fields of a market universe, indexed by ticker'''
+
+    def __init__(self, tickers: list[str], values: np.ndarray, fields: tuple[str, ...] = HOT_FIELDS):
+        self.fields = fields
+        self.tickers = tickers
+        self.values = values                                 # (markets, fields) int64; string fields hold _string_id codes
+        self.hashes = self._hash(values)
+        self.index = {ticker: i for i, ticker in enumerate(tickers)}
+        self._string_fields = {i for i, name in enumerate(fields) if name in CATEGORY_FIELDS}
+
+    @classmethod
+    def from_markets(cls, markets, fields: tuple[str, ...] = HOT_FIELDS) -> "UniverseSnapshot":
+        '''From a MarketTable, MarketsResponse, EventsResponse (nested markets), list[Market] or raw market dicts'''
+
+        table = _as_table(markets)
+        columns = []
+
+        for name in fields:
+            if name in table.codes:
+                ids = np.array([_string_id(value) for value in table.categories[name]], dtype=np.int64)
+                columns.append(ids[table.codes[name]] if len(ids) else np.empty(0, np.int64))
+            elif name in table.ints:
+                columns.append(table.ints[name])
+            elif name in table.bools:
+                columns.append(table.bools[name].astype(np.int64))
+            else:
+                raise ValueError(f"'{name}' is not a numeric or categorical Market field and cannot be tracked")
+
+        values = np.column_stack(columns) if columns else np.empty((len(table), 0), np.int64)
+
+        return cls(list(table.tickers), values.astype(np.int64, copy=False).reshape(len(table), len(fields)), fields)
+
+    @staticmethod
+    def _hash(values: np.ndarray) -> np.ndarray:
+        h = np.full(len(values), _HASH_OFFSET, dtype=np.uint64)
+
+        for column in values.view(np.uint64).T:
+            h ^= column
+            h *= _HASH_MULTIPLIER   # Wraps mod 2**64 by design
+
+        return h
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self.index
+
+    def _value(self, j: int, raw: int):
+        return _strings[raw] if j in self._string_fields else raw
+
+    def get(self, ticker: str) -> dict | None:
+        '''Hot fields of one market, or None if it is not in the snapshot'''
+
+        i = self.index.get(ticker)
+
+        if i is None:
+            return None
+
+        return {name: self._value(j, int(self.values[i, j])) for j, name in enumerate(self.fields)}
+
+    def diff(self, new: "UniverseSnapshot", complete: bool = True) -> list[MarketChange]:
+        '''
+        Changes from this snapshot to `new`. complete=False treats `new` as a partial pull (one page, one series):
+        markets missing from it are left alone instead of reported as REMOVED.
+        '''
+
+        if new.fields != self.fields:
+            raise ValueError("snapshots track different fields")
+
+        changes: list[MarketChange] = []
+
+        # Row in self for every row in new (-1: not seen before)
+        old_rows = np.fromiter((self.index.get(t, -1) for t in new.tickers), dtype=np.int64, count=len(new))
+        seen = old_rows >= 0
+
+        for i in np.flatnonzero(~seen):
+            changes.append(MarketChange(new.tickers[i], ADDED, {
+                name: (None, new._value(j, int(new.values[i, j]))) for j, name in enumerate(self.fields)
+            }))
+
+        # Only rows whose hash moved get compared field by field
+        matched = np.flatnonzero(seen)
+        moved = matched[self.hashes[old_rows[matched]] != new.hashes[matched]]
+
+        if len(moved):
+            before = self.values[old_rows[moved]]
+            after = new.values[moved]
+            differs = before != after
+
+            for k, i in enumerate(moved):
+                fields = {self.fields[j]: (self._value(j, int(before[k, j])), new._value(j, int(after[k, j])))
+                          for j in np.flatnonzero(differs[k])}
+                if fields:
+                    changes.append(MarketChange(new.tickers[i], CHANGED, fields))
+
+        if complete and len(self):
+            present = np.zeros(len(self), dtype=bool)
+            present[old_rows[seen]] = True
+
+            for i in np.flatnonzero(~present):
+                changes.append(MarketChange(self.tickers[i], REMOVED, {
+                    name: (self._value(j, int(self.values[i, j])), None) for j, name in enumerate(self.fields)
+                }))
+
+        return changes
+
+    def merge(self, new: "UniverseSnapshot") -> "UniverseSnapshot":
+        '''This snapshot with `new`'s rows layered on top (for partial pulls)'''
+
+        keep = np.array([t not in new.index for t in self.tickers], dtype=bool)
+
+        tickers = [t for t, k in zip(self.tickers, keep) if k] + list(new.tickers)
+        values = np.concatenate([self.values[keep], new.values])
+
+        return UniverseSnapshot(tickers, values, self.fields)
+
+
+@dataclass
+class _Subscription:
+    callback: object
+    tickers: frozenset | None
+    fields: frozenset | None
+    kinds: frozenset | None
+
+
+class ChangeFeed:
+    '''
+    Latest universe state plus subscribers. update() diffs a new pull, stores it, and calls each subscriber
+    with the MarketChanges it asked for (one call per change). Routing is a dict lookup per change, so the
+    cost of reacting scales with the number of changes, not the size of the universe.
+    '''
+
+    def __init__(self, fields: tuple[str, ...] = HOT_FIELDS):
+        self.fields = fields
+        self.snapshot: UniverseSnapshot | None = None
+        self._by_ticker: dict[str, list[_Subscription]] = {}
+        self._any_ticker: list[_Subscription] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback, tickers=None, fields=None, kinds=None):
+        '''
+        callback(change: MarketChange) for changes to `tickers` (default: all) touching `fields` (default: all
+        tracked), of `kinds` (default: ADDED, REMOVED and CHANGED). Changes are trimmed to the subscribed fields.
+        Returns a handle for unsubscribe().
+        '''
+
+        if fields is not None and not set(fields) <= set(self.fields):
+            raise ValueError(f"untracked fields: {sorted(set(fields) - set(self.fields))}")
+
+        subscription = _Subscription(callback, frozenset(tickers) if tickers is not None else None,
+                                     frozenset(fields) if fields is not None else None,
+                                     frozenset(kinds) if kinds is not None else None)
+
+        # Copy-on-write: publish() reads the routing tables without taking the lock
+        with self._lock:
+            if subscription.tickers is None:
+                self._any_ticker = self._any_ticker + [subscription]
+            else:
+                by_ticker = dict(self._by_ticker)
+                for ticker in subscription.tickers:
+                    by_ticker[ticker] = by_ticker.get(ticker, []) + [subscription]
+                self._by_ticker = by_ticker
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            if subscription.tickers is None:
+                self._any_ticker = [s for s in self._any_ticker if s is not subscription]
+            else:
+                by_ticker = dict(self._by_ticker)
+                for ticker in subscription.tickers:
+                    remaining = [s for s in by_ticker.get(ticker, []) if s is not subscription]
+                    if remaining:
+                        by_ticker[ticker] = remaining
+                    else:
+                        by_ticker.pop(ticker, None)
+                self._by_ticker = by_ticker
+
+    def update(self, markets, complete: bool = True) -> list[MarketChange]:
+        '''
+        Diff a new pull against the stored state, dispatch, and keep the new state. The first update only
+        records the baseline (nothing is ADDED). complete=False: `markets` is a partial pull, merged into the state.
+        '''
+
+        new = UniverseSnapshot.from_markets(markets, self.fields)
+
+        if self.snapshot is None:
+            self.snapshot = new
+            return []
+
+        changes = self.snapshot.diff(new, complete)
+        self.snapshot = new if complete else self.snapshot.merge(new)
+
+        self.publish(changes)
+
+        return changes
+
+    def publish(self, changes: list[MarketChange]):
+        by_ticker, any_ticker = self._by_ticker, self._any_ticker
+
+        for change in changes:
+            for subscription in by_ticker.get(change.ticker, []) + any_ticker:
+                if subscription.kinds is not None and change.kind not in subscription.kinds:
+                    continue
+
+                delivered = change.only(subscription.fields) if subscription.fields is not None else change
+                if delivered is not None:
+                    subscription.callback(delivered)
@@ -0,0 +1,141 @@
+import requests
+from requests.adapters import HTTPAdapter
+from .errors import KalshiTransportError, KalshiTimeoutError
+
+BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
+
+DEFAULT_TIMEOUT = (3.05, 15.0)   # (connect, read) seconds
+DEFAULT_POOL_CONNECTIONS = 4     # Distinct hosts kept in the pool
+DEFAULT_POOL_MAXSIZE = 16        # Keep-alive sockets per host
+
+
+def endpoint_name(path: str) -> str:
+    '''
+    Stable label for an API path, used to key cache TTLs (and other per-endpoint settings)
+
+    series -> series_list, series/X -> series, series/X/markets/Y/candlesticks -> market_candlesticks,
+    series/X/events/Y/candlesticks -> event_candlesticks, markets/X -> market, events/X -> event, ...
+    '''
+
+    parts = path.strip("/").split("/")
+
+    if parts[-1] == "candlesticks":
+        return "market_candlesticks" if "markets" in parts else "event_candlesticks"
+    if parts[0] == "search":
+        return "tags"
+    if len(parts) == 1:
+        return {"series": "series_list"}.get(parts[0], parts[0])
+
+    # Single-object lookups: singular name
+    return {"markets": "market", "events": "event"}.get(parts[0], parts[0])
+
+
+class HttpTransport:
+    '''
+    Pooled, keep-alive HTTP transport owned by a KalshiClient.
+
+    One requests.Session holds a urllib3 connection pool per host, so a sweep over
+    hundreds of markets reuses a handful of sockets instead of paying a TCP+TLS
+    handshake per call. Responses are gzip negotiated and every request carries a timeout.
+    '''
+
+    def __init__(self, base_url: str = BASE_URL, pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE, timeout=DEFAULT_TIMEOUT, headers: dict | None = None):
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+        # pool_block keeps the socket count bounded when more threads than sockets share the client
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=True)
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+
+        if headers:
+            self.session.headers.update(headers)
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def get(self, path: str, params: dict | None = None, timeout=None, headers: dict | None = None) -> requests.Response:
+        # requests drops None-valued params, so optional filters can be passed straight through
+        try:
+            return self.session.get(self.url(path), params=params, headers=headers,
+                                    timeout=timeout if timeout is not None else self.timeout)
+        except requests.Timeout as exc:
+            raise KalshiTimeoutError(f"GET {path} timed out: {exc}") from exc
+        except requests.RequestException as exc:
+            raise KalshiTransportError(f"GET {path} failed: {exc}") from exc
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AsyncHttpTransport:
+    '''
+    asyncio counterpart of HttpTransport, backed by an httpx.AsyncClient connection pool.
+
+    httpx is only imported when an async transport is created, so sync-only users don't need it.
+    '''
+
+    def __init__(self, base_url: str = BASE_URL, max_connections: int = DEFAULT_POOL_MAXSIZE,
+                 max_keepalive_connections: int = DEFAULT_POOL_MAXSIZE, timeout=DEFAULT_TIMEOUT, headers: dict | None = None):
+        import httpx
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections),
+            timeout=_httpx_timeout(timeout),
+            headers={"Accept": "application/json", "Accept-Encoding": "gzip, deflate", **(headers or {})},
+        )
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    async def get(self, path: str, params: dict | None = None, timeout=None, headers: dict | None = None):
+        # httpx sends None-valued params as empty strings, so drop them to match requests
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+
+        kwargs = {"timeout": _httpx_timeout(timeout)} if timeout is not None else {}
+
+        import httpx
+
+        try:
+            return await self.client.get(self.url(path), params=params, headers=headers, **kwargs)
+        except httpx.TimeoutException as exc:
+            raise KalshiTimeoutError(f"GET {path} timed out: {exc!r}") from exc
+        except httpx.TransportError as exc:
+            raise KalshiTransportError(f"GET {path} failed: {exc!r}") from exc
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+
+def _httpx_timeout(timeout):
+    # Accept the same (connect, read) tuples HttpTransport takes
+    import httpx
+
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+
+    return httpx.Timeout(read, connect=connect)
@@ -0,0 +1,7 @@
+from .polymarket_client import PolymarketClient, GAMMA_URL, CLOB_URL
+from .async_polymarket_client import AsyncPolymarketClient
+from .history import history_columns, history_to_ta_data
+from .models import PolymarketMarket, PolymarketEvent, PricePoint, PriceHistory
+
+__all__ = ['PolymarketClient', 'AsyncPolymarketClient', 'GAMMA_URL', 'CLOB_URL', 'history_columns', 'history_to_ta_data',
+           'PolymarketMarket', 'PolymarketEvent', 'PricePoint', 'PriceHistory']
@@ -0,0 +1,228 @@
+import asyncio
+import time
+from typing import AsyncIterator
+from pydantic import ValidationError
+from ..kalshi.transport import AsyncHttpTransport, DEFAULT_POOL_MAXSIZE, DEFAULT_TIMEOUT, endpoint_name
+from ..kalshi.rate_limit import RateLimiter
+from ..kalshi.resilience import RetryPolicy, HedgePolicy, LatencyTracker
+from ..kalshi.pipeline import AsyncRequestPipeline
+from ..kalshi.metrics import Metrics
+from ..kalshi.decode import DecodePolicy, as_policy, current_policy, build, build_json
+from ..kalshi.coalesce import AsyncSingleFlight, coalesced_async as coalesced, chunked
+from ..kalshi.cache import ResponseCache
+from ..kalshi.errors import KalshiDecodeError
+from .models import PolymarketMarket, PolymarketEvent, PriceHistory
+from .history import history_columns, DEFAULT_FIDELITY
+from .polymarket_client import GAMMA_URL, CLOB_URL, MAX_IDS_PER_REQUEST, HISTORY_CONCURRENCY, _market_params, _event_params, _history_params
+
+
+class _AsyncLane(AsyncRequestPipeline):
+    '''One host's asyncio request pipeline; policies are shared with the owning client'''
+
+    def __init__(self, client: "AsyncPolymarketClient", transport: AsyncHttpTransport):
+        self.transport = transport
+        self.rate_limiter = client.rate_limiter
+        self.retry = client.retry
+        self.hedge = client.hedge
+        self.latency = LatencyTracker()
+        self.metrics = client.metrics
+
+    def _endpoint(self, path: str) -> str:
+        return f"polymarket.{endpoint_name(path)}"
+
+
+class AsyncPolymarketClient:
+    '''
+    asyncio mirror of PolymarketClient: same methods, same models, awaited. gather_price_histories pulls
+    many tokens' histories `concurrency` requests at a time over the CLOB lane's connection pool.
+    '''
+
+    def __init__(self, gamma_url=GAMMA_URL, clob_url=CLOB_URL, gamma_transport: AsyncHttpTransport | None = None,
+                 clob_transport: AsyncHttpTransport | None = None, max_connections=DEFAULT_POOL_MAXSIZE, timeout=DEFAULT_TIMEOUT,
+                 rate_limiter: RateLimiter | None = None, retry: RetryPolicy = RetryPolicy(), hedge: HedgePolicy | None = None,
+                 metrics: Metrics | None = None, coalesce: bool = True, decode: DecodePolicy | str | None = None):
+
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.hedge = hedge
+        self.metrics = metrics
+        self.decode = as_policy(decode)
+        self._flights = AsyncSingleFlight() if coalesce else None
+
+        self._owned = [t is None for t in (gamma_transport, clob_transport)]
+        self.gamma = _AsyncLane(self, gamma_transport or AsyncHttpTransport(base_url=gamma_url, max_connections=max_connections, timeout=timeout))
+        self.clob = _AsyncLane(self, clob_transport or AsyncHttpTransport(base_url=clob_url, max_connections=max_connections, timeout=timeout))
+
+    async def aclose(self):
+        for lane, owned in zip((self.gamma, self.clob), self._owned):
+            if owned:
+                await lane.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def _get(self, lane: _AsyncLane, path: str, params: dict | None = None):
+        '''See PolymarketClient._get'''
+
+        async def fetch():
+            return lane._json(await lane._send(path, params=params))
+
+        if self._flights is None:
+            return await fetch()
+
+        return await self._flights.do(("GET", lane.transport.base_url, ResponseCache.key(path, params)), fetch)
+
+    def _parse(self, model, data: dict):
+        start = time.perf_counter() if self.metrics is not None else None
+
+        try:
+            parsed = build(model, data, current_policy(self.decode))
+        except (ValidationError, TypeError) as exc:
+            raise KalshiDecodeError(model.__name__, model.__module__, str(exc)) from exc
+
+        if start is not None:
+            self.metrics.stage(f"model.{model.__name__}", time.perf_counter() - start)
+
+        return parsed
+
+    async def _get_model(self, lane: _AsyncLane, model, path: str, params: dict | None = None):
+        '''See PolymarketClient._get_model'''
+
+        async def fetch():
+            response = await lane._send(path, params=params)
+            start = time.perf_counter() if self.metrics is not None else None
+
+            try:
+                parsed = build_json(model, response.content, current_policy(self.decode))
+            except (ValidationError, TypeError) as exc:
+                raise KalshiDecodeError(model.__name__, str(response.url), str(exc)) from exc
+
+            if start is not None:
+                self.metrics.stage(f"model.{model.__name__}", time.perf_counter() - start)
+
+            return parsed
+
+        if self._flights is None:
+            return await fetch()
+
+        return await self._flights.do(("MODEL", model, current_policy(self.decode), lane.transport.base_url, ResponseCache.key(path, params)), fetch)
+
+    async def _paginate(self, path: str, params: dict, limit: int) -> AsyncIterator[list[dict]]:
+        '''See PolymarketClient._paginate - page N+1 is requested while the caller consumes page N'''
+
+        offset = 0
+        pending = asyncio.ensure_future(self._get(self.gamma, path, {**params, "limit": limit, "offset": offset}))
+
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+
+                if not page:
+                    break
+
+                offset += len(page)
+                pending = asyncio.ensure_future(self._get(self.gamma, path, {**params, "limit": limit, "offset": offset}))
+
+                yield page
+        finally:
+            # Caller stopped early - don't leave the prefetch dangling
+            if pending is not None:
+                pending.cancel()
+
+    async def _bounded_gather(self, coros, concurrency: int) -> list:
+        '''Run coroutines with at most `concurrency` in flight; results keep input order'''
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(coro):
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(run(c) for c in coros))
+
+    # --- MARKETS (GAMMA) ---
+
+    async def get_markets(self, limit=100, offset=0, active=True, closed=False, tag_id=None, order=None, ascending=None) -> list[PolymarketMarket]:
+
+        page = await self._get(self.gamma, "markets", {**_market_params(active, closed, tag_id=tag_id, order=order, ascending=ascending),
+                                                        "limit": limit, "offset": offset})
+
+        return [self._parse(PolymarketMarket, market) for market in page]
+
+    async def iter_markets(self, active=True, closed=False, tag_id=None, page_size=500) -> AsyncIterator[PolymarketMarket]:
+
+        async for page in self._paginate("markets", _market_params(active, closed, tag_id=tag_id), page_size):
+            for market in page:
+                yield self._parse(PolymarketMarket, market)
+
+    async def get_market_table(self, active=True, closed=False, tag_id=None, page_size=500):
+        '''See PolymarketClient.get_market_table'''
+
+        from ..venues.schema import VenueTable
+
+        markets = []
+        async for page in self._paginate("markets", _market_params(active, closed, tag_id=tag_id), page_size):
+            markets.extend(page)
+
+        return VenueTable.from_polymarket(markets)
+
+    @coalesced
+    async def get_market(self, market_id: str) -> PolymarketMarket:
+        return await self._get_model(self.gamma, PolymarketMarket, f"markets/{market_id}")
+
+    async def get_markets_by_id(self, market_ids: list[str], concurrency=HISTORY_CONCURRENCY) -> dict[str, PolymarketMarket]:
+        '''See PolymarketClient.get_markets_by_id; chunks are fetched concurrently'''
+
+        chunks = chunked([str(i) for i in market_ids], MAX_IDS_PER_REQUEST)
+        pages = await self._bounded_gather([self._get(self.gamma, "markets", {"id": chunk, "limit": len(chunk)}) for chunk in chunks], concurrency)
+        found = {market["id"]: market for page in pages for market in page}
+
+        return {i: self._parse(PolymarketMarket, found[i]) for i in dict.fromkeys(map(str, market_ids)) if i in found}
+
+    # --- EVENTS (GAMMA) ---
+
+    async def get_events(self, limit=100, offset=0, active=True, closed=False, tag_id=None) -> list[PolymarketEvent]:
+
+        page = await self._get(self.gamma, "events", {**_event_params(active, closed, tag_id), "limit": limit, "offset": offset})
+
+        return [self._parse(PolymarketEvent, event) for event in page]
+
+    async def iter_events(self, active=True, closed=False, tag_id=None, page_size=200) -> AsyncIterator[PolymarketEvent]:
+
+        async for page in self._paginate("events", _event_params(active, closed, tag_id), page_size):
+            for event in page:
+                yield self._parse(PolymarketEvent, event)
+
+    @coalesced
+    async def get_event(self, event_id: str) -> PolymarketEvent:
+        return await self._get_model(self.gamma, PolymarketEvent, f"events/{event_id}")
+
+    # --- PRICES (CLOB) ---
+
+    async def get_price_history(self, token_id: str, start_ts=None, end_ts=None, fidelity=DEFAULT_FIDELITY, interval=None,
+                                as_frame=False, as_columns=False, period_interval=None, spread=None) -> PriceHistory:
+        '''See PolymarketClient.get_price_history'''
+
+        params = _history_params(token_id, start_ts, end_ts, fidelity, interval)
+
+        if not (as_frame or as_columns):
+            return await self._get_model(self.clob, PriceHistory, "prices-history", params)
+
+        raw = await self._get(self.clob, "prices-history", params)
+        columns = history_columns(raw, period_interval or fidelity, spread)
+
+        if as_frame:
+            from ..utils.candlestick import candle_columns_to_ta_frame
+            return candle_columns_to_ta_frame(columns, period_interval or fidelity)
+
+        return columns
+
+    async def gather_price_histories(self, token_ids: list[str], start_ts=None, end_ts=None, fidelity=DEFAULT_FIDELITY, interval=None,
+                                     as_frame=False, as_columns=False, period_interval=None, spread=None, concurrency=HISTORY_CONCURRENCY) -> list:
+
+        return await self._bounded_gather(
+            [self.get_price_history(t, start_ts, end_ts, fidelity, interval, as_frame, as_columns, period_interval, spread) for t in token_ids], concurrency)
@@ -0,0 +1,117 @@
+import numpy as np
+from ..kalshi.metrics import timed
+from ..technical_analysis import Data
+from ..utils.candle_columns import CANDLE_COLUMNS
+from ..utils.resample import bucket_ends
+
+'''
+CLOB price history -> the candle layout the Kalshi side uses
+
+/prices-history answers with bare (t, p) points: one price per `fidelity` minutes, no quotes, no volume. They are
+bucketed into period_interval-minute bars with the same bucket rule as utils.resample (a bar ending at `end`
+covers (end - period, end]) and written out as CANDLE_COLUMNS, so everything downstream of a Kalshi candle
+decode - candle_columns_to_ta_frame, CandleStore, resample_candle_columns, the indicator engines - takes a
+Polymarket market unchanged:
+
+    price open / high / low / close / mean      from the points in the bar; previous is the prior bar's close
+    yes_bid / yes_ask OHLC                      NaN, unless a `spread` is given: then price -+ spread / 2 (clipped to [0, 1])
+    volume_fp / open_interest_fp                NaN (the endpoint doesn't report them)
+
+Backtests fill at the bid / ask, so pass a spread (e.g. the market's current Gamma `spread`) to backtest a
+Polymarket frame; with the default the quote columns stay NaN rather than pretending the book was free.
+'''
+
+DEFAULT_FIDELITY = 1   # Minutes between history points (and the default bar size)
+
+
+def _points(history) -> tuple[np.ndarray, np.ndarray]:
+    '''(t, p) arrays, time-sorted, from a PriceHistory, a raw {"history": [...]} body, raw points or PricePoints'''
+
+    points = getattr(history, "history", history)
+    if isinstance(points, dict):
+        points = points["history"]
+
+    n = len(points)
+
+    try:
+        if n and isinstance(points[0], dict):
+            t = np.fromiter((point["t"] for point in points), np.int64, n)
+            p = np.fromiter((point["p"] for point in points), np.float64, n)
+        else:
+            t = np.fromiter((point.t for point in points), np.int64, n)
+            p = np.fromiter((point.p for point in points), np.float64, n)
+    except (AttributeError, KeyError, TypeError, ValueError) as exc:
+        raise ValueError("malformed price history point") from exc
+
+    if n > 1 and (np.diff(t) < 0).any():
+        order = np.argsort(t, kind="stable")
+        t, p = t[order], p[order]
+
+    return t, p
+
+
+@timed("history_columns")
+def history_columns(history, period_interval: int = DEFAULT_FIDELITY, spread: float | None = None) -> dict[str, np.ndarray]:
+    '''Price history -> {column: array} in the CANDLE_COLUMNS layout, one row per period_interval-minute bar with points'''
+
+    t, p = _points(history)
+    n = len(t)
+
+    if not n:
+        return {name: np.empty(0, dtype=np.int64 if name == "end_period_ts" else np.float64) for name in CANDLE_COLUMNS}
+
+    buckets = bucket_ends(t, period_interval)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    sizes = np.diff(np.r_[starts, n])
+
+    ohlc = {
+        "open": p[starts],
+        "low": np.minimum.reduceat(p, starts),
+        "high": np.maximum.reduceat(p, starts),
+        "close": p[starts + sizes - 1],
+    }
+
+    out = {"end_period_ts": buckets[starts]}
+    bars = len(starts)
+
+    for side, shift in (("yes_bid", -1), ("yes_ask", 1)):
+        for k, values in ohlc.items():
+            out[f"{side}_{k}_dollars"] = np.full(bars, np.nan) if spread is None else np.clip(values + shift * spread / 2, 0.0, 1.0)
+
+    for k, values in ohlc.items():
+        out[f"price_{k}_dollars"] = values
+
+    out["price_mean_dollars"] = np.add.reduceat(p, starts) / sizes
+    out["price_previous_dollars"] = np.r_[np.nan, ohlc["close"][:-1]]
+    out["volume_fp"] = np.full(bars, np.nan)
+    out["open_interest_fp"] = np.full(bars, np.nan)
+
+    return {name: out[name] for name in CANDLE_COLUMNS}
+
+
+def history_to_ta_data(history, period_interval: int = DEFAULT_FIDELITY, spread: float | None = None) -> list[Data]:
+    '''Per-bar technical_analysis.Data models (to_ta_data's output for a Kalshi market)'''
+
+    columns = history_columns(history, period_interval, spread)
+
+    end_ts = columns["end_period_ts"]
+    ask = columns["yes_ask_close_dollars"]
+    bid = columns["yes_bid_close_dollars"]
+
+    return [
+        Data(
+            start_ts=int(end) - period_interval * 60,
+            end_ts=int(end),
+            open=float(columns["price_open_dollars"][i]),
+            close=float(columns["price_close_dollars"][i]),
+            high=float(columns["price_high_dollars"][i]),
+            low=float(columns["price_low_dollars"][i]),
+            volume=float(columns["volume_fp"][i]),
+            ask=float(ask[i]),
+            bid=float(bid[i]),
+            spread=float(ask[i] - bid[i]),
+            midprice=float((ask[i] + bid[i]) / 2),
+            open_interest=float(columns["open_interest_fp"][i]),
+        )
+        for i, end in enumerate(end_ts)
+    ]
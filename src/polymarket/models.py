@@ -0,0 +1,100 @@
+from pydantic import BaseModel
+from typing import Optional
+from ..kalshi.decode import loads
+from ..utils.time import optional_epoch
+
+'''
+Polymarket API models. Field names are the wire keys (camelCase), like the Kalshi models use the Kalshi keys,
+so responses unpack with model(**data) and the decode fast paths apply unchanged.
+
+Gamma (market metadata) sends outcomes, outcomePrices and clobTokenIds as JSON-encoded strings; the
+outcome_* / token_ids properties decode them. Prices are probabilities in [0, 1] - dollars per share,
+the same scale as Kalshi's *_dollars fields.
+'''
+
+
+def _decode_list(value: str | list | None) -> list:
+    if value is None or value == "":
+        return []
+    if isinstance(value, list):
+        return value
+    return loads(value)
+
+
+class PolymarketMarket(BaseModel):
+    id: str                                              # Gamma market id
+    question: str                                        # Market question ("Will ... ?")
+    conditionId: str                                     # CTF condition id (0x...)
+    slug: str                                            # URL slug
+    endDate: Optional[str] = None                        # ISO 8601 scheduled end
+    startDate: Optional[str] = None                      # ISO 8601 start
+    description: Optional[str] = None                    # Resolution rules
+    groupItemTitle: Optional[str] = None                 # Outcome label inside a multi-market event (e.g. "70-74°F")
+    outcomes: Optional[str] = None                       # JSON list of outcome names, e.g. '["Yes", "No"]'
+    outcomePrices: Optional[str] = None                  # JSON list of prices, same order as outcomes
+    clobTokenIds: Optional[str] = None                   # JSON list of CLOB token ids, same order as outcomes
+    active: Optional[bool] = None                        # Listed
+    closed: Optional[bool] = None                        # No longer trading
+    archived: Optional[bool] = None
+    acceptingOrders: Optional[bool] = None
+    bestBid: Optional[float] = None                      # Best bid for the first outcome
+    bestAsk: Optional[float] = None                      # Best ask for the first outcome
+    lastTradePrice: Optional[float] = None
+    spread: Optional[float] = None
+    volumeNum: Optional[float] = None                    # Lifetime volume (USDC)
+    volume24hr: Optional[float] = None
+    liquidityNum: Optional[float] = None                 # Resting liquidity (USDC)
+    orderPriceMinTickSize: Optional[float] = None
+    negRisk: Optional[bool] = None
+    events: Optional[list[dict]] = None                  # Parent event(s), abbreviated (id, slug, title, ...)
+
+    @property
+    def outcome_names(self) -> list[str]:
+        return _decode_list(self.outcomes)
+
+    @property
+    def outcome_prices(self) -> list[float]:
+        return [float(p) for p in _decode_list(self.outcomePrices)]
+
+    @property
+    def token_ids(self) -> list[str]:
+        return [str(t) for t in _decode_list(self.clobTokenIds)]
+
+    @property
+    def yes_token_id(self) -> str | None:
+        '''CLOB token of the first ("Yes") outcome - what price history and order books are keyed by'''
+        tokens = self.token_ids
+        return tokens[0] if tokens else None
+
+    @property
+    def event_id(self) -> str | None:
+        return str(self.events[0]["id"]) if self.events else None
+
+    @property
+    def end_epoch(self) -> int | None:
+        return optional_epoch(self.endDate)
+
+
+class PolymarketEvent(BaseModel):
+    id: str                                              # Gamma event id
+    slug: str                                            # URL slug
+    title: str                                           # Event title
+    ticker: Optional[str] = None
+    description: Optional[str] = None
+    startDate: Optional[str] = None
+    endDate: Optional[str] = None
+    active: Optional[bool] = None
+    closed: Optional[bool] = None
+    volume: Optional[float] = None
+    liquidity: Optional[float] = None
+    negRisk: Optional[bool] = None
+    markets: Optional[list[PolymarketMarket]] = None     # The event's markets (one per outcome for multi-outcome events)
+
+
+class PricePoint(BaseModel):
+    t: int                                               # Unix seconds
+    p: float                                             # Price of the token at t
+
+
+class PriceHistory(BaseModel):
+    history: list[PricePoint]                            # CLOB /prices-history points, oldest first
@@ -0,0 +1,289 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+from pydantic import ValidationError
+from ..kalshi.transport import HttpTransport, DEFAULT_POOL_MAXSIZE, DEFAULT_TIMEOUT, endpoint_name
+from ..kalshi.rate_limit import RateLimiter
+from ..kalshi.resilience import RetryPolicy, HedgePolicy, LatencyTracker
+from ..kalshi.pipeline import RequestPipeline, submit, pool_map
+from ..kalshi.metrics import Metrics
+from ..kalshi.decode import DecodePolicy, as_policy, current_policy, build, build_json
+from ..kalshi.coalesce import SingleFlight, coalesced, chunked
+from ..kalshi.cache import ResponseCache
+from ..kalshi.errors import KalshiDecodeError
+from .models import PolymarketMarket, PolymarketEvent, PriceHistory
+from .history import history_columns, DEFAULT_FIDELITY
+
+'''
+POLYMARKET Semantics: Event v.s. Market v.s. Token
+
+Event (e.g. "NYC high temperature on Feb 4")
+  └── Market (one yes/no question, a CTF condition)
+       └── Token (Yes)  -- what the CLOB trades and prices are quoted on
+       └── Token (No)
+
+Two hosts: Gamma (GAMMA_URL) serves market / event metadata with offset paging, the CLOB (CLOB_URL) serves
+prices. Each host gets its own lane - a pooled HttpTransport behind the same request pipeline KalshiClient uses
+(rate limiter, retries under a deadline, optional hedging, metrics) - so failures, latency and pacing are tracked
+per host. Endpoint labels are prefixed "polymarket." (polymarket.markets, polymarket.prices-history, ...) so one
+Metrics / RateLimiter can be shared with a KalshiClient without the venues' numbers mixing: the limiter puts
+Gamma and CLOB endpoints in their own "polymarket.gamma" / "polymarket.clob" lanes, apart from Kalshi's.
+
+Errors are the shared pipeline's: KalshiTransportError / KalshiTimeoutError / KalshiHTTPError / KalshiDecodeError
+(the names predate the second venue; catching KalshiError covers both clients).
+'''
+
+GAMMA_URL = "https://gamma-api.polymarket.com"
+CLOB_URL = "https://clob.polymarket.com"
+
+MAX_IDS_PER_REQUEST = 50   # Market ids per /markets?id=...&id=... request
+HISTORY_CONCURRENCY = 8    # Price histories in flight in get_price_histories
+
+
+class _Lane(RequestPipeline):
+    '''One host's request pipeline; policies are shared with the owning client'''
+
+    def __init__(self, client: "PolymarketClient", transport: HttpTransport):
+        self.transport = transport
+        self.rate_limiter = client.rate_limiter
+        self.retry = client.retry
+        self.hedge = client.hedge
+        self.latency = LatencyTracker()
+        self.metrics = client.metrics
+        self._hedge_pool = client._hedge_pool
+
+    def _endpoint(self, path: str) -> str:
+        return f"polymarket.{endpoint_name(path)}"
+
+
+class PolymarketClient:
+
+    def __init__(self, gamma_url=GAMMA_URL, clob_url=CLOB_URL, gamma_transport: HttpTransport | None = None,
+                 clob_transport: HttpTransport | None = None, pool_maxsize=DEFAULT_POOL_MAXSIZE, timeout=DEFAULT_TIMEOUT,
+                 rate_limiter: RateLimiter | None = None, retry: RetryPolicy = RetryPolicy(), hedge: HedgePolicy | None = None,
+                 metrics: Metrics | None = None, coalesce: bool = True, decode: DecodePolicy | str | None = None):
+
+        # Same knobs as KalshiClient (no API key: the read endpoints are public)
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.hedge = hedge
+        self.metrics = metrics
+        self.decode = as_policy(decode)
+
+        self._flights = SingleFlight() if coalesce else None
+        self._hedge_pool = ThreadPoolExecutor(max_workers=pool_maxsize) if hedge is not None else None
+
+        # Share caller-provided transports, or own them (and close them with the client)
+        self._owned = [t is None for t in (gamma_transport, clob_transport)]
+        self.gamma = _Lane(self, gamma_transport or HttpTransport(base_url=gamma_url, pool_maxsize=pool_maxsize, timeout=timeout))
+        self.clob = _Lane(self, clob_transport or HttpTransport(base_url=clob_url, pool_maxsize=pool_maxsize, timeout=timeout))
+
+    def close(self):
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+
+        for lane, owned in zip((self.gamma, self.clob), self._owned):
+            if owned:
+                lane.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _get(self, lane: _Lane, path: str, params: dict | None = None):
+        '''Decoded JSON (Gamma list endpoints answer with a bare list); identical in-flight GETs share one response'''
+
+        def fetch():
+            return lane._json(lane._send(path, params=params))
+
+        if self._flights is None:
+            return fetch()
+
+        return self._flights.do(("GET", lane.transport.base_url, ResponseCache.key(path, params)), fetch)
+
+    def _parse(self, model, data: dict):
+        '''Build a response model, surfacing schema mismatches as KalshiDecodeError'''
+
+        start = time.perf_counter() if self.metrics is not None else None
+
+        try:
+            parsed = build(model, data, current_policy(self.decode))
+        except (ValidationError, TypeError) as exc:
+            raise KalshiDecodeError(model.__name__, model.__module__, str(exc)) from exc
+
+        if start is not None:
+            self.metrics.stage(f"model.{model.__name__}", time.perf_counter() - start)
+
+        return parsed
+
+    def _get_model(self, lane: _Lane, model, path: str, params: dict | None = None):
+        '''Response body straight into `model` in one pass (see KalshiClient._get_model)'''
+
+        def fetch():
+            response = lane._send(path, params=params)
+            start = time.perf_counter() if self.metrics is not None else None
+
+            try:
+                parsed = build_json(model, response.content, current_policy(self.decode))
+            except (ValidationError, TypeError) as exc:
+                raise KalshiDecodeError(model.__name__, str(response.url), str(exc)) from exc
+
+            if start is not None:
+                self.metrics.stage(f"model.{model.__name__}", time.perf_counter() - start)
+
+            return parsed
+
+        if self._flights is None:
+            return fetch()
+
+        return self._flights.do(("MODEL", model, current_policy(self.decode), lane.transport.base_url, ResponseCache.key(path, params)), fetch)
+
+    def _paginate(self, path: str, params: dict, limit: int) -> Iterator[list[dict]]:
+        '''
+        Walk a Gamma list endpoint by offset, yielding one raw page at a time. Like KalshiClient._paginate, the next
+        page is requested in the background as soon as the current one arrives. Gamma may cap `limit` below what
+        was asked, so the offset advances by what came back and only an empty page marks the end.
+        '''
+
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            offset = 0
+            pending = submit(prefetcher, self._get, self.gamma, path, {**params, "limit": limit, "offset": offset})
+
+            while pending is not None:
+                page = pending.result()
+
+                if not page:
+                    break
+
+                offset += len(page)
+                pending = submit(prefetcher, self._get, self.gamma, path, {**params, "limit": limit, "offset": offset})
+
+                yield page
+
+    # --- MARKETS (GAMMA) ---
+
+    def get_markets(self, limit=100, offset=0, active=True, closed=False, tag_id=None, order=None, ascending=None) -> list[PolymarketMarket]:
+        '''One page of markets; iter_markets / get_market_table walk every page'''
+
+        page = self._get(self.gamma, "markets", {**_market_params(active, closed, tag_id=tag_id, order=order, ascending=ascending),
+                                                  "limit": limit, "offset": offset})
+
+        return [self._parse(PolymarketMarket, market) for market in page]
+
+    def iter_markets(self, active=True, closed=False, tag_id=None, page_size=500) -> Iterator[PolymarketMarket]:
+        '''Every market matching the filters, across all pages, with flat memory'''
+
+        for page in self._paginate("markets", _market_params(active, closed, tag_id=tag_id), page_size):
+            for market in page:
+                yield self._parse(PolymarketMarket, market)
+
+    def iter_market_pages(self, active=True, closed=False, tag_id=None, page_size=500) -> Iterator[list[dict]]:
+        '''Raw market pages (what VenueTable.from_polymarket takes), no models built'''
+
+        return self._paginate("markets", _market_params(active, closed, tag_id=tag_id), page_size)
+
+    def get_market_table(self, active=True, closed=False, tag_id=None, page_size=500):
+        '''Every market matching the filters as one venues.VenueTable, built from the raw pages (no models)'''
+
+        from ..venues.schema import VenueTable
+
+        return VenueTable.from_polymarket([m for page in self.iter_market_pages(active, closed, tag_id, page_size) for m in page])
+
+    @coalesced
+    def get_market(self, market_id: str) -> PolymarketMarket:
+        return self._get_model(self.gamma, PolymarketMarket, f"markets/{market_id}")
+
+    def get_markets_by_id(self, market_ids: list[str]) -> dict[str, PolymarketMarket]:
+        '''
+        Batch get_market: id -> PolymarketMarket (input order) in one /markets call per MAX_IDS_PER_REQUEST ids.
+        Ids Gamma doesn't know are missing from the result.
+        '''
+
+        found = {}
+
+        for chunk in chunked([str(i) for i in market_ids], MAX_IDS_PER_REQUEST):
+            page = self._get(self.gamma, "markets", {"id": chunk, "limit": len(chunk)})
+            found.update((market["id"], market) for market in page)
+
+        return {i: self._parse(PolymarketMarket, found[i]) for i in dict.fromkeys(map(str, market_ids)) if i in found}
+
+    # --- EVENTS (GAMMA) ---
+
+    def get_events(self, limit=100, offset=0, active=True, closed=False, tag_id=None) -> list[PolymarketEvent]:
+        '''One page of events, each with its nested markets'''
+
+        page = self._get(self.gamma, "events", {**_event_params(active, closed, tag_id), "limit": limit, "offset": offset})
+
+        return [self._parse(PolymarketEvent, event) for event in page]
+
+    def iter_events(self, active=True, closed=False, tag_id=None, page_size=200) -> Iterator[PolymarketEvent]:
+        '''Every event matching the filters, across all pages'''
+
+        for page in self._paginate("events", _event_params(active, closed, tag_id), page_size):
+            for event in page:
+                yield self._parse(PolymarketEvent, event)
+
+    @coalesced
+    def get_event(self, event_id: str) -> PolymarketEvent:
+        return self._get_model(self.gamma, PolymarketEvent, f"events/{event_id}")
+
+    # --- PRICES (CLOB) ---
+
+    def get_price_history(self, token_id: str, start_ts=None, end_ts=None, fidelity=DEFAULT_FIDELITY, interval=None,
+                          as_frame=False, as_columns=False, period_interval=None, spread=None) -> PriceHistory:
+        '''
+        @params
+        token_id: CLOB token (PolymarketMarket.yes_token_id for the Yes side)
+        start_ts / end_ts: Unix seconds bounds; or interval ("1h", "1d", "1w", "max", ...) relative to now
+        fidelity: resolution of the returned points in minutes
+        as_frame: bucket the points into period_interval-minute bars (default: fidelity) and return the to_ta_data
+                  DataFrame - the same technical_analysis.Data columns KalshiClient.get_market_candle_sticks(as_frame=True) returns
+        as_columns: the same bars in the CANDLE_COLUMNS layout (what CandleStore appends and resample_candle_columns takes)
+        spread: bid / ask width to synthesize the quote columns from (see history.py); None leaves them NaN
+        '''
+
+        params = _history_params(token_id, start_ts, end_ts, fidelity, interval)
+
+        if not (as_frame or as_columns):
+            return self._get_model(self.clob, PriceHistory, "prices-history", params)
+
+        raw = self._get(self.clob, "prices-history", params)
+        columns = history_columns(raw, period_interval or fidelity, spread)
+
+        # pandas is only loaded when a frame is asked for
+        if as_frame:
+            from ..utils.candlestick import candle_columns_to_ta_frame
+            return candle_columns_to_ta_frame(columns, period_interval or fidelity)
+
+        return columns
+
+    def get_price_histories(self, token_ids: list[str], start_ts=None, end_ts=None, fidelity=DEFAULT_FIDELITY, interval=None,
+                            as_frame=False, as_columns=False, period_interval=None, spread=None, workers=HISTORY_CONCURRENCY) -> list:
+        '''get_price_history for many tokens on a thread pool; results keep input order'''
+
+        def fetch(token_id):
+            return self.get_price_history(token_id, start_ts, end_ts, fidelity, interval, as_frame, as_columns, period_interval, spread)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(token_ids)))) as pool:
+            return pool_map(pool, fetch, token_ids)
+
+
+def _flag(value):
+    # Gamma wants lowercase booleans; None leaves the filter off
+    return None if value is None else str(bool(value)).lower()
+
+
+def _market_params(active, closed, tag_id=None, order=None, ascending=None) -> dict:
+    return {"active": _flag(active), "closed": _flag(closed), "tag_id": tag_id, "order": order, "ascending": _flag(ascending)}
+
+
+def _event_params(active, closed, tag_id=None) -> dict:
+    return {"active": _flag(active), "closed": _flag(closed), "tag_id": tag_id}
+
+
+def _history_params(token_id: str, start_ts, end_ts, fidelity, interval) -> dict:
+    # interval is relative to now, so it only applies when no explicit bounds are given
+    return {"market": token_id, "startTs": start_ts, "endTs": end_ts, "fidelity": fidelity,
+            "interval": interval if start_ts is None and end_ts is None else None}
@@ -0,0 +1,3 @@
+from .scanner import scan, rsi_midline_signals, SIGNAL_COLUMNS
+
+__all__ = ['scan', 'rsi_midline_signals', 'SIGNAL_COLUMNS']
@@ -0,0 +1,161 @@
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+from ..kalshi.errors import KalshiError
+from ..kalshi.pipeline import submit
+from ..kalshi.models import Series, Market
+from ..technical_analysis import crossover, crossunder, const_to_series
+from ..trading_constants import DEFAULT_TIMEFRAME
+
+'''
+Multi-market RSI-midline scanner
+
+    markets (series / category / events)
+      └── candles fetched on a thread pool (I/O bound, overlaps network waits)
+           └── chunks of close arrays shipped to a process pool (CPU bound indicator math, one core each)
+                └── one signals table: ticker | ts | signal | price
+
+Chunks are submitted as soon as enough markets have arrived, so indicator work starts while the rest are still downloading.
+A series, event or market whose lookup or candle download fails (settled market 404, timeout, bad body) is skipped and
+reported in the returned errors instead of sinking the whole scan.
+'''
+
+SIGNAL_COLUMNS = ["ticker", "ts", "signal", "price"]
+
+DEFAULT_IO_WORKERS = 16
+DEFAULT_CHUNK_SIZE = 32     # Markets per process-pool task
+
+
+def rsi_midline_signals(close: pd.Series, rsi_length: int = 7, midline: float = 50) -> tuple[pd.Series, pd.Series]:
+    '''(buy, sell) boolean series: RSI crossing above / below the midline (same rule as kalshi_client __main__)'''
+
+    rsi = ta.rsi(close, length=rsi_length)
+    line = const_to_series(midline, len(close))
+
+    return crossover(rsi, line), crossunder(rsi, line)
+
+
+def _scan_chunk(chunk: list[tuple[str, np.ndarray, np.ndarray]], rsi_length: int, midline: float) -> list[tuple]:
+    '''Process-pool task: plain arrays in, signal rows out (cheap to pickle both ways)'''
+
+    rows = []
+
+    for ticker, end_ts, close in chunk:
+        if len(close) <= rsi_length:
+            continue
+
+        buy, sell = rsi_midline_signals(pd.Series(close), rsi_length, midline)
+
+        for i in np.flatnonzero(buy.to_numpy()):
+            rows.append((ticker, int(end_ts[i]), "buy", float(close[i])))
+        for i in np.flatnonzero(sell.to_numpy()):
+            rows.append((ticker, int(end_ts[i]), "sell", float(close[i])))
+
+    return rows
+
+
+def _resolve_markets(client, series_tickers, category, event_tickers, status, errors: dict) -> list[tuple[Series, Market]]:
+    '''(series, market) pairs to scan; lookups that fail land in `errors` keyed by category / series / event ticker'''
+
+    pairs: list[tuple[Series, Market]] = []
+    series_list: list[Series] = []
+
+    if category:
+        try:
+            series_list.extend(client.iter_series(category=category))
+        except KalshiError as e:
+            errors[category] = e
+
+    for ticker in series_tickers or []:
+        try:
+            series_list.append(client.get_series(ticker))
+        except KalshiError as e:
+            errors[ticker] = e
+
+    for series in series_list:
+        try:
+            pairs.extend((series, market) for market in list(client.iter_markets(status=status, series_ticker=series.ticker)))
+        except KalshiError as e:
+            errors[series.ticker] = e
+
+    for ticker in event_tickers or []:
+        try:
+            event = client.get_event(ticker).event
+            series = client.get_series(event.series_ticker)
+        except KalshiError as e:
+            errors[ticker] = e
+            continue
+
+        pairs.extend((series, market) for market in event.markets or [])
+
+    return pairs
+
+
+def scan(client, series_tickers: list[str] | None = None, category: str | None = None, event_tickers: list[str] | None = None,
+         status="open", period_interval=DEFAULT_TIMEFRAME, rsi_length: int = 7, midline: float = 50,
+         processes: int | None = None, io_workers: int = DEFAULT_IO_WORKERS, chunk_size: int = DEFAULT_CHUNK_SIZE) -> tuple[pd.DataFrame, dict[str, KalshiError]]:
+    '''
+    Run the RSI-midline strategy over every market of the given series, category and/or events.
+
+    @params
+    client: KalshiClient (shared by the I/O threads - pair it with a RateLimiter for big scans)
+    processes: indicator worker processes (None: one per core, 0: compute in this process)
+    io_workers: concurrent candle downloads
+    chunk_size: markets per indicator task
+
+    Returns (signals, errors):
+        signals: one row per signal - ticker, ts (candle end_ts), signal ("buy"/"sell"), price (close)
+        errors: {category / series / event / market ticker: KalshiError} for everything that was skipped
+    '''
+
+    errors: dict[str, KalshiError] = {}
+    pairs = _resolve_markets(client, series_tickers, category, event_tickers, status, errors)
+
+    rows: list[tuple] = []
+    pool = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")) if processes != 0 else None
+
+    try:
+        tasks = []
+        chunk: list[tuple[str, np.ndarray, np.ndarray]] = []
+
+        def submit_chunk(chunk):
+            if pool is None:
+                rows.extend(_scan_chunk(chunk, rsi_length, midline))
+            else:
+                tasks.append(pool.submit(_scan_chunk, chunk, rsi_length, midline))
+
+        with ThreadPoolExecutor(max_workers=io_workers) as io:
+            downloads = {submit(io, client.get_market_candle_sticks, series, market, period_interval, as_frame=True): market.ticker
+                         for series, market in pairs}
+
+            for download in as_completed(downloads):
+                try:
+                    df = download.result()
+                except KalshiError as e:
+                    errors[downloads[download]] = e
+                    continue
+
+                if df is None or df.empty:
+                    continue
+
+                chunk.append((downloads[download], df["end_ts"].to_numpy(), df["close"].to_numpy()))
+
+                if len(chunk) >= chunk_size:
+                    submit_chunk(chunk)
+                    chunk = []
+
+        if chunk:
+            submit_chunk(chunk)
+
+        for task in tasks:
+            rows.extend(task.result())
+
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    signals = pd.DataFrame(rows, columns=SIGNAL_COLUMNS)
+
+    return signals.sort_values(["ticker", "ts"], ignore_index=True), errors
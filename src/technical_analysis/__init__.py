@@ -1,4 +1,38 @@
+import importlib
 from .models import Data
-from .ta import crossover, crossunder, const_to_series
 
-__all__ = ['TechnicalAnalysis']
\ No newline at end of file
+'''
+Data is a plain pydantic model and is always loaded; the indicator, matrix, backtest and fee modules pull in
+pandas / pandas_ta / numpy, so they are imported the first time one of their names is used.
+'''
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    **dict.fromkeys(("crossover", "crossunder", "const_to_series"), "ta"),
+    **dict.fromkeys(("IndicatorEngine", "RSI", "EMA", "SMA", "BollingerBands", "Spread", "Midprice", "Crossover", "Crossunder", "rsi_midline_engine"), "streaming"),
+    **dict.fromkeys(("BacktestResult", "backtest", "simulate", "sweep_market", "parameter_sweep"), "backtest"),
+    **dict.fromkeys(("kalshi_fees",), "fees"),
+}
+
+__all__ = ['Data', 'crossover', 'crossunder', 'const_to_series',
+           'IndicatorEngine', 'RSI', 'EMA', 'SMA', 'BollingerBands', 'Spread', 'Midprice', 'Crossover', 'Crossunder', 'rsi_midline_engine',
+           'BacktestResult', 'backtest', 'simulate', 'kalshi_fees', 'sweep_market', 'parameter_sweep', 'matrix']
+
+
+def __getattr__(name: str):
+    if name == "matrix":
+        return importlib.import_module(".matrix", __name__)
+
+    module = _EXPORTS.get(name)
+
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value   # Later lookups skip __getattr__
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
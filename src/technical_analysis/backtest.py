@@ -0,0 +1,191 @@
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+from .fees import kalshi_fees
+
+'''
+Vectorized backtests over to_ta_data frames (columns of technical_analysis.Data plus boolean buy / sell columns)
+
+Long-only YES contracts. A buy signal opens the position, a sell signal closes it; fills happen `delay` bars after
+the signal (no look-ahead) - buys lift the ask, sells hit the bid, both pay the Kalshi taker fee. Equity is cash
+plus the open position marked at the bid (what it could be sold for right now).
+
+Everything runs on (strategies x bars) arrays, so a parameter grid is simulated in one pass per market.
+'''
+
+@dataclass
+class BacktestResult:
+    position: np.ndarray                                     # Contracts held after each bar
+    equity: np.ndarray                                       # Cash + position marked at bid, per bar (dollars)
+    pnl: float                                               # Final equity
+    fees: float                                              # Total fees paid
+    trades: int                                              # Fills (entries + exits)
+    max_drawdown: float                                      # Largest peak-to-trough equity drop
+
+    def summary(self) -> dict:
+        return {"pnl": self.pnl, "fees": self.fees, "trades": self.trades, "max_drawdown": self.max_drawdown}
+
+
+def _forward_fill_position(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    '''(k, n) signals -> (k, n) 0/1 state: 1 from a buy until the next sell (a bar with both counts as a buy)'''
+
+    state = np.where(buy, 1.0, np.where(sell, 0.0, np.nan))
+    n = state.shape[1]
+
+    # Index of the latest bar with a signal, carried forward along time
+    last = np.where(np.isnan(state), -1, np.arange(n))
+    last = np.maximum.accumulate(last, axis=1)
+
+    filled = np.take_along_axis(state, np.maximum(last, 0), axis=1)
+
+    return np.where(last >= 0, filled, 0.0)
+
+
+def simulate(buy: np.ndarray, sell: np.ndarray, ask: np.ndarray, bid: np.ndarray, contracts: float = 1.0,
+             fee_type: str = "quadratic", fee_multiplier: float = 1.0, delay: int = 1) -> dict[str, np.ndarray]:
+    '''
+    Core engine: k strategies' (k, n) buy/sell signals against one market's (n,) ask/bid.
+    Returns {"position", "equity"} as (k, n) and {"pnl", "fees", "trades", "max_drawdown"} as (k,).
+    '''
+
+    buy = np.atleast_2d(np.asarray(buy, dtype=bool))
+    sell = np.atleast_2d(np.asarray(sell, dtype=bool))
+    ask = np.asarray(ask, dtype=np.float64)
+    bid = np.asarray(bid, dtype=np.float64)
+
+    target = _forward_fill_position(buy, sell)
+
+    # Act on the signal `delay` bars later
+    position = np.zeros_like(target)
+    if delay > 0:
+        position[:, delay:] = target[:, :-delay]
+    else:
+        position = target
+
+    fills = np.diff(position, axis=1, prepend=0.0)
+    entries = fills > 0
+    exits = fills < 0
+
+    entry_fee = kalshi_fees(ask, contracts, fee_type, fee_multiplier)
+    exit_fee = kalshi_fees(bid, contracts, fee_type, fee_multiplier)
+
+    fees = entries * entry_fee + exits * exit_fee
+    cash_flow = exits * (contracts * bid) - entries * (contracts * ask) - fees
+
+    equity = np.cumsum(cash_flow, axis=1) + position * contracts * bid
+    drawdown = np.maximum.accumulate(equity, axis=1) - equity
+
+    return {
+        "position": position * contracts,
+        "equity": equity,
+        "pnl": equity[:, -1] if equity.shape[1] else np.zeros(len(equity)),
+        "fees": fees.sum(axis=1),
+        "trades": (entries | exits).sum(axis=1),
+        "max_drawdown": drawdown.max(axis=1, initial=0.0),
+    }
+
+
+def backtest(df: pd.DataFrame, series=None, buy_column="buy", sell_column="sell", contracts: float = 1.0,
+             fee_type: str = "quadratic", fee_multiplier: float = 1.0, delay: int = 1) -> BacktestResult:
+    '''
+    Backtest one frame's buy/sell columns. Fees come from `series` (a kalshi Series: fee_type / fee_multiplier)
+    when given, else from the keyword arguments.
+    '''
+
+    if series is not None:
+        fee_type, fee_multiplier = series.fee_type, series.fee_multiplier
+
+    out = simulate(df[buy_column].to_numpy(), df[sell_column].to_numpy(), df["ask"].to_numpy(), df["bid"].to_numpy(),
+                   contracts, fee_type, fee_multiplier, delay)
+
+    return BacktestResult(
+        position=out["position"][0],
+        equity=out["equity"][0],
+        pnl=float(out["pnl"][0]),
+        fees=float(out["fees"][0]),
+        trades=int(out["trades"][0]),
+        max_drawdown=float(out["max_drawdown"][0]),
+    )
+
+
+# --- PARAMETER SWEEPS ---
+
+def _threshold_crosses(rsi: np.ndarray, levels: np.ndarray, above: bool) -> np.ndarray:
+    '''(len(levels), n) crossover / crossunder of one RSI series against each constant level (ta.py semantics)'''
+
+    current = rsi[None, :]
+    previous = np.concatenate([[np.nan], rsi[:-1]])[None, :]
+    levels = levels[:, None]
+
+    with np.errstate(invalid="ignore"):
+        if above:
+            return (current > levels) & (previous <= levels)
+        return (current < levels) & (previous >= levels)
+
+
+def sweep_market(df: pd.DataFrame, rsi_lengths, buy_levels, sell_levels, contracts: float = 1.0,
+                 fee_type: str = "quadratic", fee_multiplier: float = 1.0, delay: int = 1) -> pd.DataFrame:
+    '''
+    Every (rsi_length, buy_level, sell_level) combination on one market: buy when RSI crosses above buy_level,
+    sell when it crosses below sell_level. One RSI per length; all threshold pairs simulated as one (k, n) batch.
+    '''
+
+    close = df["close"].reset_index(drop=True)
+    ask, bid = df["ask"].to_numpy(), df["bid"].to_numpy()
+
+    level_pairs = np.array(list(itertools.product(buy_levels, sell_levels)), dtype=np.float64).reshape(-1, 2)
+    frames = []
+
+    for length in rsi_lengths:
+        rsi = ta.rsi(close, length=length)
+        rsi = rsi.to_numpy(dtype=np.float64) if rsi is not None else np.full(len(close), np.nan)
+
+        buy = _threshold_crosses(rsi, level_pairs[:, 0], above=True)
+        sell = _threshold_crosses(rsi, level_pairs[:, 1], above=False)
+
+        out = simulate(buy, sell, ask, bid, contracts, fee_type, fee_multiplier, delay)
+
+        frames.append(pd.DataFrame({
+            "rsi_length": length,
+            "buy_level": level_pairs[:, 0],
+            "sell_level": level_pairs[:, 1],
+            "pnl": out["pnl"],
+            "fees": out["fees"],
+            "trades": out["trades"],
+            "max_drawdown": out["max_drawdown"],
+        }))
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def _sweep_task(ticker, df, rsi_lengths, buy_levels, sell_levels, contracts, fee_type, fee_multiplier, delay) -> pd.DataFrame:
+    result = sweep_market(df, rsi_lengths, buy_levels, sell_levels, contracts, fee_type, fee_multiplier, delay)
+    result.insert(0, "ticker", ticker)
+    return result
+
+
+def parameter_sweep(frames: dict[str, pd.DataFrame], rsi_lengths=(7, 14), buy_levels=(30, 50), sell_levels=(50, 70),
+                    contracts: float = 1.0, fee_type: str = "quadratic", fee_multiplier: float = 1.0, delay: int = 1,
+                    processes: int | None = None) -> pd.DataFrame:
+    '''
+    Sweep the grid over many markets ({ticker: to_ta_data frame}) across a process pool (processes=0: in-process).
+    One row per (ticker, rsi_length, buy_level, sell_level).
+    '''
+
+    args = [(ticker, df[["close", "ask", "bid"]], rsi_lengths, buy_levels, sell_levels, contracts, fee_type, fee_multiplier, delay)
+            for ticker, df in frames.items()]
+
+    if not args:
+        return pd.DataFrame(columns=["ticker", "rsi_length", "buy_level", "sell_level", "pnl", "fees", "trades", "max_drawdown"])
+
+    if processes == 0:
+        results = [_sweep_task(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results = list(pool.map(_sweep_task, *zip(*args)))
+
+    return pd.concat(results, ignore_index=True)
@@ -0,0 +1,21 @@
+import numpy as np
+
+'''
+Kalshi trading fees - numpy only, so fee-aware code (venues gaps, backtests) shares one schedule without loading
+the DataFrame / indicator stack.
+'''
+
+TAKER_FEE_RATE = 0.07   # Kalshi general taker rate: fee = ceil_to_cent(rate * multiplier * C * P * (1 - P))
+QUADRATIC_FEE_TYPES = {"quadratic", "quadratic_with_maker_fees"}
+
+
+def kalshi_fees(price: np.ndarray, contracts: float, fee_type: str = "quadratic", fee_multiplier: float = 1.0) -> np.ndarray:
+    '''Per-fill fee in dollars for `contracts` at `price` (dollars), rounded up to the cent'''
+
+    if fee_type not in QUADRATIC_FEE_TYPES:
+        raise ValueError(f"unsupported fee_type '{fee_type}' (expected one of {sorted(QUADRATIC_FEE_TYPES)})")
+
+    raw = TAKER_FEE_RATE * fee_multiplier * contracts * price * (1 - price)
+
+    # Tiny epsilon so exact cent amounts don't round up an extra cent through float error
+    return np.ceil(raw * 100 - 1e-9) / 100
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+'''
+Indicators and signals over whole (markets x time) matrices, one call for every market at once
+
+Rows are markets, columns are time (the Panel layout). Each function equals its single-series counterpart
+applied row by row, NaN handling included:
+
+    crossover(a, b)     == ta.crossover          (b may be a matrix, a per-market column or a constant)
+    crossunder(a, b)    == ta.crossunder
+    sma(x, length)      == ta.sma                (rolling mean, min_periods=length)
+    ema(x, length)      == ta.ema                (SMA seed, then ewm(span=length, adjust=False))
+    rsi(x, length)      == ta.rsi                (Wilder RMA = ewm(alpha=1/length, adjust=True, min_periods=length))
+
+The recursive ones run through pandas' column-wise ewm / rolling kernels on the transposed matrix, so
+the per-market loop happens in C rather than Python.
+'''
+
+
+def _previous(a: np.ndarray) -> np.ndarray:
+    '''a shifted one step along time, NaN in the first column (Series.shift(1) per row)'''
+
+    shifted = np.empty_like(a, dtype=np.float64)
+    shifted[..., 0] = np.nan
+    shifted[..., 1:] = a[..., :-1]
+    return shifted
+
+
+def crossover(a: np.ndarray, b) -> np.ndarray:
+    a = np.asarray(a, dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        return (a > b) & (_previous(a) <= b)
+
+
+def crossunder(a: np.ndarray, b) -> np.ndarray:
+    a = np.asarray(a, dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        return (a < b) & (_previous(a) >= b)
+
+
+def _by_column(x: np.ndarray) -> pd.DataFrame:
+    # (markets, time) -> time-indexed frame with one column per market
+    return pd.DataFrame(np.atleast_2d(np.asarray(x, dtype=np.float64)).T)
+
+
+def sma(x: np.ndarray, length: int = 10) -> np.ndarray:
+    return _by_column(x).rolling(length, min_periods=length).mean().to_numpy().T
+
+
+def ema(x: np.ndarray, length: int = 10) -> np.ndarray:
+
+    frame = _by_column(x)
+
+    # ta.ema: first `length` values replaced by their mean, the rest fed through an adjust=False EWM
+    seeded = frame.copy()
+    seeded.iloc[:length - 1] = np.nan
+    seeded.iloc[length - 1:length] = frame.iloc[:length].mean().to_numpy()
+
+    return seeded.ewm(span=length, adjust=False).mean().to_numpy().T
+
+
+def rsi(x: np.ndarray, length: int = 14, scalar: float = 100.0) -> np.ndarray:
+
+    change = _by_column(x).diff()
+
+    alpha = 1.0 / length
+    gains = change.clip(lower=0).ewm(alpha=alpha, min_periods=length).mean()
+    losses = change.clip(upper=0).ewm(alpha=alpha, min_periods=length).mean().abs()
+
+    return (scalar * gains / (gains + losses)).to_numpy().T
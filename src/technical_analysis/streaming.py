@@ -0,0 +1,263 @@
+import math
+from collections import deque
+from .models import Data
+
+'''
+Incremental indicators: O(1) state updates per new Data bar instead of recomputing over the whole history.
+
+Each indicator reproduces the batch pandas_ta / pandas formula it replaces, NaN handling included
+(untraded periods have NaN OHLC), so streaming and batch values agree to floating point tolerance:
+
+    RSI(length)              == ta.rsi(close, length)              (Wilder RMA = ewm(alpha=1/length, adjust=True))
+    EMA(length)              == ta.ema(close, length)              (SMA seed, then ewm(span=length, adjust=False))
+    SMA(length)              == ta.sma(close, length)              (rolling mean, NaN anywhere in window -> NaN)
+    BollingerBands(length)   == ta.bbands(close, length, std)      (SMA +/- std * rolling stdev, ddof=0)
+    Crossover / Crossunder   == crossover / crossunder in ta.py
+'''
+
+NAN = float("nan")
+
+
+class _EWM:
+    '''One step of pandas' ewm().mean() recursion (ignore_na=False), so results match pandas bar for bar'''
+
+    __slots__ = ("alpha", "adjust", "min_periods", "weighted", "old_wt", "nobs")
+
+    def __init__(self, alpha: float, adjust: bool, min_periods: int = 0):
+        self.alpha = alpha
+        self.adjust = adjust
+        self.min_periods = max(1, min_periods)
+        self.weighted = NAN
+        self.old_wt = 1.0
+        self.nobs = 0
+
+    def update(self, x: float) -> float:
+
+        is_observation = x == x
+        self.nobs += is_observation
+
+        if self.weighted == self.weighted:
+            # Missing values still age the existing weights (ignore_na=False)
+            self.old_wt *= 1.0 - self.alpha
+
+            if is_observation:
+                new_wt = 1.0 if self.adjust else self.alpha
+
+                if self.weighted != x:
+                    self.weighted = (self.old_wt * self.weighted + new_wt * x) / (self.old_wt + new_wt)
+
+                self.old_wt = self.old_wt + new_wt if self.adjust else 1.0
+
+        elif is_observation:
+            self.weighted = x
+
+        return self.weighted if self.nobs >= self.min_periods else NAN
+
+
+class SMA:
+
+    def __init__(self, length: int = 10):
+        self.length = length
+        self.window: deque[float] = deque(maxlen=length)
+        self.total = 0.0
+        self.missing = 0  # NaNs currently inside the window
+        self.value = NAN
+
+    def update(self, x: float) -> float:
+
+        if len(self.window) == self.length:
+            old = self.window[0]
+            if old == old:
+                self.total -= old
+            else:
+                self.missing -= 1
+
+        self.window.append(x)
+
+        if x == x:
+            self.total += x
+        else:
+            self.missing += 1
+
+        full = len(self.window) == self.length and self.missing == 0
+        self.value = self.total / self.length if full else NAN
+
+        return self.value
+
+
+class EMA:
+
+    def __init__(self, length: int = 10):
+        self.length = length
+        self.seed: list[float] = []  # First `length` closes, averaged into the starting value
+        self.ewm = _EWM(alpha=2.0 / (length + 1), adjust=False)
+        self.value = NAN
+
+    def update(self, x: float) -> float:
+
+        if len(self.seed) < self.length:
+            self.seed.append(x)
+
+            if len(self.seed) < self.length:
+                return NAN
+
+            # pandas mean() skips NaN; an all-NaN seed stays NaN and the EWM starts at the next real close
+            observed = [v for v in self.seed if v == v]
+            x = sum(observed) / len(observed) if observed else NAN
+
+        self.value = self.ewm.update(x)
+
+        return self.value
+
+
+class RSI:
+
+    def __init__(self, length: int = 14, scalar: float = 100.0):
+        self.scalar = scalar
+        self.gains = _EWM(alpha=1.0 / length, adjust=True, min_periods=length)
+        self.losses = _EWM(alpha=1.0 / length, adjust=True, min_periods=length)
+        self.previous = NAN
+        self.value = NAN
+
+    def update(self, x: float) -> float:
+
+        change = x - self.previous  # NaN on the first bar or next to an untraded bar, like Series.diff()
+        self.previous = x
+
+        gain = max(change, 0.0) if change == change else NAN
+        loss = min(change, 0.0) if change == change else NAN
+
+        average_gain = self.gains.update(gain)
+        average_loss = abs(self.losses.update(loss))
+
+        denominator = average_gain + average_loss
+        self.value = self.scalar * average_gain / denominator if denominator else NAN
+
+        return self.value
+
+
+class BollingerBands:
+    '''Returns (lower, mid, upper) per bar'''
+
+    def __init__(self, length: int = 5, std: float = 2.0):
+        self.length = length
+        self.std = std
+        self.mid = SMA(length)
+        self.squares = SMA(length)
+        self.value = (NAN, NAN, NAN)
+
+    def update(self, x: float) -> tuple[float, float, float]:
+
+        mean = self.mid.update(x)
+        mean_of_squares = self.squares.update(x * x)
+
+        # Population variance from running sums; clamp the tiny negatives rounding can produce
+        deviation = math.sqrt(max(0.0, mean_of_squares - mean * mean)) if mean == mean else NAN
+
+        self.value = (mean - self.std * deviation, mean, mean + self.std * deviation)
+
+        return self.value
+
+
+class Spread:
+    '''Bar-level ask - bid'''
+
+    def __init__(self):
+        self.value = NAN
+
+    def update(self, bar: Data) -> float:
+        self.value = bar.ask - bar.bid
+        return self.value
+
+
+class Midprice:
+    '''Bar-level (ask + bid) / 2'''
+
+    def __init__(self):
+        self.value = NAN
+
+    def update(self, bar: Data) -> float:
+        self.value = (bar.ask + bar.bid) / 2
+        return self.value
+
+
+class Crossover:
+    '''a crosses above b: a > b now, and the previous a was <= the current b (same as ta.crossover)'''
+
+    def __init__(self):
+        self.previous = NAN
+        self.value = False
+
+    def update(self, a: float, b: float) -> bool:
+        self.value = a > b and self.previous <= b
+        self.previous = a
+        return self.value
+
+
+class Crossunder:
+    '''a crosses below b: a < b now, and the previous a was >= the current b (same as ta.crossunder)'''
+
+    def __init__(self):
+        self.previous = NAN
+        self.value = False
+
+    def update(self, a: float, b: float) -> bool:
+        self.value = a < b and self.previous >= b
+        self.previous = a
+        return self.value
+
+
+# Indicators that read the whole bar rather than a single field
+_BAR_INDICATORS = (Spread, Midprice)
+
+
+class IndicatorEngine:
+    '''
+    Named indicators and signals for one market, advanced one Data bar at a time.
+
+    engine = IndicatorEngine()
+    engine.add("rsi", RSI(7))                          # fed bar.close
+    engine.add_signal("buy", Crossover(), "rsi", 50)   # rsi crossing above a constant 50
+    engine.add_signal("sell", Crossunder(), "rsi", 50)
+    row = engine.update(bar)                           # {"rsi": 61.2, "buy": True, "sell": False}
+    '''
+
+    def __init__(self):
+        self.indicators: list[tuple[str, object, str]] = []
+        self.signals: list[tuple[str, Crossover | Crossunder, str | float, str | float]] = []
+        self.values: dict = {}
+
+    def add(self, name: str, indicator, source: str = "close") -> "IndicatorEngine":
+        self.indicators.append((name, indicator, source))
+        return self
+
+    def add_signal(self, name: str, detector: Crossover | Crossunder, a: str | float, b: str | float) -> "IndicatorEngine":
+        '''a / b are names of earlier outputs or bar fields, or constants'''
+        self.signals.append((name, detector, a, b))
+        return self
+
+    def _resolve(self, operand, bar: Data) -> float:
+        if isinstance(operand, str):
+            return self.values[operand] if operand in self.values else getattr(bar, operand)
+        return operand
+
+    def update(self, bar: Data) -> dict:
+
+        values = self.values
+
+        for name, indicator, source in self.indicators:
+            values[name] = indicator.update(bar if isinstance(indicator, _BAR_INDICATORS) else getattr(bar, source))
+
+        for name, detector, a, b in self.signals:
+            values[name] = detector.update(self._resolve(a, bar), self._resolve(b, bar))
+
+        return dict(values)
+
+
+def rsi_midline_engine(length: int = 7, midline: float = 50) -> IndicatorEngine:
+    '''Streaming version of the RSI-midline strategy: rsi of close, buy/sell on midline crosses'''
+
+    return (IndicatorEngine()
+            .add("rsi", RSI(length))
+            .add_signal("buy", Crossover(), "rsi", midline)
+            .add_signal("sell", Crossunder(), "rsi", midline))
@@ -1,4 +1,37 @@
-from .dataframe import pydantic_model_to_dataframe
-from .time import iso_to_unix, get_start_ts, get_end_ts, unix_to_datestr
-from .candlestick import unwrap_candlestick, unwrap_candlesticks, to_ta_data, kalshi_candlestick_to_ta_data
-from .plotting import plot_rsi
\ No newline at end of file
+import importlib
+
+'''
+Everything here needs pandas and/or numpy (plotting also plotext), so nothing is imported up front:
+`from ..utils import to_ta_frame` loads utils.candlestick (and pandas) on first use. The client only
+needs utils.time, and importing the kalshi package stays free of the DataFrame stack.
+'''
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "pydantic_model_to_dataframe": "dataframe",
+    **dict.fromkeys(("iso_to_unix", "get_start_ts", "get_end_ts", "unix_to_datestr", "iso_to_epoch", "epoch_to_labels", "TimeIndex", "NO_TIME"), "time"),
+    **dict.fromkeys(("unwrap_candlestick", "unwrap_candlesticks", "to_ta_data", "kalshi_candlestick_to_ta_data", "decode_candlestick_columns",
+                     "candle_columns_to_ta_frame", "unwrap_candlesticks_frame", "to_ta_frame"), "candlestick"),
+    "plot_rsi": "plotting",
+    **dict.fromkeys(("CandleStore", "CANDLE_DTYPE"), "candle_store"),
+    **dict.fromkeys(("Panel", "build_panel", "event_panel", "event_consistency", "PANEL_FIELDS"), "panel"),
+    **dict.fromkeys(("resample_candle_columns", "Resampler", "bucket_ends"), "resample"),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value   # Later lookups skip __getattr__
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,15 @@
+'''
+The columnar candle layout shared by the Kalshi decode, resampling, CandleStore and the Polymarket history bars
+
+Kept free of pandas (and of numpy) so pure-array paths can name the columns without loading the DataFrame stack.
+'''
+
+# Numeric column name -> (nested object, key) in the raw candlestick JSON.
+# Names follow UnwrappedCandlestick, but every value is a float64 (NaN where the API sends nothing)
+CANDLE_COLUMNS: dict[str, tuple[str | None, str]] = {
+    "end_period_ts": (None, "end_period_ts"),
+    **{f"{side}_{k}_dollars": (side, f"{k}_dollars") for side in ("yes_bid", "yes_ask") for k in ("open", "low", "high", "close")},
+    **{f"price_{k}_dollars": ("price", f"{k}_dollars") for k in ("open", "low", "high", "close", "mean", "previous")},
+    "volume_fp": (None, "volume_fp"),
+    "open_interest_fp": (None, "open_interest_fp"),
+}
@@ -0,0 +1,152 @@
+import os
+import threading
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from .candle_columns import CANDLE_COLUMNS
+from .candlestick import candle_columns_to_ta_frame
+from .resample import bucket_ends, resample_candle_columns
+
+'''
+On-disk candle store
+
+    root/
+      KXHIGHNY/                         <- series ticker
+        KXHIGHNY-26FEB04-T70/           <- market ticker
+          60.candles                    <- packed CANDLE_DTYPE records, sorted by end_period_ts
+          60.count                      <- committed record count
+
+Records are fixed-width, so a time range is a binary search plus a memory-mapped slice (no copy, no parse).
+Appends write the new records past the committed end, fsync, then atomically swap in the new count - a crash
+mid-append leaves the previous count, and the half-written tail is truncated by the next append.
+'''
+
+CANDLE_DTYPE = np.dtype([(name, np.int64 if name == "end_period_ts" else np.float64) for name in CANDLE_COLUMNS])
+
+
+class CandleStore:
+
+    def __init__(self, root: str | os.PathLike):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    def _paths(self, series_ticker: str, market_ticker: str, period_interval: int) -> tuple[Path, Path]:
+        folder = self.root / series_ticker.replace("/", "_") / market_ticker.replace("/", "_")
+        return folder / f"{period_interval}.candles", folder / f"{period_interval}.count"
+
+    def count(self, series_ticker: str, market_ticker: str, period_interval: int) -> int:
+        '''Committed bars for a key (0 if never synced)'''
+
+        _, count_path = self._paths(series_ticker, market_ticker, period_interval)
+
+        try:
+            return int(count_path.read_text())
+        except FileNotFoundError:
+            return 0
+
+    def last_end_ts(self, series_ticker: str, market_ticker: str, period_interval: int) -> int | None:
+
+        n = self.count(series_ticker, market_ticker, period_interval)
+
+        if n == 0:
+            return None
+
+        return int(self.read(series_ticker, market_ticker, period_interval)["end_period_ts"][n - 1])
+
+    def append(self, series_ticker: str, market_ticker: str, period_interval: int, columns: dict[str, np.ndarray]) -> int:
+        '''
+        Append decoded candle columns (see decode_candlestick_columns), keeping only bars newer than
+        the last stored end_period_ts. Returns the number of bars written.
+        '''
+
+        data_path, count_path = self._paths(series_ticker, market_ticker, period_interval)
+
+        records = np.empty(len(columns["end_period_ts"]), dtype=CANDLE_DTYPE)
+        for name in CANDLE_DTYPE.names:
+            records[name] = columns[name]
+
+        records = records[np.argsort(records["end_period_ts"], kind="stable")]
+
+        with self._lock:
+            n = self.count(series_ticker, market_ticker, period_interval)
+            last = self.last_end_ts(series_ticker, market_ticker, period_interval)
+
+            if last is not None:
+                records = records[records["end_period_ts"] > last]
+
+            # Drop duplicate timestamps inside the batch itself (keep the latest copy)
+            if len(records):
+                keep = np.append(records["end_period_ts"][1:] != records["end_period_ts"][:-1], True)
+                records = records[keep]
+
+            if not len(records):
+                return 0
+
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(data_path, "ab") as f:
+                # Discard any uncommitted tail from an interrupted append
+                f.truncate(n * CANDLE_DTYPE.itemsize)
+                f.write(records.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+            tmp_path = count_path.with_suffix(".count.tmp")
+            tmp_path.write_text(str(n + len(records)))
+            os.replace(tmp_path, count_path)
+
+        return len(records)
+
+    def read(self, series_ticker: str, market_ticker: str, period_interval: int, start_ts: int | None = None, end_ts: int | None = None) -> np.ndarray:
+        '''Read-only memory-mapped records with start_ts <= end_period_ts <= end_ts (zero-copy slice)'''
+
+        data_path, _ = self._paths(series_ticker, market_ticker, period_interval)
+        n = self.count(series_ticker, market_ticker, period_interval)
+
+        if n == 0:
+            return np.empty(0, dtype=CANDLE_DTYPE)
+
+        records = np.memmap(data_path, dtype=CANDLE_DTYPE, mode="r", shape=(n,))
+        ts = records["end_period_ts"]
+
+        lo = 0 if start_ts is None else int(np.searchsorted(ts, start_ts, side="left"))
+        hi = n if end_ts is None else int(np.searchsorted(ts, end_ts, side="right"))
+
+        return records[lo:hi]
+
+    def read_frame(self, series_ticker: str, market_ticker: str, period_interval: int, start_ts: int | None = None, end_ts: int | None = None) -> pd.DataFrame:
+        '''Stored bars as the to_ta_data DataFrame'''
+
+        records = self.read(series_ticker, market_ticker, period_interval, start_ts, end_ts)
+
+        return candle_columns_to_ta_frame({name: records[name] for name in CANDLE_DTYPE.names}, period_interval)
+
+    def read_resampled(self, series_ticker: str, market_ticker: str, period_interval: int, start_ts: int | None = None,
+                       end_ts: int | None = None, source_interval: int = 1, offset: int = 0) -> dict[str, np.ndarray]:
+        '''
+        period_interval-minute candle columns built from the stored source_interval bars (see resample_candle_columns).
+        start_ts is widened to the start of its bucket so the first bar is not built from a partial bucket.
+        '''
+
+        if start_ts is not None:
+            start_ts = int(bucket_ends(np.array([start_ts]), period_interval, offset)[0]) - period_interval * 60 + 1
+
+        records = self.read(series_ticker, market_ticker, source_interval, start_ts, end_ts)
+
+        return resample_candle_columns(records, period_interval, offset)
+
+    def sync_candles(self, client, series, market, period_interval: int) -> int:
+        '''
+        Bring one (series, market, period_interval) up to date, fetching only bars after the last stored one.
+        `client` is a KalshiClient. Returns the number of new bars stored.
+        '''
+
+        last = self.last_end_ts(series.ticker, market.ticker, period_interval)
+
+        columns = client.get_market_candle_sticks(series, market, period_interval,
+                                                  start_ts=None if last is None else last + 1, as_columns=True)
+
+        if columns is None:
+            return 0
+
+        return self.append(series.ticker, market.ticker, period_interval, columns)
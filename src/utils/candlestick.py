@@ -1,5 +1,10 @@
+from operator import attrgetter, itemgetter, methodcaller
+import numpy as np
+import pandas as pd
 from ..kalshi.models import Candlestick, UnwrappedCandlestick
 from ..technical_analysis import Data
+from ..kalshi.metrics import timed
+from .candle_columns import CANDLE_COLUMNS
 
 def unwrap_candlestick(candlestick: Candlestick) -> UnwrappedCandlestick:
 
@@ -17,6 +22,7 @@ def unwrap_candlestick(candlestick: Candlestick) -> UnwrappedCandlestick:
         open_interest_fp=c["open_interest_fp"],
     )
 
+@timed("unwrap_candlesticks")
 def unwrap_candlesticks(candlesticks: list[Candlestick]) -> list[UnwrappedCandlestick]:
 
     # Pydantic -> Dictionary
@@ -56,6 +62,7 @@ def kalshi_candlestick_to_ta_data(candlestick: UnwrappedCandlestick, period_inte
         open_interest= _to_float(c["open_interest_fp"])
     )
 
+@timed("to_ta_data")
 def to_ta_data(candlesticks: list[UnwrappedCandlestick], period_interval: int) -> list[Data]:
 
     d : list[Data] = []
@@ -63,4 +70,140 @@ def to_ta_data(candlesticks: list[UnwrappedCandlestick], period_interval: int) -
     for candlestick in candlesticks:
         d.append(kalshi_candlestick_to_ta_data(candlestick, period_interval))
 
-    return d
\ No newline at end of file
+    return d
+
+
+# --- COLUMNAR DECODE (raw JSON -> arrays, no per-candle models) ---
+
+# Just what to_ta_data reads
+TA_SOURCE_COLUMNS = ("end_period_ts", "price_open_dollars", "price_high_dollars", "price_low_dollars", "price_close_dollars",
+                     "yes_ask_close_dollars", "yes_bid_close_dollars", "volume_fp", "open_interest_fp")
+
+# Same columns, same order as pydantic_model_to_dataframe(to_ta_data(...))
+TA_COLUMNS = tuple(Data.model_fields)
+
+
+def _getters(candles: list):
+    '''(top-level getter, nested getter) factories for raw dicts or models - C-level attrgetter / itemgetter'''
+
+    if candles and isinstance(candles[0], dict):
+        # Empty price objects (no trades in period) just miss the key
+        return itemgetter, lambda key: methodcaller("get", key)
+
+    return attrgetter, attrgetter
+
+
+def _gather_columns(candles: list, columns) -> dict[str, list]:
+    '''Each column pulled out of the candles once; nested price objects are fetched once per source, not per column'''
+
+    if candles and isinstance(candles[0], UnwrappedCandlestick):
+        return {name: list(map(attrgetter(name), candles)) for name in columns}
+
+    top, nested = _getters(candles)
+    sources: dict[str, list] = {}
+    gathered = {}
+
+    for name in columns:
+        outer, key = CANDLE_COLUMNS[name]
+
+        if outer is None:
+            gathered[name] = list(map(top(key), candles))
+        else:
+            if outer not in sources:
+                sources[outer] = list(map(top(outer), candles))
+            gathered[name] = list(map(nested(key), sources[outer]))
+
+    return gathered
+
+
+def _decode_column(name: str, values: list) -> np.ndarray:
+
+    try:
+        if name == "end_period_ts":
+            return np.asarray(values, dtype=np.int64)
+
+        # Dollar strings -> float64 in one array conversion; numpy stores None (no trades in period) as NaN, like _to_float
+        return np.asarray(values, dtype=np.float64)
+
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"malformed candlestick column '{name}'") from exc
+
+
+@timed("decode_candlestick_columns")
+def decode_candlestick_columns(candles: list[dict] | list[Candlestick] | list[UnwrappedCandlestick], columns=tuple(CANDLE_COLUMNS)) -> dict[str, np.ndarray]:
+    '''Candlesticks (raw JSON or models) -> {column: array}, validated once per column rather than once per bar'''
+
+    try:
+        gathered = _gather_columns(candles, columns)
+    except (AttributeError, KeyError, TypeError) as exc:
+        raise ValueError(f"malformed candlesticks: {exc}") from exc
+
+    return {name: _decode_column(name, values) for name, values in gathered.items()}
+
+
+def candle_columns_to_ta_frame(columns: dict[str, np.ndarray], period_interval: int) -> pd.DataFrame:
+    '''Vectorized kalshi_candlestick_to_ta_data over whole columns'''
+
+    end_ts = columns["end_period_ts"]
+    ask = columns["yes_ask_close_dollars"]
+    bid = columns["yes_bid_close_dollars"]
+
+    return pd.DataFrame({
+        "start_ts": end_ts - period_interval * 60,
+        "end_ts": end_ts,
+        "open": columns["price_open_dollars"],
+        "close": columns["price_close_dollars"],
+        "high": columns["price_high_dollars"],
+        "low": columns["price_low_dollars"],
+        "volume": columns["volume_fp"],
+        "ask": ask,
+        "bid": bid,
+        "spread": ask - bid,
+        "midprice": (ask + bid) / 2,
+        "open_interest": columns["open_interest_fp"],
+    }, columns=list(TA_COLUMNS))
+
+
+# --- BATCH EQUIVALENTS OF unwrap_candlesticks / to_ta_data ---
+
+def _as_candle_list(candlesticks) -> list:
+    # Accept a whole raw response payload as well as a list of candles
+    if isinstance(candlesticks, dict):
+        return candlesticks["candlesticks"]
+    return candlesticks
+
+
+@timed("unwrap_candlesticks_frame")
+def unwrap_candlesticks_frame(candlesticks: list[Candlestick] | list[dict] | dict) -> pd.DataFrame:
+    '''
+    Batch unwrap_candlesticks: one column per UnwrappedCandlestick field, built column by column.
+    Equal to pydantic_model_to_dataframe(unwrap_candlesticks(...)), without a model per bar.
+    '''
+
+    candles = _as_candle_list(candlesticks)
+    top, nested = _getters(candles)
+
+    sources = {source: list(map(top(source), candles)) for source in ("yes_bid", "yes_ask", "price")}
+    columns = {}
+
+    for field in UnwrappedCandlestick.model_fields:
+        source = next((s for s in sources if field.startswith(s + "_")), None)
+
+        if source is None:
+            columns[field] = list(map(top(field), candles))
+        else:
+            columns[field] = list(map(nested(field[len(source) + 1:]), sources[source]))
+
+    return pd.DataFrame(columns, columns=list(UnwrappedCandlestick.model_fields))
+
+
+@timed("to_ta_frame")
+def to_ta_frame(candlesticks: list[Candlestick] | list[UnwrappedCandlestick] | list[dict] | dict, period_interval: int) -> pd.DataFrame:
+    '''
+    Batch to_ta_data: dollar-string parsing, NaN for untraded periods, spread and midprice all as array ops.
+    Equal to pydantic_model_to_dataframe(to_ta_data(unwrap_candlesticks(...), period_interval)).
+    '''
+
+    candles = _as_candle_list(candlesticks)
+
+    return candle_columns_to_ta_frame(decode_candlestick_columns(candles, TA_SOURCE_COLUMNS), period_interval)
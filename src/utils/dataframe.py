@@ -1,6 +1,8 @@
 import pandas as pd
 from pydantic import BaseModel
+from ..kalshi.metrics import timed
 
+@timed("pydantic_model_to_dataframe")
 def pydantic_model_to_dataframe(models: list[BaseModel]) -> pd.DataFrame:
     # Pydantic Model -> Python Dictionary for Each in List
     # Then Pandas Can Directly Ingest Dictionaries to Create DF
@@ -0,0 +1,166 @@
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from ..kalshi.models import EventCandlesticksResponse
+from .candlestick import decode_candlestick_columns
+from ..kalshi.metrics import timed
+
+'''
+Markets x time panels
+
+Every market of an event (or any ticker set) aligned on one shared end_period_ts grid, with one contiguous
+float64 (markets, time) matrix per field. Cross-market questions become single array operations:
+
+    panel = event_panel(client.get_event_candle_sticks(event, 60))
+    panel.ask.sum(axis=0)                           # implied probability of the whole event, per bar
+    matrix.crossover(matrix.rsi(panel.close, 7), 50)  # signals for every market at once
+
+Fill policies
+    "nan"    gaps (grid slots a market has no bar for, untraded periods) stay NaN
+    "ffill"  carry the last known value forward along time (up to fill_limit bars); volume gaps are 0,
+             since a missing bar traded nothing. Nothing is filled before a market's first value.
+'''
+
+# Panel field -> candle column (see CANDLE_COLUMNS)
+PANEL_FIELDS: dict[str, str] = {
+    "close": "price_close_dollars",
+    "bid": "yes_bid_close_dollars",
+    "ask": "yes_ask_close_dollars",
+    "volume": "volume_fp",
+    "open_interest": "open_interest_fp",
+}
+
+FILL_POLICIES = ("ffill", "nan")
+
+
+def ffill(matrix: np.ndarray, limit: int | None = None) -> np.ndarray:
+    '''Forward-fill NaNs along the last axis (DataFrame.ffill(axis=1, limit=limit) without the frame)'''
+
+    n = matrix.shape[-1]
+    valid = ~np.isnan(matrix)
+
+    # Column of the latest real value at or before each slot
+    last = np.where(valid, np.arange(n), -1)
+    last = np.maximum.accumulate(last, axis=-1)
+
+    filled = np.take_along_axis(matrix, np.maximum(last, 0), axis=-1)
+    keep = last >= 0
+
+    if limit is not None:
+        keep &= np.arange(n) - last <= limit
+
+    return np.where(keep, filled, np.nan)
+
+
+@dataclass
+class Panel:
+    tickers: list[str]                                       # Row labels
+    end_ts: np.ndarray                                       # (time,) int64 grid, ascending
+    fields: dict[str, np.ndarray]                            # Field -> (markets, time) float64 matrix
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.fields[field]
+
+    def __getattr__(self, field: str) -> np.ndarray:
+        # panel.close, panel.ask, ... (only reached for names that aren't real attributes)
+        fields = self.__dict__.get("fields", {})
+        if field in fields:
+            return fields[field]
+        raise AttributeError(field)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.tickers), len(self.end_ts)
+
+    def row(self, ticker: str) -> dict[str, np.ndarray]:
+        '''All fields for one market'''
+        i = self.tickers.index(ticker)
+        return {field: values[i] for field, values in self.fields.items()}
+
+    def frame(self, field: str) -> pd.DataFrame:
+        '''One field as a time-indexed DataFrame with a column per market'''
+        return pd.DataFrame(self.fields[field].T, index=pd.Index(self.end_ts, name="end_ts"), columns=self.tickers)
+
+
+@timed("build_panel")
+def build_panel(markets: dict, fields: dict[str, str] = PANEL_FIELDS, fill: str = "ffill",
+                fill_limit: int | None = None, end_ts: np.ndarray | None = None) -> Panel:
+    '''
+    Align markets on a shared grid.
+
+    @params
+    markets: ticker -> candles (raw JSON dicts or Candlestick models) or already-decoded columns
+             (decode_candlestick_columns output, CandleStore.read records)
+    fields: panel field -> candle column
+    fill: "ffill" or "nan"
+    end_ts: explicit grid; default is the union of every market's end_period_ts
+    '''
+
+    if fill not in FILL_POLICIES:
+        raise ValueError(f"fill must be one of {FILL_POLICIES}, got '{fill}'")
+
+    tickers = list(markets)
+    source_columns = ("end_period_ts", *fields.values())
+
+    columns = []
+    for candles in markets.values():
+        if isinstance(candles, (list, tuple)):
+            candles = decode_candlestick_columns(candles, source_columns)
+        columns.append(candles)
+
+    if end_ts is None:
+        end_ts = np.unique(np.concatenate([np.asarray(c["end_period_ts"], dtype=np.int64) for c in columns] or [np.empty(0, np.int64)]))
+    end_ts = np.asarray(end_ts, dtype=np.int64)
+
+    matrices = {field: np.full((len(tickers), len(end_ts)), np.nan) for field in fields}
+
+    for i, c in enumerate(columns):
+        ts = np.asarray(c["end_period_ts"], dtype=np.int64)
+
+        # Grid slot of each bar; bars that fall off an explicit grid are dropped
+        slots = np.searchsorted(end_ts, ts)
+        on_grid = slots < len(end_ts)
+        on_grid[on_grid] = end_ts[slots[on_grid]] == ts[on_grid]
+
+        for field, column in fields.items():
+            matrices[field][i, slots[on_grid]] = np.asarray(c[column], dtype=np.float64)[on_grid]
+
+    if fill == "ffill":
+        for field, matrix in matrices.items():
+            if field == "volume":
+                matrices[field] = np.nan_to_num(matrix, nan=0.0)
+            else:
+                matrices[field] = ffill(matrix, fill_limit)
+
+    return Panel(tickers=tickers, end_ts=end_ts, fields={f: np.ascontiguousarray(m) for f, m in matrices.items()})
+
+
+def event_panel(response: EventCandlesticksResponse | dict, fields: dict[str, str] = PANEL_FIELDS, fill: str = "ffill",
+                fill_limit: int | None = None) -> Panel:
+    '''Panel of every market in an event candlesticks response (model or raw JSON)'''
+
+    if isinstance(response, EventCandlesticksResponse):
+        tickers, candles = response.market_tickers, response.market_candlesticks
+    else:
+        tickers, candles = response["market_tickers"], response["market_candlesticks"]
+
+    return build_panel(dict(zip(tickers, candles)), fields, fill, fill_limit)
+
+
+def event_consistency(panel: Panel) -> pd.DataFrame:
+    '''
+    Per-bar checks for a mutually exclusive event. Buying YES on every market at the ask pays exactly $1 at
+    settlement, so ask_sum < 1 is a sure profit; likewise selling every YES at the bid when bid_sum > 1.
+    '''
+
+    bid_sum = panel.bid.sum(axis=0)
+    ask_sum = panel.ask.sum(axis=0)
+
+    return pd.DataFrame({
+        "end_ts": panel.end_ts,
+        "bid_sum": bid_sum,
+        "ask_sum": ask_sum,
+        "close_sum": panel.close.sum(axis=0),
+        "buy_all_edge": 1.0 - ask_sum,
+        "sell_all_edge": bid_sum - 1.0,
+    })
@@ -1,10 +1,10 @@
 import plotext as plo
 import pandas as pd
-from .time import unix_to_datestr
+from .time import epoch_to_labels
 
 def plot_rsi(df: pd.DataFrame, title:str):
     candle_df = df.dropna(subset=["open", "close", "high", "low"])
-    dates = [unix_to_datestr(ts) for ts in candle_df["end_ts"]]
+    dates = epoch_to_labels(candle_df["end_ts"].to_numpy())
     data = {
         "Open": candle_df["open"].tolist(),
         "Close": candle_df["close"].tolist(),
@@ -0,0 +1,156 @@
+import numpy as np
+from .candle_columns import CANDLE_COLUMNS
+from ..kalshi.metrics import timed
+
+'''
+Building N-minute candles out of stored 1-minute candles, so one fetch serves every timeframe
+
+Works on decoded candle columns (decode_candlestick_columns output, CandleStore.read records) and returns the
+same column layout, ready for CandleStore.append or candle_columns_to_ta_frame.
+
+A bar ending at end_period_ts covers (end - period, end], so it belongs to the bucket whose end is the next
+multiple of the target period at or after it (shifted by `offset` seconds, e.g. to align days to a timezone).
+
+Aggregation per bucket
+    yes_bid / yes_ask OHLC   first open, max high, min low, last close
+    price OHLC               same, over traded minutes only - a bucket with no trades is all NaN, like the
+                             empty CandlestickPriceOHLC the API sends; mean is volume-weighted; previous is the
+                             first minute's previous (last trade before the bucket)
+    volume_fp                summed
+    open_interest_fp         last
+'''
+
+_SIDES = ("yes_bid", "yes_ask", "price")
+
+# column -> how it aggregates; anything not listed (end_period_ts, price mean) is handled separately
+_AGGREGATIONS: dict[str, str] = {
+    **{f"{side}_open_dollars": "first" for side in _SIDES},
+    **{f"{side}_high_dollars": "max" for side in _SIDES},
+    **{f"{side}_low_dollars": "min" for side in _SIDES},
+    **{f"{side}_close_dollars": "last" for side in _SIDES},
+    "price_previous_dollars": "head",
+    "volume_fp": "sum",
+    "open_interest_fp": "last",
+}
+
+
+def bucket_ends(end_ts: np.ndarray, period_interval: int, offset: int = 0) -> np.ndarray:
+    '''end_period_ts of the period_interval-minute bucket each bar falls in'''
+
+    span = period_interval * 60
+    ts = np.asarray(end_ts, dtype=np.int64) - offset
+
+    return -(-ts // span) * span + offset
+
+
+def _aggregate(values: np.ndarray, how: str, starts: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+
+    if how == "max":
+        return np.fmax.reduceat(values, starts)   # fmax / fmin skip NaN; an all-NaN bucket stays NaN
+
+    if how == "min":
+        return np.fmin.reduceat(values, starts)
+
+    if how == "sum":
+        return np.add.reduceat(np.nan_to_num(values), starts)
+
+    if how == "head":
+        return values[starts]
+
+    # First / last non-NaN value in each bucket
+    index = np.arange(len(values))
+    valid = ~np.isnan(values)
+
+    if how == "first":
+        pick = np.minimum.reduceat(np.where(valid, index, len(values)), starts)
+        found = pick < starts + sizes
+    else:
+        pick = np.maximum.reduceat(np.where(valid, index, -1), starts)
+        found = pick >= starts
+
+    return np.where(found, values[np.clip(pick, 0, len(values) - 1)], np.nan)
+
+
+@timed("resample_candle_columns")
+def resample_candle_columns(columns, period_interval: int, offset: int = 0) -> dict[str, np.ndarray]:
+    '''
+    Aggregate finer candles (sorted by end_period_ts) into period_interval-minute candles.
+    The last bucket may still be in progress, like the latest candle from the API.
+    '''
+
+    end_ts = np.asarray(columns["end_period_ts"], dtype=np.int64)
+
+    if not len(end_ts):
+        return {name: np.empty(0, dtype=np.int64 if name == "end_period_ts" else np.float64) for name in CANDLE_COLUMNS}
+
+    buckets = bucket_ends(end_ts, period_interval, offset)
+
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    sizes = np.diff(np.r_[starts, len(buckets)])
+
+    out = {"end_period_ts": buckets[starts]}
+
+    for name in CANDLE_COLUMNS:
+        if name in _AGGREGATIONS:
+            out[name] = _aggregate(np.asarray(columns[name], dtype=np.float64), _AGGREGATIONS[name], starts, sizes)
+
+    # Volume-weighted mean trade price over the minutes that traded
+    mean = np.asarray(columns["price_mean_dollars"], dtype=np.float64)
+    volume = np.asarray(columns["volume_fp"], dtype=np.float64)
+    traded = ~np.isnan(mean)
+
+    weight = np.add.reduceat(np.where(traded, volume, 0.0), starts)
+    weighted = np.add.reduceat(np.where(traded, mean * volume, 0.0), starts)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out["price_mean_dollars"] = np.where(weight > 0, weighted / weight, np.nan)
+
+    # Traded minutes with zero reported volume: fall back to the plain average
+    zero_volume = (weight == 0) & ~np.isnan(out["price_close_dollars"])
+    if zero_volume.any():
+        counts = np.add.reduceat(traded.astype(np.float64), starts)
+        sums = np.add.reduceat(np.where(traded, mean, 0.0), starts)
+        out["price_mean_dollars"][zero_volume] = sums[zero_volume] / counts[zero_volume]
+
+    return {name: out[name] for name in CANDLE_COLUMNS}
+
+
+class Resampler:
+    '''
+    Incremental resample_candle_columns: feed minute columns as they arrive, get back only buckets that closed.
+    The concatenated output of every update(), followed by pending(), equals resampling everything at once.
+    '''
+
+    def __init__(self, period_interval: int, offset: int = 0):
+        self.period_interval = period_interval
+        self.offset = offset
+        self.last_end_ts: int | None = None
+        self._open = {name: np.empty(0, dtype=np.int64 if name == "end_period_ts" else np.float64) for name in CANDLE_COLUMNS}
+
+    def update(self, columns) -> dict[str, np.ndarray]:
+        '''Add newer source bars (older or repeated timestamps are ignored); returns the buckets they completed'''
+
+        end_ts = np.asarray(columns["end_period_ts"], dtype=np.int64)
+        keep = end_ts > self.last_end_ts if self.last_end_ts is not None else np.ones(len(end_ts), dtype=bool)
+
+        buffer = {name: np.concatenate([self._open[name], np.asarray(columns[name], dtype=self._open[name].dtype)[keep]])
+                  for name in CANDLE_COLUMNS}
+
+        ts = buffer["end_period_ts"]
+        if not len(ts):
+            return resample_candle_columns(buffer, self.period_interval, self.offset)
+
+        self.last_end_ts = int(ts[-1])
+
+        # Everything before the newest bucket is final; the newest is final once its closing minute is in
+        buckets = bucket_ends(ts, self.period_interval, self.offset)
+        newest = buckets[-1]
+        split = len(ts) if self.last_end_ts == newest else int(np.searchsorted(buckets, newest, side="left"))
+
+        self._open = {name: values[split:] for name, values in buffer.items()}
+
+        return resample_candle_columns({name: values[:split] for name, values in buffer.items()}, self.period_interval, self.offset)
+
+    def pending(self) -> dict[str, np.ndarray]:
+        '''The in-progress bucket (zero or one bar)'''
+        return resample_candle_columns(self._open, self.period_interval, self.offset)
@@ -1,14 +1,37 @@
+import functools
+import re
 from datetime import datetime,timezone
-from ..kalshi.models import Market
+import numpy as np
+
+'''
+Timestamps: ISO 8601 <-> Unix epoch seconds, one at a time or a column at a time
+
+The API sends every time as an ISO 8601 string ("2026-02-04T15:00:00Z"). Scalars go through iso_to_unix,
+which caches parses: Kalshi times repeat heavily (every market in an event shares its open / close times),
+so Market.close_epoch & co. cost a dict lookup after the first market. Columns go through iso_to_epoch,
+which hands the UTC layout the API uses to numpy's datetime64 parser in one call and only falls back
+to datetime for anything else (other offsets, naive times). Missing values (None / "") become NO_TIME.
+
+epoch_to_labels formats a column of epochs with strftime once per distinct label rather than once per value
+(a date format over minute bars formats one string per day).
+
+TimeIndex sorts a snapshot by one time field once, so "markets closing in the next hour" is two binary
+searches instead of a scan that re-parses every market's close_time.
+'''
+
+NO_TIME = np.iinfo(np.int64).min    # Epoch placeholder for missing times (sorts before everything)
+
+_PARSE_CACHE_SIZE = 1 << 16
+
 
 # ISO 8601 string -> Unix timestamp
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def iso_to_unix(iso_string: str) -> int:
     dt = datetime.fromisoformat(iso_string.replace('Z', '+00:00'))
     return int(dt.timestamp())
 
-def get_start_ts(markets: list[Market]) -> int:
-    market_start_times = [datetime.fromisoformat(market.open_time.replace("Z", "+00:00")) for market in markets]
-    return int(min(market_start_times).timestamp())
+def get_start_ts(markets: list) -> int:
+    return min(market.open_epoch for market in markets)
 
 
 # def get_end_ts(markets: list[Market]) -> int:
@@ -20,4 +43,182 @@ def get_end_ts() -> int:
     return int(datetime.now(timezone.utc).timestamp())
 
 def unix_to_datestr(ts: int, fmt: str = "%d/%m/%Y") -> str:
-    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime(fmt)
\ No newline at end of file
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime(fmt)
+
+
+def optional_epoch(iso_string: str | None) -> int | None:
+    '''iso_to_unix for optional fields: None / "" stay None'''
+    return iso_to_unix(iso_string) if iso_string else None
+
+
+# --- COLUMNS ---
+
+_WIDTH = 32     # Longest string the vectorized path takes ("YYYY-MM-DDTHH:MM:SS.ffffffZ" is 27)
+
+
+def _parse_utc(raw: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    '''
+    (epochs, ok) for an array of byte strings. Rows of the form "YYYY-MM-DDTHH:MM:SS" + "Z" / ".ffffffZ" / "+00:00"
+    are parsed by numpy's datetime64 parser on their first 19 characters; anything else has ok False.
+    '''
+
+    length = np.char.str_len(raw)
+    zulu = np.char.endswith(raw, b"Z")
+
+    ok = zulu & (length == 20)
+
+    offset = length == 25
+    if offset.any():
+        ok |= offset & np.char.endswith(raw, b"+00:00")
+
+    fraction = zulu & (length > 21) & (length < _WIDTH) & (raw.view(np.uint8).reshape(len(raw), -1)[:, 19] == ord("."))
+    if fraction.any():
+        digits = np.char.replace(np.char.partition(raw[fraction], b".")[:, 2], b"Z", b"", 1)
+        fraction[fraction] = np.char.isdigit(digits)
+        ok |= fraction
+
+    epochs = np.zeros(len(raw), np.int64)
+
+    try:
+        if ok.all():
+            epochs = raw.astype("S19").astype("datetime64[s]").astype(np.int64)
+        else:
+            epochs[ok] = raw[ok].astype("S19").astype("datetime64[s]").astype(np.int64)
+    except ValueError:   # Some row numpy won't parse (Feb 30, ...): leave them all to datetime
+        ok[:] = False
+
+    return epochs, ok
+
+
+def iso_to_epoch(values) -> np.ndarray:
+    '''
+    A column of ISO 8601 strings (list, tuple, object array, Series) -> int64 epoch seconds.
+    Same result as iso_to_unix per value; None / "" / NaN -> NO_TIME; malformed strings raise ValueError.
+    '''
+
+    values = np.asarray(values, dtype=object).ravel()
+    out = np.full(len(values), NO_TIME, dtype=np.int64)
+
+    present = np.not_equal(values, None) & np.equal(values, values) & np.not_equal(values, "")   # NaN != NaN
+    if not present.any():
+        return out
+
+    strings = values if present.all() else values[present]
+
+    try:
+        epochs, ok = _parse_utc(strings.astype(f"S{_WIDTH}"))
+    except (UnicodeEncodeError, TypeError):
+        epochs, ok = np.zeros(len(strings), np.int64), np.zeros(len(strings), bool)
+
+    for i in np.flatnonzero(~ok):
+        epochs[i] = iso_to_unix(strings[i])
+
+    out[present] = epochs
+
+    return out
+
+
+# --- LABELS ---
+
+_DIRECTIVE = re.compile(r"%[-#^]?(.)")
+_DAY_DIRECTIVES = set("aAbBhdemyYCjUWwGuVgxDF%nt")
+_HOUR_DIRECTIVES = _DAY_DIRECTIVES | set("HIpkl")
+_MINUTE_DIRECTIVES = _HOUR_DIRECTIVES | set("MR")
+
+
+def _label_step(fmt: str) -> int:
+    '''Coarsest epoch granularity (seconds) that fmt can tell apart'''
+
+    directives = set(_DIRECTIVE.findall(fmt))
+
+    if directives <= _DAY_DIRECTIVES:
+        return 86_400
+    if directives <= _HOUR_DIRECTIVES:
+        return 3_600
+    if directives <= _MINUTE_DIRECTIVES:
+        return 60
+    return 1
+
+
+def epoch_to_labels(epochs, fmt: str = "%d/%m/%Y") -> list[str]:
+    '''unix_to_datestr over a column (UTC), formatting each distinct label once'''
+
+    epochs = np.asarray(epochs, dtype=np.int64)
+
+    if not len(epochs):
+        return []
+
+    step = _label_step(fmt)
+    buckets, inverse = np.unique(epochs // step, return_inverse=True)
+    labels = np.array([unix_to_datestr(int(bucket) * step, fmt) for bucket in buckets], dtype=object)
+
+    return labels[inverse.ravel()].tolist()
+
+
+# --- INDEX ---
+
+class TimeIndex:
+    '''
+    One time field of a snapshot, sorted once for range queries.
+
+    index = TimeIndex.from_markets(client.get_market_table(), "close_time")
+    index.within(3600)                      # tickers closing in the next hour
+    index.between(start_ts, end_ts)         # tickers with start_ts <= close < end_ts, in time order
+    '''
+
+    def __init__(self, epochs: np.ndarray, keys: list[str] | None = None, field: str | None = None):
+        epochs = np.asarray(epochs, dtype=np.int64)
+
+        self.field = field
+        self.keys = keys
+        self.order = np.argsort(epochs, kind="stable")   # Sorted position -> source row
+        self.epochs = epochs[self.order]
+
+    @classmethod
+    def from_markets(cls, markets, field: str = "close_time") -> "TimeIndex":
+        '''From a MarketTable, MarketsResponse, list[Market] or raw market dicts'''
+
+        if hasattr(markets, "epoch"):   # MarketTable: parses each distinct time once
+            return cls(markets.epoch(field), list(markets.tickers), field)
+
+        markets = getattr(markets, "markets", markets)
+        markets = list(markets)
+
+        if markets and isinstance(markets[0], dict):
+            return cls(iso_to_epoch([m.get(field) for m in markets]), [m["ticker"] for m in markets], field)
+
+        return cls(iso_to_epoch([getattr(m, field) for m in markets]), [m.ticker for m in markets], field)
+
+    def __len__(self):
+        return len(self.epochs)
+
+    def rows_between(self, start: int | None = None, end: int | None = None) -> np.ndarray:
+        '''Source rows with start <= time < end (either bound open when None), in time order; missing times never match'''
+
+        lo = np.searchsorted(self.epochs, max(start, NO_TIME + 1) if start is not None else NO_TIME + 1, side="left")
+        hi = np.searchsorted(self.epochs, end, side="left") if end is not None else len(self.epochs)
+
+        return self.order[lo:hi]
+
+    def between(self, start: int | None = None, end: int | None = None) -> list[str]:
+        rows = self.rows_between(start, end)
+
+        if self.keys is None:
+            return rows.tolist()
+
+        return [self.keys[i] for i in rows]
+
+    def before(self, ts: int) -> list[str]:
+        return self.between(None, ts)
+
+    def after(self, ts: int) -> list[str]:
+        return self.between(ts, None)
+
+    def within(self, seconds: int, now: int | None = None) -> list[str]:
+        '''Keys whose time falls in [now, now + seconds)'''
+
+        now = now if now is not None else get_end_ts()
+        return self.between(now, now + seconds)
+
+    def count_between(self, start: int | None = None, end: int | None = None) -> int:
+        return len(self.rows_between(start, end))
\ No newline at end of file
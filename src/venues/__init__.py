@@ -0,0 +1,4 @@
+from .schema import VenueTable, VenueMarket, KALSHI, POLYMARKET
+from .matcher import match_markets, MarketMatches, tokens, numbers, jaccard
+
+__all__ = ['VenueTable', 'VenueMarket', 'KALSHI', 'POLYMARKET', 'match_markets', 'MarketMatches', 'tokens', 'numbers', 'jaccard']
@@ -0,0 +1,261 @@
+import re
+from dataclasses import dataclass, field
+import numpy as np
+from .schema import VenueTable, KALSHI
+from ..technical_analysis.fees import kalshi_fees
+from ..utils.time import NO_TIME
+
+'''
+Cross-venue market matching and price gaps
+
+match_markets(a, b) pairs each market of venue table `a` with at most one equivalent market of `b`:
+
+    1. explicit pairs first (Kalshi ticker <-> Polymarket id, either way round) - the curated mapping always wins
+    2. then by text: title + label tokenized, an inverted index over `b` yields the candidates sharing a token,
+       candidates closing more than `close_tolerance` apart are dropped, and so are candidates whose numbers
+       disagree (strikes, dates: one side's numeric tokens must be a subset of the other's - "above 70" is never
+       "above 75", however similar the wording); the rest are scored by token Jaccard
+    3. greedy one-to-one assignment, best score first
+
+Matching is the slow part and only has to happen when listings change. MarketMatches keeps the pairs by id, so
+gaps() on every fresh snapshot is a couple of index lookups plus array arithmetic over all pairs at once:
+
+    mid_a, mid_b, gap       mid prices and mid_b - mid_a
+    edge_ab                 buy YES on a at its ask + buy NO on b at 1 - b's bid: pays $1 either way, so the
+                            locked-in profit per contract is bid_b - ask_a (minus fees)
+    edge_ba                 the mirror trade: bid_a - ask_b
+    edge, direction         the better of the two and which one it is ("ab" / "ba")
+
+Kalshi legs pay the Kalshi taker fee (technical_analysis.fees.kalshi_fees) when fees=True; Polymarket legs are
+fee-free. Pairs where a side has no quote come out NaN.
+'''
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:\.[0-9]+)?")
+
+# Words that carry no meaning for equivalence ("Will ... be ... ?")
+STOPWORDS = frozenset(("will", "the", "a", "an", "be", "is", "are", "of", "on", "in", "at", "by", "to", "for", "and",
+                       "or", "this", "that", "what", "who", "which", "how", "does", "do", "its", "it"))
+
+DEFAULT_MIN_SCORE = 0.5
+DEFAULT_CLOSE_TOLERANCE = 2 * 86_400     # Seconds two equivalent markets' scheduled closes may differ by
+_MAX_POSTING = 0.2                       # Tokens in more than this share of b's markets don't generate candidates
+
+
+def tokens(text: str) -> frozenset[str]:
+    return frozenset(token for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS)
+
+
+def numbers(doc: frozenset[str]) -> frozenset[str]:
+    return frozenset(token for token in doc if token[0].isdigit())
+
+
+def jaccard(x: frozenset, y: frozenset) -> float:
+    if not x and not y:
+        return 0.0
+
+    shared = len(x & y)
+    return shared / (len(x) + len(y) - shared)
+
+
+@dataclass
+class MarketMatches:
+    a_ids: np.ndarray                                        # market_id in table a, per pair
+    b_ids: np.ndarray                                        # market_id in table b, per pair
+    scores: np.ndarray                                       # 1.0 for explicit pairs, token Jaccard otherwise
+    a: VenueTable = field(repr=False)                        # Snapshots the pairs were matched on
+    b: VenueTable = field(repr=False)
+
+    def __len__(self):
+        return len(self.a_ids)
+
+    def pairs(self) -> list[tuple[str, str]]:
+        return list(zip(self.a_ids.tolist(), self.b_ids.tolist()))
+
+    def gaps(self, a: VenueTable | None = None, b: VenueTable | None = None, fees: bool = True, contracts: float = 1.0) -> dict[str, np.ndarray]:
+        '''
+        Gap columns for every pair, priced off fresh snapshots `a` / `b` (default: the ones matched on).
+        Pairs whose market is missing from a snapshot come out NaN.
+        '''
+
+        a = a if a is not None else self.a
+        b = b if b is not None else self.b
+
+        rows_a, rows_b = a.rows(self.a_ids), b.rows(self.b_ids)
+
+        bid_a, ask_a, venue_a = _side(a, rows_a)
+        bid_b, ask_b, venue_b = _side(b, rows_b)
+
+        edge_ab = bid_b - ask_a
+        edge_ba = bid_a - ask_b
+
+        if fees:
+            # Buying NO at 1 - bid costs the same fee as YES at bid (the fee is symmetric in p)
+            edge_ab -= _fees(ask_a, venue_a, contracts) + _fees(bid_b, venue_b, contracts)
+            edge_ba -= _fees(bid_a, venue_a, contracts) + _fees(ask_b, venue_b, contracts)
+
+        mid_a, mid_b = (bid_a + ask_a) / 2, (bid_b + ask_b) / 2
+
+        ab_better = np.fmax(edge_ab, edge_ba) == edge_ab
+        quoted = ~(np.isnan(edge_ab) & np.isnan(edge_ba))
+
+        return {
+            "a_id": self.a_ids,
+            "b_id": self.b_ids,
+            "score": self.scores,
+            "mid_a": mid_a,
+            "mid_b": mid_b,
+            "gap": mid_b - mid_a,
+            "edge_ab": edge_ab,
+            "edge_ba": edge_ba,
+            "edge": np.fmax(edge_ab, edge_ba),
+            "direction": np.where(quoted, np.where(ab_better, "ab", "ba"), "").astype(object),
+        }
+
+    def to_frame(self, a: VenueTable | None = None, b: VenueTable | None = None, fees: bool = True, contracts: float = 1.0):
+        '''gaps() as a DataFrame, best edge first'''
+
+        import pandas as pd   # Only loaded when a DataFrame is asked for
+
+        frame = pd.DataFrame(self.gaps(a, b, fees, contracts))
+        return frame.sort_values("edge", ascending=False, na_position="last", ignore_index=True)
+
+
+def _side(table: VenueTable, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''(bid, ask, venue) at `rows`, NaN / "" where the row is -1'''
+
+    found = rows >= 0
+    safe = np.where(found, rows, 0)
+
+    if not len(table):
+        return np.full(len(rows), np.nan), np.full(len(rows), np.nan), np.full(len(rows), "", dtype=object)
+
+    bid = np.where(found, table["yes_bid"][safe], np.nan)
+    ask = np.where(found, table["yes_ask"][safe], np.nan)
+    venue = np.where(found, table["venue"][safe], "")
+
+    return bid, ask, venue
+
+
+def _fees(price: np.ndarray, venue: np.ndarray, contracts: float) -> np.ndarray:
+    '''Per-contract taker fee of a leg at `price`: Kalshi's schedule on Kalshi legs, zero elsewhere'''
+
+    kalshi = venue == KALSHI
+
+    if not kalshi.any():
+        return np.zeros(len(price))
+
+    out = np.zeros(len(price))
+    priced = kalshi & ~np.isnan(price)
+    out[priced] = kalshi_fees(price[priced], contracts) / contracts
+
+    return out
+
+
+# --- MATCHING ---
+
+def _documents(table: VenueTable) -> list[frozenset[str]]:
+    return [tokens(f"{title} {label}") for title, label in zip(table["title"], table["label"])]
+
+
+def _explicit(a: VenueTable, b: VenueTable, pairs) -> list[tuple[int, int]]:
+    '''Row pairs for curated (a id, b id) pairs; pairs given the other way round are flipped'''
+
+    rows = []
+    pairs = pairs.items() if isinstance(pairs, dict) else pairs
+
+    for x, y in pairs:
+        if x in a.index and y in b.index:
+            rows.append((a.index[x], b.index[y]))
+        elif y in a.index and x in b.index:
+            rows.append((a.index[y], b.index[x]))
+
+    return rows
+
+
+def _candidates(a: VenueTable, b: VenueTable, docs_a: list, docs_b: list, skip_a: set, skip_b: set,
+                min_score: float, close_tolerance: int | None) -> list[tuple[float, int, int, int]]:
+    '''(score, close distance, row a, row b) for every text candidate pair at or above min_score'''
+
+    postings: dict[str, list[int]] = {}
+
+    for j, doc in enumerate(docs_b):
+        if j not in skip_b:
+            for token in doc:
+                postings.setdefault(token, []).append(j)
+
+    # Tokens shared by a large share of b ("temperature", "2026", ...) only ever add noise candidates
+    cap = max(50, int(_MAX_POSTING * len(b)))
+    postings = {token: np.array(rows, dtype=np.int64) for token, rows in postings.items() if len(rows) <= cap}
+
+    close_a, close_b = a["close_ts"], b["close_ts"]
+    timed_b = close_b != NO_TIME
+    numbers_b = [numbers(doc) for doc in docs_b]
+
+    found = []
+
+    for i, doc in enumerate(docs_a):
+        if i in skip_a or not doc:
+            continue
+
+        lists = [postings[token] for token in doc if token in postings]
+        if not lists:
+            continue
+
+        candidates = np.unique(np.concatenate(lists))
+
+        if close_tolerance is not None and close_a[i] != NO_TIME:
+            near = ~timed_b[candidates] | (np.abs(close_b[candidates] - close_a[i]) <= close_tolerance)
+            candidates = candidates[near]
+
+        numbers_a = numbers(doc)
+
+        for j in candidates.tolist():
+            if not (numbers_a <= numbers_b[j] or numbers_b[j] <= numbers_a):
+                continue
+
+            score = jaccard(doc, docs_b[j])
+
+            if score >= min_score:
+                distance = abs(int(close_a[i]) - int(close_b[j])) if close_a[i] != NO_TIME and close_b[j] != NO_TIME else 0
+                found.append((score, distance, i, j))
+
+    return found
+
+
+def match_markets(a: VenueTable, b: VenueTable, pairs=None, min_score: float = DEFAULT_MIN_SCORE,
+                  close_tolerance: int | None = DEFAULT_CLOSE_TOLERANCE, auto: bool = True) -> MarketMatches:
+    '''
+    Pair equivalent markets of `a` and `b` (see module docstring).
+
+    pairs: curated {a_id: b_id} / [(a_id, b_id), ...]; matched first, whatever their text says
+    min_score: smallest token Jaccard accepted for a text match
+    close_tolerance: seconds the scheduled closes may differ by (None: don't compare closes)
+    auto: text-match what the explicit pairs didn't cover
+    '''
+
+    chosen = _explicit(a, b, pairs) if pairs else []
+    scores = [1.0] * len(chosen)
+
+    used_a = {i for i, _ in chosen}
+    used_b = {j for _, j in chosen}
+
+    if auto and len(a) and len(b):
+        candidates = _candidates(a, b, _documents(a), _documents(b), used_a, used_b, min_score, close_tolerance)
+
+        # Best score first; among equals the closest close times, then table order (deterministic)
+        candidates.sort(key=lambda c: (-c[0], c[1], c[2], c[3]))
+
+        for score, _, i, j in candidates:
+            if i in used_a or j in used_b:
+                continue
+
+            used_a.add(i)
+            used_b.add(j)
+            chosen.append((i, j))
+            scores.append(score)
+
+    rows_a = np.array([i for i, _ in chosen], dtype=np.int64)
+    rows_b = np.array([j for _, j in chosen], dtype=np.int64)
+
+    return MarketMatches(a_ids=a["market_id"][rows_a], b_ids=b["market_id"][rows_b],
+                         scores=np.array(scores, dtype=np.float64), a=a, b=b)
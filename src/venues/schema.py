@@ -0,0 +1,250 @@
+import numpy as np
+from pydantic import BaseModel
+from ..utils.time import iso_to_epoch
+
+'''
+One market schema for every venue
+
+VenueTable is a struct-of-arrays snapshot (like kalshi.MarketTable) holding only what cross-venue work needs,
+in the same units whatever the source:
+
+    venue               "kalshi" / "polymarket"
+    market_id           Kalshi ticker / Polymarket market id
+    event_id            Kalshi event_ticker / Polymarket parent event id ("" when unknown)
+    title, label        the question and the outcome it prices (Kalshi title + yes_sub_title,
+                        Polymarket question + groupItemTitle)
+    status              "open", "closed", "settled" or "unopened"
+    close_ts            scheduled close, int64 epoch seconds (utils.NO_TIME when missing)
+    yes_bid, yes_ask    best YES quotes in dollars per $1 contract (NaN when the book is empty on that side)
+    last_price          dollars
+    volume, liquidity   dollars as each venue reports them (Kalshi contracts pay $1, so contract counts are dollars
+                        of notional; Polymarket reports USDC)
+    token_id            what the venue's price history is keyed by (Kalshi: the ticker; Polymarket: the Yes token)
+
+Price history takes the other shared shape: the CANDLE_COLUMNS layout / technical_analysis.Data bars that
+KalshiClient.get_market_candle_sticks and PolymarketClient.get_price_history both return (as_columns / as_frame).
+'''
+
+KALSHI = "kalshi"
+POLYMARKET = "polymarket"
+
+STRING_COLUMNS = ("venue", "market_id", "event_id", "title", "label", "status", "token_id")
+FLOAT_COLUMNS = ("yes_bid", "yes_ask", "last_price", "volume", "liquidity")
+COLUMNS = ("venue", "market_id", "event_id", "title", "label", "status", "close_ts", *FLOAT_COLUMNS, "token_id")
+
+# Kalshi status -> normalized
+_KALSHI_STATUS = {"active": "open", "initialized": "unopened", "closed": "closed", "determined": "closed", "finalized": "settled", "settled": "settled"}
+
+
+class VenueMarket(BaseModel):
+    venue: str
+    market_id: str
+    event_id: str
+    title: str
+    label: str
+    status: str
+    close_ts: int
+    yes_bid: float
+    yes_ask: float
+    last_price: float
+    volume: float
+    liquidity: float
+    token_id: str
+
+    @property
+    def mid(self) -> float:
+        return (self.yes_bid + self.yes_ask) / 2
+
+
+def _strings(values) -> np.ndarray:
+    return np.array([value if value is not None else "" for value in values], dtype=object)
+
+
+def _floats(values) -> np.ndarray:
+    return np.array([value if value is not None else np.nan for value in values], dtype=np.float64)
+
+
+class VenueTable:
+    '''
+    Normalized markets from one or more venues.
+
+    table = VenueTable.concat([VenueTable.from_kalshi(kalshi.get_market_table()), polymarket.get_market_table()])
+    table["yes_ask"]                    # float64 dollars
+    table.select(table["venue"] == "kalshi")
+    table.market("KXHIGHNY-26FEB04-T70")   # VenueMarket
+    '''
+
+    def __init__(self, columns: dict[str, np.ndarray]):
+        n = len(columns["market_id"])
+
+        self.columns = {}
+
+        for name in COLUMNS:
+            values = columns[name]
+
+            if name == "close_ts":
+                values = np.asarray(values, dtype=np.int64)
+            elif name in FLOAT_COLUMNS:
+                values = np.asarray(values, dtype=np.float64)
+            else:
+                values = np.asarray(values, dtype=object)
+
+            if len(values) != n:
+                raise ValueError(f"column '{name}' has {len(values)} rows, expected {n}")
+
+            self.columns[name] = values
+
+        self._index: dict[str, int] | None = None
+
+    # --- CONSTRUCTION ---
+
+    @classmethod
+    def empty(cls) -> "VenueTable":
+        return cls({name: [] for name in COLUMNS})
+
+    @classmethod
+    def from_kalshi(cls, markets) -> "VenueTable":
+        '''From a kalshi MarketTable, MarketsResponse, list[Market] or raw market dicts; prices go cents -> dollars'''
+
+        from ..kalshi.models import MarketTable
+
+        table = markets
+        if not isinstance(table, MarketTable):
+            markets = list(getattr(markets, "markets", markets))
+            table = MarketTable.from_json(markets) if not markets or isinstance(markets[0], dict) else MarketTable.from_markets(markets)
+
+        n = len(table)
+        tickers = np.array(table.tickers, dtype=object)
+
+        # Kalshi quotes 0 for "no bid" and 100 for "no ask"
+        bid = table["yes_bid"].astype(np.float64)
+        ask = table["yes_ask"].astype(np.float64)
+        bid[bid <= 0] = np.nan
+        ask[ask >= 100] = np.nan
+
+        return cls({
+            "venue": np.full(n, KALSHI, dtype=object),
+            "market_id": tickers,
+            "event_id": table["event_ticker"],
+            "title": table["title"],
+            "label": table["yes_sub_title"],
+            "status": np.array([_KALSHI_STATUS.get(s, s) for s in table["status"]], dtype=object),
+            "close_ts": table.epoch("close_time"),
+            "yes_bid": bid / 100,
+            "yes_ask": ask / 100,
+            "last_price": table["last_price"] / 100,
+            "volume": table["volume"].astype(np.float64),
+            "liquidity": table["liquidity"] / 100,
+            "token_id": tickers,
+        })
+
+    @classmethod
+    def from_polymarket(cls, markets) -> "VenueTable":
+        '''From Gamma /markets pages (raw dicts, concatenated) or PolymarketMarkets'''
+
+        from ..kalshi.decode import loads
+
+        markets = list(markets)
+
+        if markets and not isinstance(markets[0], dict):
+            markets = [market.model_dump() for market in markets]
+
+        n = len(markets)
+        get = [m.get for m in markets]
+
+        active = np.array([bool(g("active")) for g in get], dtype=bool)
+        closed = np.array([bool(g("closed")) for g in get], dtype=bool)
+        status = np.where(closed, "closed", np.where(active, "open", "unopened")).astype(object)
+
+        # Gamma sends 0 / missing for an empty bid side and 1 for an empty ask side
+        bid = _floats(g("bestBid") for g in get)
+        ask = _floats(g("bestAsk") for g in get)
+        bid[bid <= 0] = np.nan
+        ask[ask >= 1] = np.nan
+
+        return cls({
+            "venue": np.full(n, POLYMARKET, dtype=object),
+            "market_id": _strings(str(g("id")) for g in get),
+            "event_id": _strings(str(m["events"][0]["id"]) if m.get("events") else "" for m in markets),
+            "title": _strings(g("question") for g in get),
+            "label": _strings(g("groupItemTitle") for g in get),
+            "status": status,
+            "close_ts": iso_to_epoch([g("endDate") for g in get]),
+            "yes_bid": bid,
+            "yes_ask": ask,
+            "last_price": _floats(g("lastTradePrice") for g in get),
+            "volume": _floats(g("volumeNum") for g in get),
+            "liquidity": _floats(g("liquidityNum") for g in get),
+            "token_id": _strings(_first_token(g("clobTokenIds"), loads) for g in get),
+        })
+
+    @classmethod
+    def concat(cls, tables: list["VenueTable"]) -> "VenueTable":
+        if not tables:
+            return cls.empty()
+
+        return cls({name: np.concatenate([table.columns[name] for table in tables]) for name in COLUMNS})
+
+    # --- ACCESS ---
+
+    def __len__(self):
+        return len(self.columns["market_id"])
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def __contains__(self, market_id: str) -> bool:
+        return market_id in self.index
+
+    @property
+    def index(self) -> dict[str, int]:
+        '''market_id -> row'''
+        if self._index is None:
+            self._index = {market_id: i for i, market_id in enumerate(self.columns["market_id"])}
+        return self._index
+
+    @property
+    def mid(self) -> np.ndarray:
+        return (self.columns["yes_bid"] + self.columns["yes_ask"]) / 2
+
+    def rows(self, market_ids) -> np.ndarray:
+        '''Row of each market id (-1 when missing)'''
+        index = self.index
+        return np.fromiter((index.get(market_id, -1) for market_id in market_ids), np.int64)
+
+    def row(self, i: int) -> dict:
+        return {name: values[i].item() if isinstance(values[i], np.generic) else values[i] for name, values in self.columns.items()}
+
+    def market(self, market_id_or_row: str | int) -> VenueMarket:
+        i = self.index[market_id_or_row] if isinstance(market_id_or_row, str) else market_id_or_row
+        return VenueMarket(**self.row(i))
+
+    def __iter__(self):
+        return (self.market(i) for i in range(len(self)))
+
+    # --- SLICING ---
+
+    def select(self, rows) -> "VenueTable":
+        '''Sub-table from a boolean mask or row indices'''
+
+        rows = np.flatnonzero(rows) if np.asarray(rows).dtype == bool else np.asarray(rows, dtype=np.int64)
+        return VenueTable({name: values[rows] for name, values in self.columns.items()})
+
+    def open(self) -> "VenueTable":
+        return self.select(self.columns["status"] == "open")
+
+    def to_frame(self, columns=None):
+        import pandas as pd   # Only loaded when a DataFrame is asked for
+
+        return pd.DataFrame({name: self.columns[name] for name in (columns or COLUMNS)})
+
+
+def _first_token(token_ids, loads) -> str:
+    # clobTokenIds is a JSON-encoded list on the wire, a list once someone has decoded it
+    if not token_ids:
+        return ""
+
+    if isinstance(token_ids, str):
+        token_ids = loads(token_ids)
+
+    return str(token_ids[0]) if token_ids else ""
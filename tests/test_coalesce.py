@@ -0,0 +1,199 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.kalshi import KalshiClient, AsyncKalshiClient
+from src.kalshi.coalesce import SingleFlight, AsyncSingleFlight
+from src.benchmarks.mock_server import MockKalshiServer
+
+'''
+Single-flight coalescing: N overlapping identical calls -> one underlying call, every caller gets its result
+'''
+
+CALLERS = 8
+
+
+def _wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+# --- SingleFlight ---
+
+def _parked_callers(flights: SingleFlight, fn, key="key") -> list:
+    '''Futures of CALLERS threads running flights.do(key, fn), released once all but the leader have joined'''
+
+    pool = ThreadPoolExecutor(max_workers=CALLERS)
+    futures = [pool.submit(flights.do, key, fn) for _ in range(CALLERS)]
+    pool.shutdown(wait=False)
+
+    return futures
+
+
+def test_single_flight_runs_overlapping_calls_once():
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return object()
+
+    futures = _parked_callers(flights, fn)
+    _wait_for(lambda: flights.shared == CALLERS - 1)
+    release.set()
+
+    results = [future.result(5) for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_single_flight_shares_the_exception():
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def fn():
+        release.wait(5)
+        raise ValueError("boom")
+
+    futures = _parked_callers(flights, fn)
+    _wait_for(lambda: flights.shared == CALLERS - 1)
+    release.set()
+
+    for future in futures:
+        with pytest.raises(ValueError, match="boom"):
+            future.result(5)
+
+
+def test_single_flight_frees_the_key_when_done():
+    flights = SingleFlight()
+    calls = []
+
+    assert flights.do("key", lambda: calls.append(1) or len(calls)) == 1
+    assert flights.do("key", lambda: calls.append(1) or len(calls)) == 2
+    assert flights.shared == 0
+
+
+def test_single_flight_keys_are_independent():
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def fn():
+        release.wait(5)
+        return threading.get_ident()
+
+    a = _parked_callers(flights, fn, "a")
+    b = _parked_callers(flights, fn, "b")
+    _wait_for(lambda: flights.shared == 2 * (CALLERS - 1))
+    release.set()
+
+    assert len({future.result(5) for future in a}) == 1
+    assert len({future.result(5) for future in b}) == 1
+    assert a[0].result() != b[0].result()
+
+
+# --- AsyncSingleFlight ---
+
+def test_async_single_flight_runs_overlapping_calls_once():
+
+    async def main():
+        flights = AsyncSingleFlight()
+        release = asyncio.Event()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await release.wait()
+            return object()
+
+        tasks = [asyncio.ensure_future(flights.do("key", fn)) for _ in range(CALLERS)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks)
+
+        assert len(calls) == 1
+        assert flights.shared == CALLERS - 1
+        assert all(result is results[0] for result in results)
+
+    asyncio.run(main())
+
+
+def test_async_single_flight_survives_a_cancelled_caller():
+
+    async def main():
+        flights = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fn():
+            await release.wait()
+            return "done"
+
+        leader = asyncio.ensure_future(flights.do("key", fn))
+        follower = asyncio.ensure_future(flights.do("key", fn))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == "done"
+        assert leader.cancelled()
+
+    asyncio.run(main())
+
+
+# --- THROUGH THE CLIENTS ---
+
+@pytest.fixture(scope="module")
+def server():
+    with MockKalshiServer(n_series=2, events_per_series=2, markets_per_event=2, seed=1, latency=0.2) as server:
+        yield server
+
+
+def test_client_coalesces_concurrent_identical_requests(server):
+    server.reset_stats()
+    ticker = server.events[0]["event_ticker"]
+    barrier = threading.Barrier(CALLERS)
+
+    def call(client):
+        barrier.wait(5)
+        return client.get_event(ticker)
+
+    with KalshiClient("key", base_url=server.url) as client, ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        results = list(pool.map(call, [client] * CALLERS))
+
+    assert server.stats()["requests"] == {"event": 1}
+    assert client._flights.shared == CALLERS - 1
+    assert all(result is results[0] for result in results)
+
+
+def test_client_without_coalescing_sends_every_request(server):
+    server.reset_stats()
+    ticker = server.events[0]["event_ticker"]
+
+    with KalshiClient("key", base_url=server.url, coalesce=False) as client, ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        list(pool.map(lambda _: client.get_event(ticker), range(CALLERS)))
+
+    assert server.stats()["requests"] == {"event": CALLERS}
+
+
+def test_async_client_coalesces_concurrent_identical_requests(server):
+    server.reset_stats()
+    ticker = server.events[0]["event_ticker"]
+
+    async def main():
+        async with AsyncKalshiClient("key", base_url=server.url) as client:
+            results = await asyncio.gather(*(client.get_event(ticker) for _ in range(CALLERS)))
+            return client, results
+
+    client, results = asyncio.run(main())
+
+    assert server.stats()["requests"] == {"event": 1}
+    assert client._flights.shared == CALLERS - 1
+    assert all(result is results[0] for result in results)
@@ -0,0 +1,112 @@
+import os
+import numpy as np
+import pytest
+from src.kalshi import KalshiClient, HttpTransport, KalshiHTTPError
+from src.polymarket import PolymarketClient
+from src.venues import VenueTable, match_markets
+from src.benchmarks.mock_server import MockKalshiServer
+from src.benchmarks.mock_polymarket import MockPolymarketServer
+from src.benchmarks.fixtures import RecordingTransport, FixtureServer, load_fixtures
+from src.benchmarks.cross_venue import _accuracy
+
+'''
+Record both venues against the mock servers, replay the recordings through FixtureServers, and check the
+cross-venue matcher and gap output come out identical (the cross_venue benchmark's checks, as tests).
+Histories go through as_columns so nothing here needs pandas.
+'''
+
+UNIVERSE = {"n_series": 4, "events_per_series": 5, "markets_per_event": 4, "seed": 1}
+HISTORIES = 8
+
+
+def _pass(kalshi: KalshiClient, polymarket: PolymarketClient) -> dict:
+    '''Pull, normalize, match, price the gaps and fetch the matched Yes-token histories'''
+
+    kalshi_venue = VenueTable.from_kalshi(kalshi.get_market_table(status=None))
+    polymarket_venue = polymarket.get_market_table()
+    matches = match_markets(kalshi_venue, polymarket_venue)
+
+    tokens = polymarket_venue["token_id"][polymarket_venue.rows(matches.b_ids[:HISTORIES])].tolist()
+    histories = [polymarket.get_price_history(token, fidelity=60, interval="1w", as_columns=True) for token in tokens]
+
+    return {"polymarket": polymarket_venue, "matches": matches, "gaps": matches.gaps(), "histories": histories}
+
+
+@pytest.fixture(scope="module")
+def runs(tmp_path_factory):
+    '''(live, replay, fixture servers) - the servers are stopped, but keep their `missing` lists'''
+
+    tmp = tmp_path_factory.mktemp("fixtures")
+
+    with MockKalshiServer(**UNIVERSE) as kalshi_server, MockPolymarketServer(**UNIVERSE, extra=20) as polymarket_server:
+        recorders = {
+            "kalshi": RecordingTransport(HttpTransport(base_url=kalshi_server.url)),
+            "gamma": RecordingTransport(HttpTransport(base_url=polymarket_server.url)),
+            "clob": RecordingTransport(HttpTransport(base_url=polymarket_server.url)),
+        }
+
+        with KalshiClient("key", transport=recorders["kalshi"]) as kalshi, \
+                PolymarketClient(gamma_transport=recorders["gamma"], clob_transport=recorders["clob"]) as polymarket:
+            live = _pass(kalshi, polymarket)
+
+    servers = {}
+    for name, recorder in recorders.items():
+        path = os.path.join(tmp, f"{name}.jsonl")
+        recorder.save(path)
+        recorder.close()
+        servers[name] = FixtureServer(load_fixtures(path))
+
+    with servers["kalshi"], servers["gamma"], servers["clob"], \
+            KalshiClient("key", base_url=servers["kalshi"].url) as kalshi, \
+            PolymarketClient(gamma_url=servers["gamma"].url, clob_url=servers["clob"].url) as polymarket:
+        replay = _pass(kalshi, polymarket)
+
+    return live, replay, servers
+
+
+def test_replay_asks_for_nothing_unrecorded(runs):
+    _, _, servers = runs
+
+    assert [key for server in servers.values() for key in server.missing] == []
+
+
+def test_replay_matches_live_pairs(runs):
+    live, replay, _ = runs
+
+    assert len(live["matches"]) > 0
+    assert replay["matches"].pairs() == live["matches"].pairs()
+
+
+def test_replay_matches_live_gaps(runs):
+    live, replay, _ = runs
+
+    assert live["gaps"].keys() == replay["gaps"].keys()
+
+    for name, values in live["gaps"].items():
+        np.testing.assert_array_equal(replay["gaps"][name], values, err_msg=name)
+
+
+def test_replay_matches_live_histories(runs):
+    live, replay, _ = runs
+
+    assert len(live["histories"]) == HISTORIES
+
+    for a, b in zip(live["histories"], replay["histories"]):
+        assert a.keys() == b.keys()
+        for name in a:
+            np.testing.assert_array_equal(b[name], a[name], err_msg=name)
+
+
+def test_matcher_finds_every_planted_twin(runs):
+    live, _, _ = runs
+
+    assert _accuracy(live["matches"], live["polymarket"]) == (1.0, 1.0)
+
+
+def test_unrecorded_request_is_a_404_listed_in_missing():
+
+    with FixtureServer([]) as server, KalshiClient("key", base_url=server.url) as kalshi:
+        with pytest.raises(KalshiHTTPError):
+            kalshi.get_series("NOPE")
+
+    assert [path for path, _ in server.missing] == ["/series/NOPE"]